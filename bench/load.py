@@ -0,0 +1,379 @@
+"""Load test for the quiz hot path: start, answer x N, leaderboard.
+
+Seeds a throwaway database with synthetic questions, players and completed
+quizzes, then runs simulated concurrent quiz takers against the app for a
+fixed time. Reports throughput, p50/p95/p99 latency and SQL statements per
+request for each endpoint (including the request's writes, which run on the
+writer thread), and writes the results as JSON so runs can be
+compared across commits. Latency is timed around the WSGI app, so it
+excludes client and socket overhead in --http mode.
+
+The seeded history goes into advanced_quiz_sessions, which replaced the
+old scores table.
+
+    python bench/load.py --sessions 1000000 --takers 8 --duration 30 --json results.json
+    python bench/load.py --http   # through a local threaded WSGI server instead of the test client
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates'))
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+CATEGORIES = ('General', 'Science', 'History', 'Geography', 'Art', 'Mathematics', 'Literature', 'Physics')
+
+def seed(path, questions, users, sessions):
+    """Bulk-load synthetic rows straight into a freshly migrated database"""
+    rng = random.Random(42)
+    conn = sqlite3.connect(path)
+    now = time.time()
+    stamp = lambda t: time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(t))
+
+    conn.executemany(
+        """INSERT INTO advanced_questions
+           (question, options, correct, difficulty, category, points, time_limit, is_active, created_at, updated_at)
+           VALUES (?, ?, ?, ?, ?, 10, 30, 1, ?, ?)""",
+        ((f"Synthetic question {i}?", '["a", "b", "c", "d"]', rng.randrange(4),
+          rng.choice(DIFFICULTIES), rng.choice(CATEGORIES), stamp(now), stamp(now))
+         for i in range(questions))
+    )
+    conn.executemany(
+        """INSERT INTO advanced_users
+           (username, is_active, total_quizzes, total_score, best_score, average_accuracy, total_time_spent,
+            streak_count, longest_streak, level, experience_points, created_at)
+           VALUES (?, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, ?)""",
+        ((f"player{i}", stamp(now)) for i in range(users))
+    )
+    start = now - 365 * 86400
+    step = 365 * 86400 / max(sessions, 1)
+
+    def session_rows():
+        for i in range(sessions):
+            score = rng.randint(0, 10)
+            completed = start + i * step
+            yield (rng.randrange(users) + 1, f"bench-{i}", rng.choice(DIFFICULTIES), 'all', 10, score, 10,
+                   score * 10.0, rng.randint(20, 300), stamp(completed - 60), stamp(completed))
+
+    conn.executemany(
+        """INSERT INTO advanced_quiz_sessions
+           (user_id, session_token, difficulty, category, total_questions, score, total_possible, accuracy,
+            time_taken, streak_count, started_at, completed_at, is_completed)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, 1)""",
+        session_rows()
+    )
+    # Bring the per-user aggregates and dashboard counters in line with the seeded history
+    conn.execute("""
+        UPDATE advanced_users SET
+            total_quizzes = s.quizzes, total_score = s.total, best_score = s.best,
+            average_accuracy = s.accuracy, last_activity = s.last
+        FROM (SELECT user_id, COUNT(*) AS quizzes, SUM(score) AS total, MAX(score) AS best,
+                     AVG(accuracy) AS accuracy, MAX(completed_at) AS last
+              FROM advanced_quiz_sessions GROUP BY user_id) AS s
+        WHERE s.user_id = advanced_users.id
+    """)
+    conn.execute("""
+        UPDATE stats_counters SET value = CASE name
+            WHEN 'questions' THEN (SELECT COUNT(*) FROM advanced_questions)
+            WHEN 'players' THEN (SELECT COUNT(*) FROM advanced_users)
+            WHEN 'quizzes' THEN (SELECT COUNT(*) FROM advanced_quiz_sessions)
+            WHEN 'accuracy_sum' THEN (SELECT COALESCE(SUM(accuracy), 0) FROM advanced_quiz_sessions)
+            WHEN 'accuracy_count' THEN (SELECT COUNT(*) FROM advanced_quiz_sessions)
+            ELSE value
+        END
+    """)
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+class Recorder:
+    """Latencies and SQL statement counts per endpoint, shared by all takers"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)  # endpoint -> seconds
+        self.statements = defaultdict(int)  # endpoint -> SQL statements run
+        self.errors = defaultdict(int)
+
+    def add(self, endpoint, seconds, statements, ok):
+        with self._lock:
+            self.latencies[endpoint].append(seconds)
+            self.statements[endpoint] += statements
+            if not ok:
+                self.errors[endpoint] += 1
+
+class StatementCounter:
+    """Counts SQL statements per request, including its writes on the writer thread.
+
+    Each thread counts into its current tally. While the writer thread runs
+    an operation it counts into the tally of the request that submitted it;
+    the group commit's own BEGIN/SAVEPOINT/COMMIT are shared and not counted.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def tally(self):
+        tally = getattr(self._local, 'tally', None)
+        if tally is None:
+            tally = self._local.tally = [0]
+        return tally
+
+    def trace(self, statement):
+        # Statements run by triggers are reported with a leading "--"
+        if not statement.startswith('--'):
+            self.tally()[0] += 1
+
+    def reset(self):
+        self._local.tally = [0]
+
+    def take(self):
+        count = self.tally()[0]
+        self.reset()
+        return count
+
+    def counted(self, operation):
+        """Wrap a writer operation to count into the calling request's tally"""
+        tally = self.tally()
+
+        def run(cur, *args, **kwargs):
+            own = self.tally()
+            self._local.tally = tally
+            try:
+                return operation(cur, *args, **kwargs)
+            finally:
+                self._local.tally = own
+        return run
+
+def instrument(appmod, counter, recorder):
+    """Trace SQL on every pooled connection and the writer's, and time each request inside the app"""
+    import writer as writer_module
+    pool = appmod.pool
+    acquire = pool.acquire
+    open_connection = writer_module.open_connection
+
+    def trace(statement):
+        appmod.metrics.trace(statement)
+        counter.trace(statement)
+
+    def traced_acquire():
+        conn = acquire()
+        # Keep feeding the app's own SQL metrics alongside the per-request count
+        conn.set_trace_callback(trace)
+        return conn
+    pool.acquire = traced_acquire
+
+    def traced_open(*args, **kwargs):
+        conn = open_connection(*args, **kwargs)
+        conn.set_trace_callback(trace)
+        return conn
+    writer_module.open_connection = traced_open
+
+    # Restart the writer on a traced connection; its operations count towards
+    # the request that submitted them
+    writer = appmod.writer
+    writer.stop()
+    writer.start()
+    submit = writer.submit
+    writer.submit = lambda operation, *args, **kwargs: submit(counter.counted(operation), *args, **kwargs)
+
+    wsgi_app = appmod.app.wsgi_app
+
+    def timed_app(environ, start_response):
+        counter.reset()
+        endpoint = environ['PATH_INFO']
+        started = time.perf_counter()
+        status = []
+
+        def capture(code, headers, exc_info=None):
+            status.append(code)
+            return start_response(code, headers, exc_info)
+        body = b''.join(wsgi_app(environ, capture))
+        recorder.add(endpoint, time.perf_counter() - started, counter.take(), status[0][:1] in '23')
+        return [body]
+    appmod.app.wsgi_app = timed_app
+
+class TestClientTaker:
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def post(self, path, payload):
+        return self.client.post(path, json=payload).get_json()
+
+    def get(self, path):
+        return self.client.get(path).get_json()
+
+class HTTPTaker:
+    """Minimal keep-alive HTTP client that carries the Flask session cookie"""
+
+    def __init__(self, port):
+        self.conn = http.client.HTTPConnection('127.0.0.1', port)
+        self.cookie = None
+
+    def request(self, method, path, payload=None):
+        headers = {'Content-Type': 'application/json'}
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        body = json.dumps(payload) if payload is not None else None
+        self.conn.request(method, path, body=body, headers=headers)
+        response = self.conn.getresponse()
+        data = response.read()
+        cookie = response.getheader('Set-Cookie')
+        if cookie:
+            self.cookie = cookie.split(';', 1)[0]
+        return json.loads(data) if data else None
+
+    def post(self, path, payload):
+        return self.request('POST', path, payload)
+
+    def get(self, path):
+        return self.request('GET', path)
+
+def take_quizzes(taker, number, deadline, answers_per_quiz):
+    rng = random.Random(number)
+    quizzes = 0
+    while time.perf_counter() < deadline:
+        taker.post('/api/quiz/start', {
+            'username': f"loadtest{number}",
+            'difficulty': rng.choice(DIFFICULTIES),
+            'category': rng.choice(('all',) + CATEGORIES[:3])
+        })
+        for _ in range(answers_per_quiz):
+            result = taker.post('/api/quiz/answer', {'answer': rng.randrange(4)})
+            if not result or result.get('is_completed') or 'error' in result:
+                break
+        taker.get(f"/api/leaderboard?difficulty={rng.choice(('all',) + DIFFICULTIES)}")
+        quizzes += 1
+    return quizzes
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def summarize(recorder, elapsed):
+    endpoints = {}
+    for endpoint, latencies in sorted(recorder.latencies.items()):
+        latencies = sorted(latencies)
+        endpoints[endpoint] = {
+            'requests': len(latencies),
+            'errors': recorder.errors[endpoint],
+            'throughput_rps': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+            'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+            'sql_per_request': round(recorder.statements[endpoint] / len(latencies), 2)
+        }
+    return endpoints
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--questions', type=int, default=5000)
+    parser.add_argument('--users', type=int, default=20000)
+    parser.add_argument('--sessions', type=int, default=1000000, help="completed quizzes to seed")
+    parser.add_argument('--takers', type=int, default=8, help="concurrent simulated quiz takers")
+    parser.add_argument('--duration', type=float, default=20, help="seconds of load")
+    parser.add_argument('--answers', type=int, default=10, help="answers submitted per quiz")
+    parser.add_argument('--http', action='store_true', help="go through a local threaded WSGI server")
+    parser.add_argument('--json', help="write the results to this file as well as stdout")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Point the app's database and event log into the scratch directory
+        os.environ['QUIZ_DB'] = os.path.join(tmp, 'quiz.db')
+        os.environ['QUIZ_EVENT_LOG'] = os.path.join(tmp, 'logs', 'events.jsonl')
+        import database
+        database.create_schema()
+        print(f"Seeding {args.questions:,} questions, {args.users:,} players, {args.sessions:,} quizzes...")
+        started = time.perf_counter()
+        seed(database.DB, args.questions, args.users, args.sessions)
+        seed_time = time.perf_counter() - started
+
+        import app as appmod
+        started = time.perf_counter()
+        appmod.create_app()
+        startup_time = time.perf_counter() - started
+
+        recorder = Recorder()
+        instrument(appmod, StatementCounter(), recorder)
+
+        server = None
+        if args.http:
+            from werkzeug.serving import WSGIRequestHandler, make_server
+
+            class QuietHandler(WSGIRequestHandler):
+                def log_request(self, *args, **kwargs):
+                    pass
+            server = make_server('127.0.0.1', 0, appmod.app, threaded=True, request_handler=QuietHandler)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            make_taker = lambda: HTTPTaker(server.server_port)
+        else:
+            make_taker = lambda: TestClientTaker(appmod.app)
+
+        print(f"Running {args.takers} takers for {args.duration:g}s ({'http' if args.http else 'test client'})...")
+        quizzes = [0] * args.takers
+        deadline = time.perf_counter() + args.duration
+        started = time.perf_counter()
+
+        def run(number):
+            quizzes[number] = take_quizzes(make_taker(), number, deadline, args.answers)
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(args.takers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        if server:
+            server.shutdown()
+        appmod.writer.stop()
+        write_batches = appmod.metrics.write_batches
+        appmod.event_log.flush()
+        appmod.pool.close_all()
+
+    results = {
+        'commit': git_commit(),
+        'config': vars(args),
+        'seed_seconds': round(seed_time, 2),
+        'startup_seconds': round(startup_time, 3),
+        'elapsed_seconds': round(elapsed, 2),
+        'quizzes_completed': sum(quizzes),
+        'endpoints': summarize(recorder, elapsed),
+        # sql_per_request includes each request's writes on the writer thread,
+        # but not the BEGIN/SAVEPOINT/COMMIT around them, which batches share
+        'group_commits': {
+            'batches': write_batches.count,
+            'operations': int(write_batches.sum),
+            'operations_per_batch': round(write_batches.sum / write_batches.count, 2) if write_batches.count else 0
+        }
+    }
+
+    print(f"\n{'endpoint':<20}{'requests':>10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'sql/req':>9}{'errors':>8}")
+    for endpoint, stats in results['endpoints'].items():
+        print(f"{endpoint:<20}{stats['requests']:>10}{stats['throughput_rps']:>10}{stats['p50_ms']:>10}"
+              f"{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['sql_per_request']:>9}{stats['errors']:>8}")
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
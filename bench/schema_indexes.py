@@ -0,0 +1,105 @@
+"""Before/after timings for the read indexes the migrations create.
+
+Builds a throwaway database at the current schema, seeds the advanced_*
+tables with synthetic questions, players and completed quizzes (the same
+data as bench/load.py), then times the app's hot read queries with the
+migration-created `idx_*` indexes dropped, and again once they are
+recreated (plus ANALYZE). Unique indexes are constraints, not read paths,
+and stay in place, as do the ORM's own `ix_*` indexes.
+
+    python bench/schema_indexes.py --sessions 1000000
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates'))
+
+from load import seed
+from pagination import like_prefix
+from repository import SELECT_TOP_SCORES, SELECT_TOP_SCORES_BY_DIFFICULTY, SELECT_RECENT_SCORES
+
+PAGE = 50
+
+QUERIES = {
+    'leaderboard (all)': (SELECT_TOP_SCORES, (10,)),
+    'leaderboard (hard)': (SELECT_TOP_SCORES_BY_DIFFICULTY, ('hard', 10)),
+    'recent activity': (SELECT_RECENT_SCORES, (5,)),
+    'player history': (
+        "SELECT id, score, completed_at FROM advanced_quiz_sessions "
+        "WHERE user_id = ? ORDER BY completed_at DESC LIMIT 10", (42,)),
+    'export last 7 days': (
+        "SELECT COUNT(*) FROM advanced_quiz_sessions WHERE completed_at >= DATETIME('now', '-7 days')", ()),
+    'users by best score': (
+        "SELECT id, username, total_quizzes, best_score, average_accuracy, last_activity "
+        "FROM advanced_users ORDER BY best_score DESC, id DESC LIMIT ?", (PAGE,)),
+    'questions by difficulty': (
+        "SELECT id, question, difficulty FROM advanced_questions "
+        "WHERE difficulty = ? ORDER BY id DESC LIMIT ?", ('hard', PAGE)),
+    'questions by text prefix': (
+        "SELECT id, question FROM advanced_questions "
+        "WHERE question LIKE ? ESCAPE '\\' ORDER BY id DESC LIMIT ?", (like_prefix('synthetic question 123'), PAGE)),
+}
+
+def read_indexes(conn):
+    """(name, CREATE INDEX statement) of every non-unique index the migrations created"""
+    return conn.execute("""
+        SELECT name, sql FROM sqlite_master
+        WHERE type = 'index' AND name LIKE 'idx\\_%' ESCAPE '\\' AND sql NOT LIKE 'CREATE UNIQUE%'
+        ORDER BY name
+    """).fetchall()
+
+def time_queries(conn, repeat):
+    results = {}
+    for name, (sql, params) in QUERIES.items():
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            best = min(best, time.perf_counter() - started)
+        results[name] = best * 1000
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--questions', type=int, default=20000)
+    parser.add_argument('--users', type=int, default=50000)
+    parser.add_argument('--sessions', type=int, default=1000000, help="completed quizzes to seed")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.db')
+        os.environ['QUIZ_DB'] = path
+        import database
+        database.create_schema()
+        print(f"Seeding {args.sessions:,} completed quizzes...")
+        seed(path, args.questions, args.users, args.sessions)
+
+        conn = sqlite3.connect(path)
+        indexes = read_indexes(conn)
+        for name, _ in indexes:
+            conn.execute(f"DROP INDEX {name}")
+        conn.execute("ANALYZE")
+        before = time_queries(conn, args.repeat)
+
+        started = time.perf_counter()
+        for _, sql in indexes:
+            conn.execute(sql)
+        conn.execute("ANALYZE")
+        index_time = time.perf_counter() - started
+        after = time_queries(conn, args.repeat)
+        conn.close()
+
+    print(f"\nRecreating {len(indexes)} indexes + ANALYZE: {index_time:.2f}s")
+    print(', '.join(name for name, _ in indexes) + '\n')
+    print(f"{'query':<28}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name in QUERIES:
+        speedup = before[name] / after[name] if after[name] else float('inf')
+        print(f"{name:<28}{before[name]:>12.2f}{after[name]:>12.2f}{speedup:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
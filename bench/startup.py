@@ -0,0 +1,89 @@
+"""Worker startup time and memory: import-time setup vs. the app factory.
+
+Each sample is a fresh interpreter, as a pre-fork server would start it:
+
+  eager    the old import path - create_all, migrations and seeding on every
+           start, with SQLAlchemy loaded into the worker
+  factory  `create_app()` - a schema version check and the index loads
+
+Both run against a database already set up by `manage.py init`.
+
+    python bench/startup.py --runs 10
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+TEMPLATES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'templates')
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+{setup}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    'seconds': elapsed,
+    'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'sqlalchemy': 'sqlalchemy' in sys.modules
+}}))
+"""
+
+MODES = {
+    'eager': """
+import database
+database.init_db()
+database.create_sample_questions()
+import app
+app.create_app()
+""",
+    'factory': """
+import app
+app.create_app()
+""",
+}
+
+def environment(workdir):
+    return dict(
+        os.environ,
+        PYTHONPATH=os.path.abspath(TEMPLATES),
+        QUIZ_DB=os.path.join(workdir, 'quiz.db'),
+        QUIZ_EVENT_LOG=os.path.join(workdir, 'logs', 'events.jsonl')
+    )
+
+def sample(mode, workdir):
+    env = environment(workdir)
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(setup=MODES[mode])],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    try:
+        subprocess.run(
+            [sys.executable, os.path.join(TEMPLATES, 'manage.py'), 'init'],
+            cwd=workdir, env=environment(workdir), capture_output=True, check=True
+        )
+        results = {mode: [sample(mode, workdir) for _ in range(args.runs)] for mode in MODES}
+    finally:
+        shutil.rmtree(workdir)
+
+    print(f"{'mode':<10}{'median ms':>12}{'max ms':>10}{'max RSS MB':>12}{'sqlalchemy':>12}")
+    for mode, runs in results.items():
+        times = [run['seconds'] * 1000 for run in runs]
+        rss = max(run['max_rss_kb'] for run in runs) / 1024
+        print(f"{mode:<10}{statistics.median(times):>12.1f}{max(times):>10.1f}{rss:>12.1f}"
+              f"{str(runs[0]['sqlalchemy']):>12}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+        // Advanced Certificate Data System
+        let certificateData = {
+            username: 'Student',
+            score: 0,
+            total: 10,
+            accuracy: 0,
+            difficulty: 'Easy',
+            time: 0,
+            grade: '-',
+            certificateId: '',
+            issueDate: new Date(),
+            verificationUrl: '',
+            organization: {
+                name: 'QuizVerse',
+                logo: '🏆',
+                website: 'quizverse.com',
+                address: 'Global Learning Platform'
+            },
+            instructor: {
+                name: 'Quiz Master',
+                title: 'Authorized Signatory',
+                id: 'QM-2026-001'
+            }
+        };
+
+        // Initialize Certificate with Advanced Features
+        function initializeCertificate() {
+            showLoading(true);
+
+            try {
+                // Get data from multiple sources
+                const urlParams = new URLSearchParams(window.location.search);
+                const savedData = localStorage.getItem('certificateData');
+                const lastResults = localStorage.getItem('lastQuizResults');
+
+                // Priority: URL params > saved data > last results > default
+                if (urlParams.has('username')) {
+                    loadFromURL(urlParams);
+                } else if (savedData) {
+                    certificateData = { ...certificateData, ...JSON.parse(savedData) };
+                } else if (lastResults) {
+                    loadFromResults(JSON.parse(lastResults));
+                }
+
+                // Generate advanced certificate features
+                generateCertificateId();
+                generateVerificationUrl();
+                calculateGrade();
+
+                // Update display
+                updateCertificateDisplay();
+                generateQRCode();
+
+                // Store for verification
+                saveCertificateData();
+
+            } catch (error) {
+                console.error('Error initializing certificate:', error);
+                showNotification('Error loading certificate data', 'error');
+            } finally {
+                showLoading(false);
+            }
+        }
+
+        function loadFromURL(urlParams) {
+            certificateData.username = urlParams.get('username') || 'Student';
+            certificateData.score = parseInt(urlParams.get('score')) || 0;
+            certificateData.total = parseInt(urlParams.get('total')) || 10;
+            certificateData.accuracy = parseInt(urlParams.get('accuracy')) || 0;
+            certificateData.difficulty = urlParams.get('difficulty') || 'Easy';
+            certificateData.time = parseInt(urlParams.get('time')) || 0;
+        }
+
+        function loadFromResults(results) {
+            certificateData = {
+                ...certificateData,
+                username: results.username || 'Student',
+                score: results.score || 0,
+                total: results.total || 10,
+                accuracy: results.accuracy || 0,
+                difficulty: results.difficulty || 'Easy',
+                time: results.time || 0
+            };
+        }
+
+        function generateCertificateId() {
+            const timestamp = Date.now();
+            const random = Math.floor(Math.random() * 10000).toString().padStart(4, '0');
+            certificateData.certificateId = `QV-${new Date().getFullYear()}-${random}`;
+        }
+
+        function generateVerificationUrl() {
+            const baseUrl = window.location.origin;
+            certificateData.verificationUrl = `${baseUrl}/verify?id=${certificateData.certificateId}`;
+        }
+
+        function calculateGrade() {
+            const accuracy = certificateData.accuracy;
+            if (accuracy === 100) certificateData.grade = 'A+';
+            else if (accuracy >= 90) certificateData.grade = 'A';
+            else if (accuracy >= 80) certificateData.grade = 'B+';
+            else if (accuracy >= 70) certificateData.grade = 'B';
+            else if (accuracy >= 60) certificateData.grade = 'C';
+            else certificateData.grade = 'D';
+        }
+
+        function updateCertificateDisplay() {
+            // Update basic info
+            document.getElementById('userName').textContent = certificateData.username.toUpperCase();
+            document.getElementById('recipientName').textContent = certificateData.username.toUpperCase();
+            document.getElementById('scoreDisplay').textContent = `${certificateData.score}/${certificateData.total}`;
+            document.getElementById('accuracyDisplay').textContent = `${certificateData.accuracy}%`;
+            document.getElementById('difficultyDisplay').textContent = certificateData.difficulty.charAt(0).toUpperCase() + certificateData.difficulty.slice(1);
+            document.getElementById('timeDisplay').textContent = `${certificateData.time}s`;
+            document.getElementById('gradeDisplay').textContent = certificateData.grade;
+
+            // Update security features
+            document.getElementById('certificateId').textContent = certificateData.certificateId;
+            document.getElementById('dateOfIssue').textContent = certificateData.issueDate.toLocaleDateString('en-US', {
+                year: 'numeric',
+                month: 'long',
+                day: 'numeric'
+            });
+            document.getElementById('issueDateTime').textContent = certificateData.issueDate.toLocaleString('en-US', {
+                year: 'numeric',
+                month: 'short',
+                day: 'numeric',
+                hour: '2-digit',
+                minute: '2-digit'
+            });
+
+            // Update achievement statement based on performance
+            const achievementStatement = document.getElementById('achievementStatement');
+            if (certificateData.accuracy === 100) {
+                achievementStatement.textContent = 'QuizVerse Challenge with PERFECT SCORE - Outstanding Achievement!';
+            } else if (certificateData.accuracy >= 90) {
+                achievementStatement.textContent = 'QuizVerse Challenge with EXCELLENCE - Top Performer!';
+            } else if (certificateData.accuracy >= 80) {
+                achievementStatement.textContent = 'QuizVerse Challenge with DISTINCTION - High Achiever!';
+            } else if (certificateData.accuracy >= 70) {
+                achievementStatement.textContent = 'QuizVerse Challenge with MERIT - Good Performance!';
+            } else {
+                achievementStatement.textContent = 'QuizVerse Challenge - Successfully Completed!';
+            }
+        }
+
+        function generateQRCode() {
+            const qrContainer = document.getElementById('qrCode');
+            qrContainer.innerHTML = ''; // Clear previous QR code
+
+            new QRCode(qrContainer, {
+                text: certificateData.verificationUrl,
+                width: 80,
+                height: 80,
+                colorDark: '#1a202c',
+                colorLight: '#ffffff',
+                correctLevel: QRCode.CorrectLevel.H
+            });
+        }
+
+        function saveCertificateData() {
+            // Save to localStorage for verification
+            localStorage.setItem(`cert_${certificateData.certificateId}`, JSON.stringify(certificateData));
+            localStorage.setItem('certificateData', JSON.stringify(certificateData));
+        }
+
+        // Advanced Action Functions
+        function downloadAsPDF() {
+            showLoading(true);
+
+            const element = document.querySelector('.certificate-wrapper');
+            const opt = {
+                margin: 10,
+                filename: `QuizVerse_Certificate_${certificateData.username}_${certificateData.certificateId}.pdf`,
+                image: { type: 'jpeg', quality: 0.98 },
+                html2canvas: { 
+                    scale: 2,
+                    useCORS: true,
+                    logging: false
+                },
+                jsPDF: { 
+                    unit: 'mm', 
+                    format: 'a4', 
+                    orientation: 'landscape'
+                },
+                pagebreak: { mode: 'avoid-all' }
+            };
+
+            html2pdf().set(opt).from(element).save().then(() => {
+                showLoading(false);
+                showNotification('Certificate downloaded successfully!', 'success');
+            }).catch(error => {
+                showLoading(false);
+                showNotification('Error downloading PDF', 'error');
+                console.error('PDF generation error:', error);
+            });
+        }
+
+        function printCertificate() {
+            window.print();
+            showNotification('Print dialog opened', 'info');
+        }
+
+        function shareCertificate() {
+            const shareText = `🏆 I earned a certificate from QuizVerse! 
+Score: ${certificateData.score}/${certificateData.total} (${certificateData.accuracy}%)
+Certificate ID: ${certificateData.certificateId}
+Verify: ${certificateData.verificationUrl}`;
+
+            if (navigator.share) {
+                navigator.share({
+                    title: 'QuizVerse Certificate of Achievement',
+                    text: shareText,
+                    url: certificateData.verificationUrl
+                }).then(() => {
+                    showNotification('Certificate shared successfully!', 'success');
+                }).catch(error => {
+                    console.log('Share cancelled');
+                });
+            } else {
+                // Fallback: copy to clipboard
+                navigator.clipboard.writeText(shareText).then(() => {
+                    showNotification('Certificate details copied to clipboard!', 'success');
+                });
+            }
+        }
+
+        function verifyCertificate() {
+            window.open(certificateData.verificationUrl, '_blank');
+        }
+
+        // Utility Functions
+        function showLoading(show) {
+            const overlay = document.getElementById('loadingOverlay');
+            overlay.style.display = show ? 'flex' : 'none';
+        }
+
+        function showNotification(message, type = 'info') {
+            const notification = document.createElement('div');
+            notification.className = `alert alert-${type === 'error' ? 'danger' : type} position-fixed top-0 start-50 translate-middle-x mt-3`;
+            notification.style.zIndex = '10000';
+            notification.style.minWidth = '300px';
+            notification.innerHTML = `
+                <div class="d-flex align-items-center">
+                    <i class="bi bi-${type === 'success' ? 'check-circle' : type === 'error' ? 'exclamation-triangle' : 'info-circle'} me-2"></i>
+                    ${message}
+                </div>
+            `;
+            document.body.appendChild(notification);
+
+            setTimeout(() => {
+                notification.style.opacity = '0';
+                notification.style.transition = 'opacity 0.3s ease';
+                setTimeout(() => notification.remove(), 300);
+            }, 4000);
+        }
+
+        // Initialize when DOM is loaded
+        document.addEventListener('DOMContentLoaded', () => {
+            initializeCertificate();
+            generateParticles();
+        });
+
+        // Generate animated particles
+        function generateParticles() {
+            const particlesContainer = document.getElementById('particles');
+            const particleCount = 50;
+
+            for (let i = 0; i < particleCount; i++) {
+                const particle = document.createElement('div');
+                particle.className = 'particle';
+                particle.style.left = Math.random() * 100 + '%';
+                particle.style.animationDelay = Math.random() * 20 + 's';
+                particle.style.animationDuration = (15 + Math.random() * 10) + 's';
+
+                // Random colors
+                const colors = ['var(--primary-gold)', 'var(--neon-purple)', 'var(--neon-pink)', 'var(--neon-blue)'];
+                particle.style.background = colors[Math.floor(Math.random() * colors.length)];
+
+                particlesContainer.appendChild(particle);
+            }
+        }
+
+        // Add keyboard shortcuts
+        document.addEventListener('keydown', (e) => {
+            if (e.ctrlKey || e.metaKey) {
+                switch(e.key) {
+                    case 'p':
+                        e.preventDefault();
+                        printCertificate();
+                        break;
+                    case 's':
+                        e.preventDefault();
+                        downloadAsPDF();
+                        break;
+                }
+            }
+        });
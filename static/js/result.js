@@ -0,0 +1,354 @@
+// Game Results Data
+let results = {
+    score: 0,
+    total: 0,
+    correct: 0,
+    wrong: 0,
+    time: 0,
+    accuracy: 0,
+    difficulty: 'easy',
+    username: 'Player',
+    streak: 0,
+    category: 'Mixed'
+};
+
+// Achievements Data
+const achievements = [
+    { id: 'perfect', icon: '🏆', name: 'Perfect Score', condition: (r) => r.accuracy === 100 },
+    { id: 'excellent', icon: '⭐', name: 'Excellent', condition: (r) => r.accuracy >= 90 },
+    { id: 'good', icon: '👍', name: 'Good Job', condition: (r) => r.accuracy >= 70 },
+    { id: 'fast', icon: '⚡', name: 'Speed Demon', condition: (r) => r.time < 30 },
+    { id: 'streak', icon: '🔥', name: 'On Fire', condition: (r) => r.streak >= 5 },
+    { id: 'first', icon: '🎯', name: 'First Try', condition: (r) => r.total === r.correct },
+    { id: 'survivor', icon: '💪', name: 'Survivor', condition: (r) => r.lives > 0 },
+    { id: 'persistent', icon: '🚀', name: 'Persistent', condition: (r) => r.total >= 10 }
+];
+
+// Initialize
+window.onload = () => {
+    loadResults();
+    calculateMetrics();
+    displayResults();
+    checkAchievements();
+    loadLeaderboard();
+    createConfetti();
+    loadTheme();
+    animateCharts();
+};
+
+function loadResults() {
+    // Get results from URL parameters or localStorage
+    const urlParams = new URLSearchParams(window.location.search);
+    const savedResults = localStorage.getItem('lastQuizResults');
+
+    if (urlParams.has('score') && urlParams.has('total')) {
+        results.score = parseInt(urlParams.get('score')) || 0;
+        results.total = parseInt(urlParams.get('total')) || 10;
+        results.time = parseInt(urlParams.get('time')) || 0;
+        results.difficulty = urlParams.get('difficulty') || 'easy';
+        results.username = urlParams.get('username') || 'Player';
+    } else if (savedResults) {
+        const data = JSON.parse(savedResults);
+        results = { ...results, ...data };
+    } else {
+        // Default results for demo
+        results = {
+            score: 8,
+            total: 10,
+            correct: 8,
+            wrong: 2,
+            time: 45,
+            accuracy: 80,
+            difficulty: 'medium',
+            username: 'Player',
+            streak: 3,
+            category: 'Mixed'
+        };
+    }
+
+    results.correct = results.score;
+    results.wrong = results.total - results.score;
+    results.accuracy = Math.round((results.correct / results.total) * 100);
+}
+
+function calculateMetrics() {
+    // Calculate additional metrics
+    const avgTimePerQuestion = results.time / results.total;
+    const speedScore = Math.max(0, 100 - (avgTimePerQuestion * 2));
+    const consistencyScore = results.streak > 0 ? Math.min(100, (results.streak / results.correct) * 100) : 0;
+
+    results.speedScore = Math.round(speedScore);
+    results.consistencyScore = Math.round(consistencyScore);
+    results.avgTimePerQuestion = Math.round(avgTimePerQuestion);
+}
+
+function displayResults() {
+    // Update score display
+    const scoreCircle = document.getElementById('scoreCircle');
+    const scoreText = document.getElementById('scoreText');
+    const performanceTitle = document.getElementById('performanceTitle');
+    const performanceMessage = document.getElementById('performanceMessage');
+
+    scoreText.textContent = `${results.accuracy}%`;
+
+    // Update score circle color based on performance
+    scoreCircle.className = 'score-circle';
+    if (results.accuracy === 100) {
+        scoreCircle.classList.add('excellent');
+        performanceTitle.textContent = 'Perfect Score! 🎉';
+        performanceMessage.textContent = 'Outstanding! You got every question right!';
+    } else if (results.accuracy >= 90) {
+        scoreCircle.classList.add('excellent');
+        performanceTitle.textContent = 'Excellent! 🌟';
+        performanceMessage.textContent = 'Amazing performance! You\'re a quiz master!';
+    } else if (results.accuracy >= 70) {
+        scoreCircle.classList.add('good');
+        performanceTitle.textContent = 'Great Job! 👏';
+        performanceMessage.textContent = 'Well done! You did really well!';
+    } else if (results.accuracy >= 50) {
+        scoreCircle.classList.add('average');
+        performanceTitle.textContent = 'Good Effort! 💪';
+        performanceMessage.textContent = 'Nice try! Keep practicing to improve!';
+    } else {
+        scoreCircle.classList.add('poor');
+        performanceTitle.textContent = 'Keep Trying! 📚';
+        performanceMessage.textContent = 'Don\'t give up! Practice makes perfect!';
+    }
+
+    // Update stats
+    document.getElementById('correctCount').textContent = results.correct;
+    document.getElementById('wrongCount').textContent = results.wrong;
+    document.getElementById('timeTaken').textContent = `${results.time}s`;
+    document.getElementById('streakCount').textContent = results.streak;
+}
+
+function checkAchievements() {
+    const achievementGrid = document.getElementById('achievementGrid');
+    achievementGrid.innerHTML = '';
+
+    achievements.forEach(achievement => {
+        const isUnlocked = achievement.condition(results);
+        const badge = document.createElement('div');
+        badge.className = `achievement-badge ${isUnlocked ? 'unlocked' : 'locked'}`;
+        badge.innerHTML = achievement.icon;
+        badge.title = achievement.name;
+
+        if (isUnlocked) {
+            badge.onclick = () => showAchievementDetails(achievement);
+        }
+
+        achievementGrid.appendChild(badge);
+    });
+}
+
+function showAchievementDetails(achievement) {
+    // Create a simple notification for achievement details
+    const notification = document.createElement('div');
+    notification.className = 'alert alert-success position-fixed top-0 start-50 translate-middle-x mt-3';
+    notification.style.zIndex = '9999';
+    notification.innerHTML = `
+        <strong>${achievement.icon} ${achievement.name}</strong><br>
+        <small>Achievement Unlocked!</small>
+    `;
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.remove();
+    }, 3000);
+}
+
+function loadLeaderboard() {
+    const leaderboardBody = document.getElementById('leaderboardBody');
+    const scores = JSON.parse(localStorage.getItem('quizScores') || '[]');
+
+    // Sort scores by accuracy and then by time
+    scores.sort((a, b) => {
+        if (b.percentage !== a.percentage) {
+            return b.percentage - a.percentage;
+        }
+        return a.time - b.time;
+    });
+
+    // Get top 5 scores
+    const topScores = scores.slice(0, 5);
+
+    leaderboardBody.innerHTML = '';
+    topScores.forEach((score, index) => {
+        const row = document.createElement('tr');
+        const rankClass = index < 3 ? `rank-${index + 1}` : '';
+
+        row.innerHTML = `
+            <td>
+                <span class="rank-medal ${rankClass}">${index + 1}</span>
+            </td>
+            <td>${score.username}</td>
+            <td>${score.score}/${score.total}</td>
+            <td>${score.percentage}%</td>
+            <td>${score.time}s</td>
+        `;
+
+        leaderboardBody.appendChild(row);
+    });
+
+    // If no scores, show placeholder
+    if (topScores.length === 0) {
+        leaderboardBody.innerHTML = `
+            <tr>
+                <td colspan="5" class="text-center">No scores yet. Be the first!</td>
+            </tr>
+        `;
+    }
+}
+
+function createConfetti() {
+    if (results.accuracy >= 90) {
+        const container = document.getElementById('confettiContainer');
+        const colors = ['#00f2ff', '#FFD700', '#4caf50', '#ff9800', '#f44336'];
+
+        for (let i = 0; i < 50; i++) {
+            setTimeout(() => {
+                const confetti = document.createElement('div');
+                confetti.className = 'confetti';
+                confetti.style.left = Math.random() * 100 + '%';
+                confetti.style.background = colors[Math.floor(Math.random() * colors.length)];
+                confetti.style.animationDelay = Math.random() * 3 + 's';
+                confetti.style.animationDuration = (Math.random() * 3 + 2) + 's';
+                container.appendChild(confetti);
+
+                setTimeout(() => confetti.remove(), 5000);
+            }, i * 100);
+        }
+    }
+}
+
+function animateCharts() {
+    setTimeout(() => {
+        document.getElementById('accuracyBar').style.width = `${results.accuracy}%`;
+        document.getElementById('accuracyValue').textContent = `${results.accuracy}%`;
+
+        document.getElementById('speedBar').style.width = `${results.speedScore}%`;
+        document.getElementById('speedValue').textContent = `${results.speedScore}%`;
+
+        document.getElementById('consistencyBar').style.width = `${results.consistencyScore}%`;
+        document.getElementById('consistencyValue').textContent = `${results.consistencyScore}%`;
+    }, 500);
+}
+
+// Action Functions
+function downloadCertificate() {
+    // Create certificate content
+    const certificateContent = `
+        <div style="text-align: center; padding: 50px; font-family: Arial;">
+            <h1 style="color: #FFD700;">Certificate of Achievement</h1>
+            <p>This is to certify that</p>
+            <h2>${results.username}</h2>
+            <p>has successfully completed the QuizVerse challenge</p>
+            <h3>Score: ${results.score}/${results.total} (${results.accuracy}%)</h3>
+            <p>Difficulty: ${results.difficulty.charAt(0).toUpperCase() + results.difficulty.slice(1)}</p>
+            <p>Time: ${results.time} seconds</p>
+            <p>Date: ${new Date().toLocaleDateString()}</p>
+        </div>
+    `;
+
+    // Create and download certificate
+    const blob = new Blob([certificateContent], { type: 'text/html' });
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = `QuizVerse_Certificate_${results.username}_${Date.now()}.html`;
+    a.click();
+    URL.revokeObjectURL(url);
+
+    showNotification('Certificate downloaded successfully!', 'success');
+}
+
+function reviewAnswers() {
+    // Store results for review page
+    localStorage.setItem('reviewResults', JSON.stringify(results));
+    window.location.href = 'review.html';
+}
+
+function playAgain() {
+    window.location.href = 'home.html';
+}
+
+function shareOnTwitter() {
+    const text = `I scored ${results.score}/${results.total} (${results.accuracy}%) on QuizVerse! 🎯 Can you beat my score?`;
+    const url = `https://twitter.com/intent/tweet?text=${encodeURIComponent(text)}`;
+    window.open(url, '_blank');
+}
+
+function shareOnFacebook() {
+    const url = window.location.href;
+    const fbUrl = `https://www.facebook.com/sharer/sharer.php?u=${encodeURIComponent(url)}`;
+    window.open(fbUrl, '_blank');
+}
+
+function copyLink() {
+    const text = `I scored ${results.score}/${results.total} (${results.accuracy}%) on QuizVerse! 🎯`;
+    navigator.clipboard.writeText(text).then(() => {
+        showNotification('Link copied to clipboard!', 'success');
+    });
+}
+
+function downloadResults() {
+    const resultsData = {
+        username: results.username,
+        score: results.score,
+        total: results.total,
+        accuracy: results.accuracy,
+        time: results.time,
+        difficulty: results.difficulty,
+        date: new Date().toISOString()
+    };
+
+    const blob = new Blob([JSON.stringify(resultsData, null, 2)], { type: 'application/json' });
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = `QuizVerse_Results_${results.username}_${Date.now()}.json`;
+    a.click();
+    URL.revokeObjectURL(url);
+
+    showNotification('Results downloaded successfully!', 'success');
+}
+
+function showNotification(message, type) {
+    const notification = document.createElement('div');
+    notification.className = `alert alert-${type} position-fixed top-0 start-50 translate-middle-x mt-3`;
+    notification.style.zIndex = '9999';
+    notification.textContent = message;
+    document.body.appendChild(notification);
+
+    setTimeout(() => {
+        notification.remove();
+    }, 3000);
+}
+
+// Theme Management
+function toggleTheme() {
+    const body = document.body;
+    const themeIcon = document.getElementById('themeIcon');
+
+    if (body.classList.contains('light-theme')) {
+        body.classList.remove('light-theme');
+        themeIcon.className = 'bi bi-moon-fill';
+        localStorage.setItem('theme', 'dark');
+    } else {
+        body.classList.add('light-theme');
+        themeIcon.className = 'bi bi-sun-fill';
+        localStorage.setItem('theme', 'light');
+    }
+}
+
+function loadTheme() {
+    const theme = localStorage.getItem('theme') || 'dark';
+    const themeIcon = document.getElementById('themeIcon');
+
+    if (theme === 'light') {
+        document.body.classList.add('light-theme');
+        themeIcon.className = 'bi bi-sun-fill';
+    } else {
+        themeIcon.className = 'bi bi-moon-fill';
+    }
+}
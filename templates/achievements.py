@@ -0,0 +1,133 @@
+"""Achievement rules compiled into sorted threshold arrays.
+
+Every active achievement is a threshold on one stat. Per condition type the
+thresholds are kept sorted, so the achievements a set of stats unlocks is a
+contiguous slice found by bisection instead of a check per achievement.
+"""
+import bisect
+import threading
+
+from eventlog import event_log
+
+HIGHER = 'higher'  # stat >= threshold unlocks
+LOWER = 'lower'  # stat <= threshold unlocks (e.g. finishing time)
+
+# condition_type -> (stat key, direction)
+CONDITIONS = {
+    'score': ('score', HIGHER),
+    'accuracy': ('accuracy', HIGHER),
+    'streak': ('streak', HIGHER),
+    'quizzes': ('total_quizzes', HIGHER),
+    'time': ('time', LOWER),
+}
+
+SELECT_ACTIVE_ACHIEVEMENTS = """
+    SELECT id, name, description, icon, category, condition_type, condition_value, points
+    FROM advanced_achievements
+    WHERE is_active = 1
+"""
+
+ACHIEVEMENT_COLUMNS = ('id', 'name', 'description', 'icon', 'category', 'condition_type', 'condition_value', 'points')
+
+def meets_condition(condition_type, threshold, stats):
+    """Single-rule check, as used by the Achievement model"""
+    if condition_type not in CONDITIONS:
+        return False
+    key, direction = CONDITIONS[condition_type]
+    value = stats.get(key)
+    if value is None:
+        return False
+    return value >= threshold if direction == HIGHER else value <= threshold
+
+class ThresholdIndex:
+    """Sorted thresholds for one condition type with the achievement at each"""
+
+    def __init__(self, direction, rules):
+        self.direction = direction
+        rules = sorted(rules, key=lambda rule: rule['condition_value'])
+        self.thresholds = [rule['condition_value'] for rule in rules]
+        self.rules = rules
+
+    def unlocked(self, value, previous=None):
+        """Rules met by value but not already met by previous (None: nothing met before)"""
+        if value is None:
+            return []
+        if self.direction == HIGHER:
+            end = bisect.bisect_right(self.thresholds, value)
+            start = bisect.bisect_right(self.thresholds, previous) if previous is not None else 0
+            return self.rules[start:end] if end > start else []
+        start = bisect.bisect_left(self.thresholds, value)
+        end = bisect.bisect_left(self.thresholds, previous) if previous is not None else len(self.rules)
+        return self.rules[start:end] if end > start else []
+
+class AchievementEngine:
+    """Compiled view of the active achievements"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {}  # condition_type -> ThresholdIndex
+
+    def load(self, conn):
+        """Recompile from the active achievements; returns how many were compiled"""
+        cur = conn.cursor()
+        cur.execute(SELECT_ACTIVE_ACHIEVEMENTS)
+        grouped = {}
+        for row in cur.fetchall():
+            rule = dict(zip(ACHIEVEMENT_COLUMNS, row))
+            if rule['condition_type'] in CONDITIONS:
+                grouped.setdefault(rule['condition_type'], []).append(rule)
+            else:
+                event_log.record('achievement_skipped',
+                                 f"Skipping achievement {rule['name']!r}: unknown condition {rule['condition_type']!r}",
+                                 level='warning', achievement_id=rule['id'], condition_type=rule['condition_type'])
+
+        indexes = {
+            condition_type: ThresholdIndex(CONDITIONS[condition_type][1], rules)
+            for condition_type, rules in grouped.items()
+        }
+        with self._lock:
+            self._indexes = indexes
+        return sum(len(rules) for rules in grouped.values())
+
+    def unlocked(self, stats, previous=None):
+        """Achievements reached by `stats` that `previous` stats had not reached.
+
+        Stats missing from `previous` count as never reached, so callers
+        only need to pass the values they know, e.g. the quiz count before
+        this one.
+        """
+        previous = previous or {}
+        with self._lock:
+            indexes = self._indexes
+        found = []
+        for condition_type, index in indexes.items():
+            key = CONDITIONS[condition_type][0]
+            found.extend(index.unlocked(stats.get(key), previous.get(key)))
+        return found
+
+    def award(self, cur, user_id, stats, previous=None, when=None):
+        """Record newly unlocked achievements for a user with one bulk insert.
+
+        Achievements the user already holds are skipped by the unique
+        (user_id, achievement_id) index. Returns the ones actually awarded.
+        """
+        rules = self.unlocked(stats, previous)
+        if not rules:
+            return []
+        placeholders = ', '.join('(?, ?, ?)' for _ in rules)
+        params = []
+        for rule in rules:
+            params.extend((user_id, rule['id'], when))
+        cur.execute(f"""
+            INSERT INTO advanced_user_achievements (user_id, achievement_id, unlocked_at)
+            VALUES {placeholders}
+            ON CONFLICT DO NOTHING
+            RETURNING achievement_id
+        """, params)
+        awarded = {row[0] for row in cur.fetchall()}
+        return [
+            {key: rule[key] for key in ('id', 'name', 'description', 'icon', 'points')}
+            for rule in rules if rule['id'] in awarded
+        ]
+
+achievement_engine = AchievementEngine()
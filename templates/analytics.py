@@ -0,0 +1,114 @@
+"""Daily and hourly analytics rollups.
+
+Quiz starts and completions are added to small aggregate tables as they
+happen, so the admin analytics page never scans raw quiz history. Existing
+history can be loaded with:
+
+    python templates/manage.py analytics-backfill
+"""
+from datetime import datetime, timedelta
+
+ANALYTICS_WINDOWS = (7, 30, 90, 365)  # days the analytics endpoint offers
+UNKNOWN_DIFFICULTY = 'unknown'
+ALL_CATEGORIES = 'all'
+
+ROLLUP_TABLES = (
+    ('analytics_daily', 'day', '%Y-%m-%d'),
+    ('analytics_hourly', 'hour', '%Y-%m-%d %H:00'),
+)
+
+def _bump_rollups(cur, when, difficulty, category, attempts=0, completions=0, accuracy=0.0, time_taken=0):
+    for table, column, fmt in ROLLUP_TABLES:
+        cur.execute(f"""
+            INSERT INTO {table} ({column}, difficulty, category, attempts, completions, accuracy_sum, time_sum)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT({column}, difficulty, category) DO UPDATE SET
+                attempts = attempts + excluded.attempts,
+                completions = completions + excluded.completions,
+                accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+                time_sum = time_sum + excluded.time_sum
+        """, (
+            when.strftime(fmt),
+            difficulty or UNKNOWN_DIFFICULTY,
+            category or ALL_CATEGORIES,
+            attempts,
+            completions,
+            accuracy,
+            time_taken
+        ))
+
+def record_attempt(cur, difficulty, category, when=None):
+    """Count a started quiz"""
+    _bump_rollups(cur, when or datetime.now(), difficulty, category, attempts=1)
+
+def record_completion(cur, difficulty, category, accuracy, time_taken, when=None):
+    """Count a completed quiz; run inside the transaction that saves it"""
+    _bump_rollups(
+        cur, when or datetime.now(), difficulty, category,
+        completions=1, accuracy=accuracy, time_taken=time_taken
+    )
+
+def backfill_rollups(conn):
+    """Rebuild both rollup tables from the completed quiz history.
+
+    Historic rows only record completions, so each one counts as an attempt
+    too. Quiz starts recorded live are replaced by this rebuild.
+    """
+    with conn:
+        cur = conn.cursor()
+        for table, column, fmt in ROLLUP_TABLES:
+            cur.execute(f"DELETE FROM {table}")
+            cur.execute(f"""
+                INSERT INTO {table} ({column}, difficulty, category, attempts, completions, accuracy_sum, time_sum)
+                SELECT strftime(?, completed_at),
+                       COALESCE(difficulty, ?),
+                       COALESCE(category, ?),
+                       COUNT(*),
+                       COUNT(*),
+                       COALESCE(SUM(CASE WHEN total_questions > 0 THEN accuracy END), 0),
+                       COALESCE(SUM(time_taken), 0)
+                FROM advanced_quiz_sessions
+                WHERE completed_at IS NOT NULL
+                GROUP BY 1, 2, 3
+            """, (fmt, UNKNOWN_DIFFICULTY, ALL_CATEGORIES))
+        cur.execute("SELECT COUNT(*) FROM analytics_daily")
+        return cur.fetchone()[0]
+
+def daily_activity(cur, days):
+    """Attempts and completions per day for the last `days` days"""
+    since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    cur.execute("""
+        SELECT day, SUM(attempts), SUM(completions)
+        FROM analytics_daily
+        WHERE day >= ?
+        GROUP BY day
+        ORDER BY day
+    """, (since,))
+    return [{'date': row[0], 'attempts': row[1], 'completions': row[2]} for row in cur.fetchall()]
+
+def hourly_activity(cur, hours=24):
+    """Attempts and completions per hour for the last `hours` hours"""
+    since = (datetime.now() - timedelta(hours=hours)).strftime('%Y-%m-%d %H:00')
+    cur.execute("""
+        SELECT hour, SUM(attempts), SUM(completions)
+        FROM analytics_hourly
+        WHERE hour >= ?
+        GROUP BY hour
+        ORDER BY hour
+    """, (since,))
+    return [{'hour': row[0], 'attempts': row[1], 'completions': row[2]} for row in cur.fetchall()]
+
+def difficulty_performance(cur, days):
+    """Average accuracy and completions per difficulty for the last `days` days"""
+    since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+    cur.execute("""
+        SELECT difficulty, SUM(accuracy_sum) / SUM(completions), SUM(completions)
+        FROM analytics_daily
+        WHERE day >= ? AND completions > 0
+        GROUP BY difficulty
+        ORDER BY difficulty
+    """, (since,))
+    return [
+        {'difficulty': row[0], 'avg_score': round(row[1], 2), 'count': row[2]}
+        for row in cur.fetchall()
+    ]
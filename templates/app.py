@@ -1,18 +1,124 @@
-from flask import Flask, request, redirect, session, send_file, jsonify, make_response, render_template, url_for
+from flask import Flask, request, redirect, session, jsonify, make_response, render_template, g, Response, abort
 from functools import wraps
 import os
-from datetime import datetime, timedelta
-import json, io
-from database import get_legacy_db, init_db, create_sample_questions
-import sqlite3
-import csv
-
-app = Flask(__name__)
+from datetime import datetime
+import json
+import time
+from connection import DB, pool
+from migrations import require_schema
+from conditional import read_versions, validators, not_modified
+from repository import (
+    QUESTION_COLUMNS, save_quiz_result, top_scores, recent_scores, medal_counts,
+    get_question, insert_question, update_question, delete_question
+)
+from question_index import question_index
+from question_import import detect_format, import_questions
+from validation import validate_question, validate_question_id
+from session_store import make_session_store
+from leaderboard import leaderboard_cache
+from ranking import rank_index, NEIGHBOURS, MAX_NEIGHBOURS
+from achievements import achievement_engine
+from index_sync import index_sync
+from stats import stats_cache, bump_counters, read_counters
+from export import EXPORTS, build_export_query, stream_csv
+from pagination import page_size, encode_cursor, decode_cursor, keyset_condition, like_prefix
+from backup import BackupManager
+from assets import static_assets, IMMUTABLE, REVALIDATE
+from page_cache import page_cache
+from metrics import metrics
+from eventlog import event_log, LEVELS, LOG_PATH
+from profiler import profiler
+from writer import writer, WriterBusy
+from analytics import ANALYTICS_WINDOWS, record_attempt, daily_activity, hourly_activity, difficulty_performance
+
+# Page templates sit next to this module; static/ is served by static_files()
+# below from the in-memory asset manifest
+app = Flask(__name__, template_folder='.', static_folder=None)
 app.secret_key = "quiz_secret"
-
-# Initialize database
-init_db()
-create_sample_questions()
+# In-progress quizzes are shared through SQLite so any worker of a pre-fork
+# server can take the next answer; 'memory' only suits a single process
+app.config['QUIZ_SESSION_BACKEND'] = os.environ.get('QUIZ_SESSION_BACKEND', 'sqlite')
+app.config['QUIZ_SESSION_TTL'] = int(os.environ.get('QUIZ_SESSION_TTL', 3600))
+app.config['QUIZ_EVENT_LOG'] = os.environ.get('QUIZ_EVENT_LOG', LOG_PATH)
+app.config['QUIZ_SLOW_QUERY_MS'] = float(os.environ.get('QUIZ_SLOW_QUERY_MS', 100))
+
+backups = BackupManager(DB)
+
+# In-progress quizzes live server-side; the cookie only carries the session id
+quiz_sessions = make_session_store(
+    app.config['QUIZ_SESSION_BACKEND'], pool, writer, app.config['QUIZ_SESSION_TTL']
+)
+
+def create_app():
+    """Ready the app to serve: check the schema and warm the in-memory indexes.
+
+    Importing this module does no database work. Schema creation, migrations
+    and seeding are a separate deploy step (templates/manage.py), so each
+    worker only pays for a version check and the index loads.
+    """
+    with pool.connection() as conn:
+        require_schema(conn)
+        index_sync.load(conn)
+        achievement_engine.load(conn)
+    static_assets.build()
+    event_log.start(app.config['QUIZ_EVENT_LOG'], app.config['QUIZ_SLOW_QUERY_MS'] / 1000)
+    writer.start()
+    return app
+
+# Templates link to fingerprinted asset URLs
+app.jinja_env.globals['asset_url'] = static_assets.url
+
+# Database connections are borrowed from the pool once per request
+def get_conn():
+    """Get the pooled connection for the current request"""
+    if 'db_conn' not in g:
+        g.db_conn = pool.acquire()
+    return g.db_conn
+
+@app.teardown_appcontext
+def release_conn(exception):
+    """Return the request's connection to the pool"""
+    conn = g.pop('db_conn', None)
+    if conn is not None:
+        pool.release(conn)
+
+# Pick up question edits and completed quizzes from other workers. The
+# connection is borrowed only when a check is due, so requests that never
+# touch the database do not hold one of the pool's connections.
+@app.before_request
+def sync_indexes():
+    if request.endpoint not in (None, 'static_files', 'favicon') and index_sync.due():
+        with pool.connection() as conn:
+            index_sync.check(conn)
+
+# Request metrics: latency per route, status codes and in-flight count
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    metrics.request_started()
+    if profiler.enabled:
+        g.profile = profiler.start_request(request.url_rule.rule if request.url_rule else None)
+
+@app.after_request
+def record_request(response):
+    started = g.get('request_started')
+    if started is not None:
+        # Label by route pattern, not path, so the series count stays bounded
+        endpoint = request.url_rule.rule if request.url_rule else '<unmatched>'
+        metrics.observe_request(endpoint, request.method, response.status_code, time.perf_counter() - started)
+    if response.status_code >= 500:
+        # Handlers turn exceptions into JSON 500s; keep the message in the event log
+        body = response.get_json(silent=True) if response.is_json else None
+        error = body.get('error') if isinstance(body, dict) else None
+        event_log.record('error', error or response.status, level='error',
+                         method=request.method, path=request.path, status=response.status_code)
+    return response
+
+@app.teardown_request
+def finish_request(exception):
+    profiler.finish_request(g.pop('profile', None))
+    if g.pop('request_started', None) is not None:
+        metrics.request_finished()
 
 # Admin authentication decorator
 def admin_required(f):
@@ -23,27 +129,95 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+def conditional_get(*tables, cache_control='no-cache', indexed=False):
+    """Serve GETs with ETag/Last-Modified from the data versions of `tables`.
+
+    A request whose validators still match gets a 304 before the view runs.
+    `indexed` views answer from this worker's in-memory indexes, which are
+    brought up to those versions before the view renders.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if request.method != 'GET':
+                return f(*args, **kwargs)
+            # Read the versions before the view's queries: a write landing in
+            # between makes the tag older than the body, never newer
+            g.data_versions = tuple(read_versions(get_conn().cursor(), tables))
+            etag, last_modified = validators(request.full_path, g.data_versions)
+            if not_modified(request, etag, last_modified):
+                response = Response(status=304)
+            else:
+                if indexed:
+                    # The indexes may lag the tables by up to SYNC_INTERVAL
+                    index_sync.ensure(get_conn(), tables, g.data_versions)
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = cache_control
+            return response
+        return decorated_function
+    return decorator
+
+# ==================== CACHED RESPONSES ====================
+
+def asset_response(asset, cache_control):
+    """Serve an in-memory Asset in the best encoding the client accepts"""
+    encoding = asset.negotiate(request.accept_encodings)
+    response = Response(asset.variants[encoding], mimetype=asset.mimetype)
+    if encoding != 'identity':
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(asset.etag(encoding))
+    response.headers['Cache-Control'] = cache_control
+    return response.make_conditional(request)
+
+def cached_page(template, cache_control='public, no-cache', raw=False, **context):
+    """Serve a page rendered once, then kept minified and precompressed in memory.
+
+    `raw` pages are plain HTML files sent as-is rather than Jinja templates.
+    Pages link to fingerprinted assets, so browsers revalidate them by ETag.
+    """
+    source = os.path.join(app.root_path, template)
+    if raw:
+        def render():
+            with open(source, encoding='utf-8') as f:
+                return f.read()
+    else:
+        def render():
+            return render_template(template, **context)
+    key = (template, raw, tuple(sorted(context.items())))
+    page = page_cache.get(key, source, render, reload=app.debug)
+    return asset_response(page, cache_control)
+
 # ==================== MAIN APPLICATION ROUTES ====================
 
 @app.route("/")
 def home():
     """Main home page with quiz interface"""
-    return render_template('simple_home.html')
+    return cached_page('simple_home.html')
 
 @app.route("/quiz")
 def quiz():
     """Quiz page"""
-    return render_template('quiz-app.html')
+    return cached_page('quiz-app.html')
 
 @app.route("/result")
 def result():
     """Result page"""
-    return render_template('result.html')
+    return cached_page('result.html')
+
+@app.route("/certificate")
+def certificate():
+    """Certificate page"""
+    return cached_page('certificate.html')
 
 @app.route("/leaderboard")
 def leaderboard():
     """Leaderboard page"""
-    return render_template('admin_dashboard.html')
+    return cached_page('admin_dashboard.html')
 
 # ==================== ADMIN ROUTES ====================
 
@@ -58,183 +232,15 @@ def admin_login():
         if username == 'admin' and password == '2026':
             session['admin_logged_in'] = True
             session['admin_username'] = username
+            event_log.record('admin_login', f"{username} signed in", user=username)
             return redirect('/admin/dashboard')
         else:
             error = 'Invalid credentials'
+            event_log.record('admin_login', "Failed admin sign-in", level='warning', user=username)
     else:
         error = None
     
-    return '''
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Admin Login - Quiz Management System</title>
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap-icons@1.11.0/font/bootstrap-icons.css" rel="stylesheet">
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-            }
-
-            .login-container {
-                background: rgba(255, 255, 255, 0.95);
-                border-radius: 20px;
-                padding: 40px;
-                box-shadow: 0 20px 40px rgba(0, 0, 0, 0.1);
-                backdrop-filter: blur(10px);
-                width: 100%;
-                max-width: 400px;
-            }
-
-            .logo {
-                text-align: center;
-                margin-bottom: 30px;
-            }
-
-            .logo i {
-                font-size: 3rem;
-                color: #667eea;
-                margin-bottom: 10px;
-            }
-
-            .form-control {
-                border-radius: 10px;
-                border: 2px solid #e0e0e0;
-                padding: 12px 15px;
-                transition: all 0.3s ease;
-            }
-
-            .form-control:focus {
-                border-color: #667eea;
-                box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-            }
-
-            .btn-login {
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                color: white;
-                font-weight: 600;
-                width: 100%;
-                transition: all 0.3s ease;
-            }
-
-            .btn-login:hover {
-                transform: translateY(-2px);
-                box-shadow: 0 10px 20px rgba(102, 126, 234, 0.3);
-            }
-
-            .alert {
-                border-radius: 10px;
-                border: none;
-                animation: slideIn 0.3s ease;
-            }
-
-            @keyframes slideIn {
-                from { transform: translateY(-10px); opacity: 0; }
-                to { transform: translateY(0); opacity: 1; }
-            }
-
-            .input-icon {
-                position: relative;
-            }
-
-            .input-icon i {
-                position: absolute;
-                left: 15px;
-                top: 50%;
-                transform: translateY(-50%);
-                color: #999;
-            }
-
-            .input-icon .form-control {
-                padding-left: 45px;
-            }
-
-            .back-link {
-                text-align: center;
-                margin-top: 20px;
-            }
-
-            .back-link a {
-                color: #667eea;
-                text-decoration: none;
-                font-weight: 600;
-            }
-
-            .back-link a:hover {
-                text-decoration: underline;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="login-container">
-            <div class="logo">
-                <i class="bi bi-shield-lock"></i>
-                <h2>Admin Login</h2>
-            </div>
-
-            ''' + (f'''
-            <div class="alert alert-danger alert-dismissible fade show" role="alert">
-                {error}
-                <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-            </div>
-            ''' if error else '') + '''
-
-            <form method="POST">
-                <div class="mb-3">
-                    <div class="input-icon">
-                        <i class="bi bi-person"></i>
-                        <input type="text" class="form-control" name="username" placeholder="Admin Username" required>
-                    </div>
-                </div>
-
-                <div class="mb-3">
-                    <div class="input-icon">
-                        <i class="bi bi-lock"></i>
-                        <input type="password" class="form-control" name="password" placeholder="Admin Password" required>
-                    </div>
-                </div>
-
-                <div class="mb-3">
-                    <div class="form-check">
-                        <input class="form-check-input" type="checkbox" id="remember" name="remember">
-                        <label class="form-check-label" for="remember">
-                            Remember me
-                        </label>
-                    </div>
-                </div>
-
-                <button type="submit" class="btn btn-login">
-                    <i class="bi bi-box-arrow-in-right"></i> Login to Admin Panel
-                </button>
-            </form>
-
-            <div class="back-link">
-                <a href="/">
-                    <i class="bi bi-arrow-left"></i> Back to Home
-                </a>
-            </div>
-        </div>
-
-        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-    </body>
-    </html>
-    '''
+    return cached_page('admin_login.html', 'private, no-cache', error=error)
 
 @app.route("/admin/logout")
 def admin_logout():
@@ -246,55 +252,55 @@ def admin_logout():
 @admin_required
 def admin_dashboard():
     """Main admin dashboard"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/questions")
 @admin_required
 def admin_questions():
     """Question management page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/leaderboard")
 @admin_required
 def admin_leaderboard():
     """Leaderboard management page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/medals")
 @admin_required
 def admin_medals():
     """Medals management page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/users")
 @admin_required
 def admin_users():
     """User management page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/analytics")
 @admin_required
 def admin_analytics():
     """Analytics page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/settings")
 @admin_required
 def admin_settings():
     """Settings page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/logs")
 @admin_required
 def admin_logs():
     """Logs page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 @app.route("/admin/backup")
 @admin_required
 def admin_backup():
     """Backup page"""
-    return send_file('templates/admin_dashboard.html')
+    return cached_page('admin_dashboard.html', 'private, no-cache', raw=True)
 
 # ==================== API ENDPOINTS ====================
 
@@ -307,44 +313,38 @@ def start_quiz():
         category = data.get('category', 'all')
         difficulty = data.get('difficulty', 'easy')
         
-        # Get questions from database
-        conn = get_legacy_db()
-        cur = conn.cursor()
-        
-        if category == 'all':
-            cur.execute("SELECT * FROM questions WHERE difficulty = ? ORDER BY RANDOM() LIMIT 10", (difficulty,))
-        else:
-            cur.execute("SELECT * FROM questions WHERE difficulty = ? AND category = ? ORDER BY RANDOM() LIMIT 10", 
-                       (difficulty, category))
-        
-        questions = cur.fetchall()
-        conn.close()
-        
-        if not questions:
+        # Sample questions from the in-memory question bank
+        question_list = [
+            {
+                'id': q['id'],
+                'question': q['question'],
+                'options': q['options'],
+                'correct': q['correct'],
+                'difficulty': q['difficulty']
+            } for q in question_index.sample(difficulty, category, k=10)
+        ]
+        
+        if not question_list:
             return jsonify({'error': 'No questions found'}), 404
         
-        # Convert to list of dictionaries
-        question_list = []
-        for q in questions:
-            question_list.append({
-                'id': q[0],
-                'question': q[1],
-                'options': json.loads(q[2]),
-                'correct': q[3],
-                'difficulty': q[4]
-            })
+        # Analytics only - committed by the writer without holding up the response
+        writer.submit(record_attempt, difficulty, category)
         
-        # Store session data
-        session['quiz_session'] = {
+        # Store compact quiz state server-side: (question id, correct index) pairs
+        now = datetime.now().isoformat()
+        session['quiz_id'] = quiz_sessions.create({
             'username': username,
             'category': category,
             'difficulty': difficulty,
-            'questions': question_list,
+            'questions': [[q['id'], q['correct']] for q in question_list],
             'current_question': 0,
             'score': 0,
             'answers': [],
-            'start_time': datetime.now().isoformat()
-        }
+            'start_time': now,
+            'last_answer_time': now
+        })
+        event_log.record('quiz_start', f"{username} started a {difficulty} quiz", user=username,
+                         difficulty=difficulty, category=category, questions=len(question_list))
         
         return jsonify({
             'success': True,
@@ -352,6 +352,8 @@ def start_quiz():
             'total_questions': len(question_list)
         })
         
+    except WriterBusy as e:
+        return jsonify({'error': str(e)}), 503
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -359,123 +361,127 @@ def start_quiz():
 def submit_answer():
     """Submit answer for current question"""
     try:
-        if 'quiz_session' not in session:
+        quiz_id = session.get('quiz_id')
+        if not quiz_id:
             return jsonify({'error': 'No active quiz session'}), 400
-        
         data = request.get_json()
-        answer = data.get('answer')
-        
-        quiz_session = session['quiz_session']
-        current_q = quiz_session['current_question']
-        questions = quiz_session['questions']
-        
-        if current_q >= len(questions):
-            return jsonify({'error': 'Quiz already completed'}), 400
-        
-        # Check answer
-        correct_answer = questions[current_q]['correct']
-        is_correct = answer == correct_answer
-        
-        # Update score
-        if is_correct:
-            quiz_session['score'] += 1
-        
-        # Store answer
-        quiz_session['answers'].append({
-            'question_id': questions[current_q]['id'],
-            'user_answer': answer,
-            'is_correct': is_correct
-        })
-        
-        # Move to next question
-        quiz_session['current_question'] += 1
-        
-        # Save to database
-        conn = get_legacy_db()
-        cur = conn.cursor()
-        cur.execute("""
-            INSERT INTO scores (username, score, total, time, created) 
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            quiz_session['username'],
-            quiz_session['score'],
-            len(questions),
-            0,  # Will be calculated when quiz ends
-            datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        ))
-        conn.commit()
-        conn.close()
-        
-        # Check if quiz is completed
-        is_completed = quiz_session['current_question'] >= len(questions)
-        
-        response = {
-            'success': True,
-            'is_correct': is_correct,
-            'correct_answer': correct_answer,
-            'current_question': quiz_session['current_question'],
-            'score': quiz_session['score'],
-            'is_completed': is_completed
-        }
-        
-        if is_completed:
-            # Calculate final results
-            start_time = datetime.fromisoformat(quiz_session['start_time'])
-            end_time = datetime.now()
-            time_taken = int((end_time - start_time).total_seconds())
-            
-            response.update({
-                'final_score': quiz_session['score'],
-                'total_questions': len(questions),
-                'percentage': round((quiz_session['score'] / len(questions)) * 100, 2),
-                'time_taken': time_taken
-            })
         
+        # One answer at a time per quiz; the stored state only moves on once
+        # this answer (and, on the last one, the result) has been persisted.
+        # The lock only covers this process: answers to the same quiz racing
+        # in two workers can still overwrite each other's progress, but the
+        # result is saved once either way (save_quiz_result is idempotent)
+        with quiz_sessions.lock(quiz_id):
+            quiz_session = quiz_sessions.get(quiz_id)
+            if quiz_session is None:
+                return jsonify({'error': 'No active quiz session'}), 400
+            if quiz_session['current_question'] >= len(quiz_session['questions']):
+                return jsonify({'error': 'Quiz already completed'}), 400
+            response = answer_question(quiz_id, quiz_session, data.get('answer'))
+        
+        if response['is_completed']:
+            session.pop('quiz_id', None)
         return jsonify(response)
         
+    except WriterBusy as e:
+        return jsonify({'error': str(e)}), 503
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def answer_question(quiz_id, quiz_session, answer):
+    """Apply one answer to a private copy of the quiz state, then persist it"""
+    current_q = quiz_session['current_question']
+    questions = quiz_session['questions']
+    
+    # Check answer
+    question_id, correct_answer = questions[current_q]
+    is_correct = answer == correct_answer
+    
+    # Update score
+    if is_correct:
+        quiz_session['score'] += 1
+    
+    # Store answer; the whole quiz is persisted once it completes
+    now = datetime.now()
+    last_answer_time = datetime.fromisoformat(quiz_session['last_answer_time'])
+    quiz_session['answers'].append({
+        'question_id': question_id,
+        'user_answer': answer,
+        'is_correct': is_correct,
+        'time_taken': int((now - last_answer_time).total_seconds()),
+        'answered_at': now.isoformat()
+    })
+    quiz_session['last_answer_time'] = now.isoformat()
+    
+    # Move to next question
+    quiz_session['current_question'] += 1
+    
+    # Check if quiz is completed
+    is_completed = quiz_session['current_question'] >= len(questions)
+    
+    response = {
+        'success': True,
+        'is_correct': is_correct,
+        'correct_answer': correct_answer,
+        'current_question': quiz_session['current_question'],
+        'score': quiz_session['score'],
+        'is_completed': is_completed
+    }
+    
+    if not is_completed:
+        quiz_sessions.save(quiz_id, quiz_session)
+        return response
+    
+    # Calculate final results
+    start_time = datetime.fromisoformat(quiz_session['start_time'])
+    time_taken = int((now - start_time).total_seconds())
+    
+    # Until this commits the stored state is still before the last answer,
+    # so a failed save can simply be retried. A save that timed out
+    # (WriteTimeout) may still commit; the retry then gets that result back
+    score = writer.run(save_quiz_result, quiz_session, quiz_id, time_taken)
+    quiz_sessions.delete(quiz_id)
+    # Applies this quiz, and any finished in other workers, to the boards
+    index_sync.catch_up(get_conn())
+    event_log.record('quiz_complete',
+                     f"{quiz_session['username']} scored {score['score']}/{len(questions)}",
+                     user=quiz_session['username'], score=score['score'], total=len(questions),
+                     difficulty=quiz_session['difficulty'], time_taken=score['time'],
+                     achievements=[a['name'] for a in score['achievements']])
+    
+    # Reported from the saved result, which a retry may not have produced
+    response.update({
+        'score': score['score'],
+        'final_score': score['score'],
+        'total_questions': len(questions),
+        'percentage': round((score['score'] / len(questions)) * 100, 2),
+        'time_taken': score['time'],
+        'achievements': score['achievements']
+    })
+    return response
+
 @app.route("/api/leaderboard")
+@conditional_get('advanced_quiz_sessions', cache_control='public, max-age=5', indexed=True)
 def get_leaderboard():
     """Get leaderboard data"""
     try:
-        conn = get_legacy_db()
-        cur = conn.cursor()
-        
         difficulty = request.args.get('difficulty', 'all')
         limit = int(request.args.get('limit', 10))
         
-        if difficulty == 'all':
-            cur.execute("""
-                SELECT username, score, total, created 
-                FROM scores 
-                ORDER BY score DESC, created DESC 
-                LIMIT ?
-            """, (limit,))
-        else:
-            cur.execute("""
-                SELECT username, score, total, created 
-                FROM scores 
-                WHERE id IN (
-                    SELECT id FROM scores WHERE difficulty = ?
-                )
-                ORDER BY score DESC, created DESC 
-                LIMIT ?
-            """, (difficulty, limit))
-        
-        results = cur.fetchall()
-        conn.close()
+        results = leaderboard_cache.top(difficulty, limit)
+        if results is None:
+            # Deeper than the in-memory boards go - read it from the database
+            results = top_scores(get_conn().cursor(), difficulty, limit)
         
         leaderboard = []
         for i, row in enumerate(results, 1):
             leaderboard.append({
                 'rank': i,
-                'username': row[0],
-                'score': row[1],
-                'total': row[2],
-                'percentage': round((row[1] / row[2]) * 100, 2) if row[2] > 0 else 0,
-                'date': row[3]
+                'username': row['username'],
+                'score': row['score'],
+                'total': row['total'],
+                'percentage': round((row['score'] / row['total']) * 100, 2) if row['total'] > 0 else 0,
+                'date': row['created']
             })
         
         return jsonify({'leaderboard': leaderboard})
@@ -483,161 +489,260 @@ def get_leaderboard():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route("/api/leaderboard/rank")
+def get_rank():
+    """Get a player's rank, percentile and neighbours"""
+    try:
+        username = request.args.get('username')
+        if not username:
+            return jsonify({'error': 'username is required'}), 400
+        # A malformed value falls back to the default; out-of-range ones are clamped
+        neighbours = request.args.get('neighbours', NEIGHBOURS, type=int)
+        neighbours = max(0, min(neighbours, MAX_NEIGHBOURS))
+        
+        standing = rank_index.lookup(username, neighbours)
+        if standing is None:
+            return jsonify({'error': 'No scores found for this player'}), 404
+        
+        return jsonify(standing)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route("/api/admin/stats")
 @admin_required
+@conditional_get('advanced_questions', 'advanced_quiz_sessions', cache_control='private, no-cache')
 def get_admin_stats():
     """Get admin dashboard statistics"""
     try:
-        conn = get_legacy_db()
-        cur = conn.cursor()
-        
-        # Get basic stats
-        cur.execute("SELECT COUNT(*) FROM questions")
-        total_questions = cur.fetchone()[0]
-        
-        cur.execute("SELECT COUNT(DISTINCT username) FROM scores")
-        total_users = cur.fetchone()[0]
-        
-        cur.execute("SELECT COUNT(*) FROM scores")
-        total_attempts = cur.fetchone()[0]
-        
-        cur.execute("SELECT AVG(score * 100.0 / total) FROM scores WHERE total > 0")
-        avg_score = cur.fetchone()[0] or 0
-        
-        # Get recent activity
-        cur.execute("""
-            SELECT username, score, total, created 
-            FROM scores 
-            ORDER BY created DESC 
-            LIMIT 5
-        """)
-        recent_activity = cur.fetchall()
-        
-        conn.close()
-        
-        return jsonify({
-            'total_questions': total_questions,
-            'total_users': total_users,
-            'total_attempts': total_attempts,
-            'avg_score': round(avg_score, 2),
-            'recent_activity': [
-                {
-                    'username': row[0],
-                    'score': row[1],
-                    'total': row[2],
-                    'date': row[3]
-                } for row in recent_activity
-            ]
-        })
+        return jsonify(stats_cache.get('admin_stats', build_admin_stats, g.get('data_versions')))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def build_admin_stats():
+    """Assemble the dashboard statistics from the counters table"""
+    cur = get_conn().cursor()
+    counters = read_counters(cur)
+    
+    # Get recent activity
+    recent_activity = recent_scores(cur, 5)
+    
+    avg_score = counters['accuracy_sum'] / counters['accuracy_count'] if counters['accuracy_count'] else 0
+    return {
+        'total_questions': counters['questions'],
+        'total_users': counters['players'],
+        'total_attempts': counters['quizzes'],
+        'avg_score': round(avg_score, 2),
+        'recent_activity': [
+            {
+                'username': row['username'],
+                'score': row['score'],
+                'total': row['total'],
+                'date': row['created']
+            } for row in recent_activity
+        ]
+    }
+
+def refresh_indexed_question(cur, question_id):
+    """Re-read one question after a write and patch the question index"""
+    question = get_question(cur, question_id)
+    if question is None:
+        question_index.remove(int(question_id))
+    else:
+        question_index.add(question)
+
+def list_questions(cur):
+    """One keyset-paginated page of questions, newest first.
+
+    Optional filters: difficulty, category and a case-insensitive text
+    prefix (`q`). `fields` picks a subset of QUESTION_COLUMNS; the id is
+    always returned because it is the cursor.
+    """
+    fields = request.args.get('fields')
+    if fields:
+        unknown = set(fields.split(',')) - set(QUESTION_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {sorted(unknown)}")
+    columns = [c for c in QUESTION_COLUMNS if not fields or c == 'id' or c in fields.split(',')]
+    limit = page_size(request.args.get('limit'))
+    
+    conditions = []
+    params = []
+    for column in ('difficulty', 'category'):
+        if request.args.get(column):
+            conditions.append(f"{column} = ?")
+            params.append(request.args[column])
+    if request.args.get('q'):
+        conditions.append("question LIKE ? ESCAPE '\\'")
+        params.append(like_prefix(request.args['q']))
+    cursor = request.args.get('cursor')
+    if cursor:
+        conditions.append(keyset_condition(('id',), descending=True))
+        params.extend(decode_cursor(cursor))
+    
+    query = f"SELECT {', '.join(columns)} FROM advanced_questions"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY id DESC LIMIT ?"
+    params.append(limit)
+    
+    cur.execute(query, params)
+    rows = cur.fetchall()
+    
+    question_list = []
+    for row in rows:
+        question = dict(zip(columns, row))
+        if 'options' in question:
+            question['options'] = json.loads(question['options'])
+        question_list.append(question)
+    
+    next_cursor = encode_cursor(rows[-1][0]) if len(rows) == limit else None
+    return jsonify({'questions': question_list, 'next_cursor': next_cursor})
+
 @app.route("/api/admin/questions", methods=['GET', 'POST', 'PUT', 'DELETE'])
 @admin_required
+@conditional_get('advanced_questions', cache_control='private, no-cache')
 def manage_questions():
     """Manage questions CRUD operations"""
     try:
-        conn = get_legacy_db()
+        conn = get_conn()
         cur = conn.cursor()
         
         if request.method == 'GET':
-            # Get all questions
-            cur.execute("SELECT * FROM questions ORDER BY id DESC")
-            questions = cur.fetchall()
-            
-            question_list = []
-            for q in questions:
-                question_list.append({
-                    'id': q[0],
-                    'question': q[1],
-                    'options': json.loads(q[2]),
-                    'correct': q[3],
-                    'difficulty': q[4]
-                })
-            
-            conn.close()
-            return jsonify({'questions': question_list})
+            return list_questions(cur)
         
         elif request.method == 'POST':
             # Add new question
-            data = request.get_json()
-            cur.execute("""
-                INSERT INTO questions (question, options, correct, difficulty) 
-                VALUES (?, ?, ?, ?)
-            """, (
-                data['question'],
-                json.dumps(data['options']),
-                data['correct'],
-                data['difficulty']
-            ))
-            conn.commit()
-            conn.close()
+            question = validate_question(request.get_json(silent=True))
+            
+            def add(cur):
+                question_id = insert_question(cur, question)
+                bump_counters(cur, questions=1)
+                return question_id
+            question_id = writer.run(add)
+            refresh_indexed_question(cur, question_id)
+            event_log.record('question_create', f"Question {question_id} added", user=session.get('admin_username'),
+                             question_id=question_id)
             return jsonify({'success': True, 'message': 'Question added successfully'})
         
         elif request.method == 'PUT':
             # Update question
-            data = request.get_json()
-            cur.execute("""
-                UPDATE questions 
-                SET question = ?, options = ?, correct = ?, difficulty = ? 
-                WHERE id = ?
-            """, (
-                data['question'],
-                json.dumps(data['options']),
-                data['correct'],
-                data['difficulty'],
-                data['id']
-            ))
-            conn.commit()
-            conn.close()
+            data = request.get_json(silent=True)
+            question = validate_question(data)
+            question['id'] = validate_question_id(data.get('id'))
+            if not data.get('category'):
+                question['category'] = None  # keep the stored category
+            writer.run(update_question, question)
+            refresh_indexed_question(cur, question['id'])
+            event_log.record('question_update', f"Question {question['id']} updated", user=session.get('admin_username'),
+                             question_id=question['id'])
             return jsonify({'success': True, 'message': 'Question updated successfully'})
         
         elif request.method == 'DELETE':
             # Delete question
-            question_id = request.args.get('id')
-            cur.execute("DELETE FROM questions WHERE id = ?", (question_id,))
-            conn.commit()
-            conn.close()
+            question_id = validate_question_id(request.args.get('id'))
+            
+            def remove(cur):
+                bump_counters(cur, questions=-delete_question(cur, question_id))
+            writer.run(remove)
+            question_index.remove(question_id)
+            event_log.record('question_delete', f"Question {question_id} deleted", user=session.get('admin_username'),
+                             question_id=question_id)
             return jsonify({'success': True, 'message': 'Question deleted successfully'})
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except WriterBusy as e:
+        return jsonify({'error': str(e)}), 503
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route("/api/admin/questions/import", methods=['POST'])
+@admin_required
+def import_question_bank():
+    """Bulk-import questions from a JSONL or CSV upload"""
+    try:
+        upload = request.files.get('file')
+        try:
+            fmt = detect_format(upload.filename if upload else None, request.args.get('format'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        # A multipart upload or the raw request body, read as a stream either way
+        stream = upload.stream if upload else request.stream
+        result = import_questions(writer, stream, fmt)
+
+        if result['imported']:
+            # Swap in the new question bank only once the import has committed
+            question_index.load(get_conn())
+        event_log.record('question_import', f"Imported {result['imported']} questions, {result['failed']} failed",
+                         level='warning' if result['failed'] else 'info', user=session.get('admin_username'),
+                         format=fmt, imported=result['imported'], failed=result['failed'])
+
+        status = 200 if result['imported'] or not result['failed'] else 400
+        return jsonify({'success': status == 200, **result}), status
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Sortable columns of /api/admin/users -> position in the selected row
+USER_SORT_COLUMNS = {
+    'total_quizzes': 2,
+    'best_score': 3,
+    'average_accuracy': 4,
+    'last_activity': 5,
+    'username': 1
+}
+
 @app.route("/api/admin/users")
 @admin_required
 def get_users():
-    """Get all users"""
+    """Get users, one keyset-paginated page at a time"""
     try:
-        conn = get_legacy_db()
-        cur = conn.cursor()
-        
-        cur.execute("""
-            SELECT DISTINCT username, 
-                   COUNT(*) as total_quizzes,
-                   MAX(score) as best_score,
-                   AVG(score * 100.0 / total) as avg_accuracy,
-                   MAX(created) as last_activity
-            FROM scores 
-            GROUP BY username 
-            ORDER BY total_quizzes DESC
-        """)
-        
+        sort = request.args.get('sort', 'total_quizzes')
+        if sort not in USER_SORT_COLUMNS:
+            return jsonify({'error': f'sort must be one of {list(USER_SORT_COLUMNS)}'}), 400
+        descending = request.args.get('order', 'desc') != 'asc'
+        limit = page_size(request.args.get('limit'))
+        
+        # Aggregates are maintained on write in advanced_users
+        query = """
+            SELECT id, username, total_quizzes, best_score, average_accuracy, last_activity
+            FROM advanced_users
+        """
+        params = []
+        cursor = request.args.get('cursor')
+        if cursor:
+            query += " WHERE " + keyset_condition((sort, 'id'), descending)
+            params.extend(decode_cursor(cursor))
+        direction = 'DESC' if descending else 'ASC'
+        query += f" ORDER BY {sort} {direction}, id {direction} LIMIT ?"
+        params.append(limit)
+        
+        cur = get_conn().cursor()
+        cur.execute(query, params)
         users = cur.fetchall()
-        conn.close()
         
         user_list = []
         for user in users:
             user_list.append({
-                'username': user[0],
-                'total_quizzes': user[1],
-                'best_score': user[2],
-                'avg_accuracy': round(user[3] or 0, 2),
-                'last_activity': user[4]
+                'username': user[1],
+                'total_quizzes': user[2],
+                'best_score': user[3],
+                'avg_accuracy': round(user[4] or 0, 2),
+                'last_activity': user[5]
             })
         
-        return jsonify({'users': user_list})
+        next_cursor = None
+        if len(users) == limit:
+            last = users[-1]
+            next_cursor = encode_cursor(last[USER_SORT_COLUMNS[sort]], last[0])
         
+        return jsonify({'users': user_list, 'next_cursor': next_cursor})
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -647,35 +752,26 @@ def export_data():
     """Export data as CSV"""
     try:
         export_type = request.args.get('type', 'scores')
-        
-        conn = get_legacy_db()
-        cur = conn.cursor()
-        
-        if export_type == 'scores':
-            cur.execute("SELECT username, score, total, created FROM scores ORDER BY created DESC")
-            data = cur.fetchall()
-            headers = ['Username', 'Score', 'Total', 'Date']
-        elif export_type == 'questions':
-            cur.execute("SELECT * FROM questions ORDER BY id")
-            data = cur.fetchall()
-            headers = ['ID', 'Question', 'Options', 'Correct', 'Difficulty']
-        else:
+        if export_type not in EXPORTS:
             return jsonify({'error': 'Invalid export type'}), 400
         
-        conn.close()
+        sql, params, headers = build_export_query(
+            export_type,
+            date_from=request.args.get('from'),
+            date_to=request.args.get('to'),
+            difficulty=request.args.get('difficulty')
+        )
+        compress = request.args.get('gzip') in ('1', 'true')
         
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(headers)
-        writer.writerows(data)
+        filename = f'{export_type}_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        if compress:
+            filename += '.gz'
         
-        output.seek(0)
-        return send_file(
-            io.BytesIO(output.getvalue().encode()),
-            mimetype='text/csv',
-            as_attachment=True,
-            download_name=f'{export_type}_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+        # Stream rows in batches instead of building the whole file in memory
+        return Response(
+            stream_csv(pool, sql, params, headers, compress=compress),
+            mimetype='application/gzip' if compress else 'text/csv',
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
         )
         
     except Exception as e:
@@ -686,44 +782,22 @@ def export_data():
 def get_analytics():
     """Get analytics data"""
     try:
-        conn = get_legacy_db()
-        cur = conn.cursor()
+        days = int(request.args.get('days', 7))
+        if days not in ANALYTICS_WINDOWS:
+            return jsonify({'error': f'days must be one of {list(ANALYTICS_WINDOWS)}'}), 400
         
-        # Daily quiz attempts for last 7 days
-        cur.execute("""
-            SELECT DATE(created) as date, COUNT(*) as attempts
-            FROM scores 
-            WHERE created >= date('now', '-7 days')
-            GROUP BY DATE(created)
-            ORDER BY date
-        """)
-        daily_attempts = cur.fetchall()
-        
-        # Performance by difficulty
-        cur.execute("""
-            SELECT difficulty, AVG(score * 100.0 / total) as avg_score, COUNT(*) as count
-            FROM scores s
-            JOIN questions q ON s.question_id = q.id
-            GROUP BY difficulty
-        """)
-        difficulty_performance = cur.fetchall()
-        
-        # Top categories
-        cur.execute("""
-            SELECT category, COUNT(*) as count
-            FROM questions
-            GROUP BY category
-            ORDER BY count DESC
-            LIMIT 5
-        """)
-        top_categories = cur.fetchall()
-        
-        conn.close()
+        # Everything comes from the pre-aggregated rollup tables
+        cur = get_conn().cursor()
         
         return jsonify({
-            'daily_attempts': [{'date': row[0], 'attempts': row[1]} for row in daily_attempts],
-            'difficulty_performance': [{'difficulty': row[0], 'avg_score': row[1], 'count': row[2]} for row in difficulty_performance],
-            'top_categories': [{'category': row[0], 'count': row[1]} for row in top_categories]
+            'days': days,
+            'daily_attempts': daily_activity(cur, days),
+            'hourly_attempts': hourly_activity(cur),
+            'difficulty_performance': difficulty_performance(cur, days),
+            'top_categories': [
+                {'category': category, 'count': count}
+                for category, count in question_index.category_counts()[:5]
+            ]
         })
         
     except Exception as e:
@@ -732,65 +806,62 @@ def get_analytics():
 @app.route("/api/admin/logs")
 @admin_required
 def get_logs():
-    """Get system logs"""
+    """Page through the application event log, newest first.
+
+    Optional filters: `level` (minimum level) and `type` (comma-separated
+    event types). Served from the in-memory ring; the database is not read.
+    Each worker has its own ring, so this is the serving worker's events
+    only; `pid` says which worker that was.
+    """
     try:
-        # For now, return recent quiz activities as logs
-        conn = get_legacy_db()
-        cur = conn.cursor()
+        level = request.args.get('level')
+        if level and level not in LEVELS:
+            return jsonify({'error': f'level must be one of {list(LEVELS)}'}), 400
+        types = set(request.args['type'].split(',')) if request.args.get('type') else None
+        limit = page_size(request.args.get('limit'))
+        cursor = request.args.get('cursor')
+        before = decode_cursor(cursor)[0] if cursor else None
         
-        cur.execute("""
-            SELECT 'Quiz Completed' as action, username, 
-                   score || '/' || total as details, created
-            FROM scores 
-            ORDER BY created DESC 
-            LIMIT 50
-        """)
+        logs = event_log.events(level, types, before, limit)
         
-        logs = cur.fetchall()
-        conn.close()
-        
-        return jsonify({
-            'logs': [
-                {
-                    'action': row[0],
-                    'user': row[1],
-                    'details': row[2],
-                    'timestamp': row[3]
-                } for row in logs
-            ]
-        })
+        next_cursor = encode_cursor(logs[-1]['id']) if len(logs) == limit else None
+        return jsonify({'logs': logs, 'next_cursor': next_cursor, 'pid': os.getpid()})
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route("/api/admin/backup", methods=['POST'])
 @admin_required
 def create_backup():
-    """Create database backup"""
+    """Start an online database backup on the background worker"""
     try:
-        import shutil
-        from datetime import datetime
-        
-        # Create backup filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_filename = f"quiz_backup_{timestamp}.db"
-        backup_path = os.path.join("backups", backup_filename)
-        
-        # Create backups directory if it doesn't exist
-        os.makedirs("backups", exist_ok=True)
-        
-        # Copy database file
-        shutil.copy2("quiz.db", backup_path)
+        data = request.get_json(silent=True) or {}
+        job = backups.submit(data.get('compression'))
+        event_log.record('backup', "Backup started", user=session.get('admin_username'), job=job['id'],
+                         compression=job['compression'])
         
         return jsonify({
             'success': True,
-            'message': f'Backup created successfully: {backup_filename}',
-            'filename': backup_filename
-        })
+            'message': 'Backup started',
+            'job': job
+        }), 202
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route("/api/admin/backup/<job_id>")
+@admin_required
+def backup_status(job_id):
+    """Poll the status of a backup job"""
+    job = backups.job(job_id)
+    if job is None:
+        return jsonify({'error': 'Backup job not found'}), 404
+    return jsonify({'job': job})
+
 @app.route("/api/admin/settings", methods=['GET', 'POST'])
 @admin_required
 def manage_settings():
@@ -820,36 +891,15 @@ def manage_settings():
 
 @app.route("/api/admin/medals")
 @admin_required
+@conditional_get('advanced_quiz_sessions', cache_control='private, no-cache')
 def get_medals():
     """Get medals/achievements data"""
     try:
-        conn = get_legacy_db()
+        conn = get_conn()
         cur = conn.cursor()
         
         # Get medal statistics
-        cur.execute("""
-            SELECT 
-                CASE 
-                    WHEN score * 100.0 / total >= 90 THEN 'Gold'
-                    WHEN score * 100.0 / total >= 75 THEN 'Silver'
-                    WHEN score * 100.0 / total >= 60 THEN 'Bronze'
-                    ELSE 'None'
-                END as medal,
-                COUNT(*) as count
-            FROM scores
-            WHERE total > 0
-            GROUP BY medal
-            ORDER BY 
-                CASE medal
-                    WHEN 'Gold' THEN 1
-                    WHEN 'Silver' THEN 2
-                    WHEN 'Bronze' THEN 3
-                    WHEN 'None' THEN 4
-                END
-        """)
-        
-        medal_stats = cur.fetchall()
-        conn.close()
+        medal_stats = medal_counts(cur)
         
         return jsonify({
             'medals': [
@@ -860,6 +910,57 @@ def get_medals():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route("/api/admin/metrics")
+@admin_required
+def get_metrics():
+    """Request and SQL metrics in Prometheus text format"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route("/api/admin/profile", methods=['GET', 'POST', 'DELETE'])
+@admin_required
+def manage_profiler():
+    """Profiling session status of the worker serving this request; POST starts one, DELETE stops it"""
+    try:
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            profiler.enable(
+                mode=data.get('mode', 'sample'),
+                rate=float(data.get('rate', 1.0)),
+                routes=data.get('routes'),
+                duration=float(data.get('duration', 60)),
+                interval=float(data.get('interval_ms', 5)) / 1000
+            )
+            event_log.record('profiler', f"Profiling started in worker {os.getpid()}", user=session.get('admin_username'),
+                             pid=os.getpid(), **{key: data[key] for key in ('mode', 'rate', 'routes', 'duration') if key in data})
+        elif request.method == 'DELETE':
+            profiler.disable()
+        return jsonify(profiler.status())
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route("/api/admin/profile/collapsed")
+@admin_required
+def profile_collapsed():
+    """Sampled stacks in collapsed format, for flamegraph.pl or speedscope"""
+    response = Response(profiler.collapsed(), mimetype='text/plain')
+    response.headers['X-Profiler-PID'] = str(os.getpid())
+    return response
+
+@app.route("/api/admin/profile/pstats")
+@admin_required
+def profile_pstats():
+    """Merged cProfile stats as a file pstats.Stats() can load"""
+    data = profiler.pstats_dump()
+    if data is None:
+        return jsonify({'error': 'No cProfile data; start a session with mode "cprofile"'}), 404
+    response = Response(data, mimetype='application/octet-stream')
+    response.headers['Content-Disposition'] = f'attachment; filename=quiz-{os.getpid()}.pstats'
+    response.headers['X-Profiler-PID'] = str(os.getpid())
+    return response
+
 # ==================== STATIC FILES AND ASSETS ====================
 
 @app.route("/favicon.ico")
@@ -869,8 +970,13 @@ def favicon():
 
 @app.route("/static/<path:filename>")
 def static_files(filename):
-    """Serve static files"""
-    return send_file(os.path.join('static', filename))
+    """Serve static files from memory, precompressed when the client allows"""
+    asset, fingerprinted = static_assets.lookup(filename)
+    if asset is None:
+        abort(404)
+    
+    # Fingerprinted names change with the content; plain names must revalidate
+    return asset_response(asset, IMMUTABLE if fingerprinted else REVALIDATE)
 
 # ==================== ERROR HANDLERS ====================
 
@@ -885,4 +991,4 @@ def internal_error(error):
 # ==================== MAIN EXECUTION ====================
 
 if __name__ == "__main__":
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    create_app().run(debug=True, host='0.0.0.0', port=5000)
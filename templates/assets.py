@@ -0,0 +1,120 @@
+"""Fingerprinted, precompressed static assets served from memory.
+
+At startup every file under static/ is read once, hashed into a
+fingerprinted name (`css/quiz-app.3f9c1a2b7d4e.css`) and compressed with
+gzip and, when the optional brotli package is installed, brotli. Pages link
+to the fingerprinted URL through `asset_url()`, so those responses can be
+cached for a year as immutable. The same variants can be written to disk
+for a CDN or front proxy with:
+
+    python templates/manage.py assets
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+
+try:
+    import brotli
+except ImportError:  # optional dependency - gzip only
+    brotli = None
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(ROOT_DIR, "static")
+BUILD_DIR = os.path.join(STATIC_DIR, "dist")
+FINGERPRINT_LENGTH = 12
+MIN_COMPRESS_SIZE = 256  # bytes; smaller files are served as-is
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'public, no-cache'
+
+class Asset:
+    """One static file with its fingerprint and encoded variants"""
+
+    def __init__(self, name, data):
+        self.name = name
+        self.digest = hashlib.sha256(data).hexdigest()[:FINGERPRINT_LENGTH]
+        root, ext = os.path.splitext(name)
+        self.fingerprinted = f"{root}.{self.digest}{ext}"
+        self.mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        self.variants = {'identity': data}  # content-coding -> bytes
+
+        if len(data) >= MIN_COMPRESS_SIZE and self.mimetype.startswith(COMPRESSIBLE_TYPES):
+            # mtime=0 keeps the gzip bytes (and so their ETag) stable across builds
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(compressed) < len(data):
+                self.variants['gzip'] = compressed
+            if brotli is not None:
+                compressed = brotli.compress(data, quality=11)
+                if len(compressed) < len(data):
+                    self.variants['br'] = compressed
+
+    def etag(self, encoding):
+        return f"{self.digest}-{encoding}"
+
+    def negotiate(self, accept_encodings):
+        """Best variant the client accepts: brotli, then gzip, then identity"""
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and accept_encodings[encoding]:
+                return encoding
+        return 'identity'
+
+class AssetManifest:
+    """Every static asset, addressable by logical or fingerprinted name"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._assets = {}  # logical name -> Asset
+        self._by_path = {}  # logical or fingerprinted name -> (Asset, fingerprinted?)
+
+    def build(self, directory=STATIC_DIR):
+        """(Re)load every file under directory; returns the number of assets"""
+        assets = {}
+        build_dir = os.path.normpath(BUILD_DIR)
+        for root, dirs, files in os.walk(directory):
+            # Never re-ingest the on-disk build output
+            dirs[:] = [d for d in dirs if os.path.normpath(os.path.join(root, d)) != build_dir]
+            for filename in files:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, directory).replace(os.sep, '/')
+                with open(path, 'rb') as f:
+                    assets[name] = Asset(name, f.read())
+
+        by_path = {}
+        for asset in assets.values():
+            by_path[asset.name] = (asset, False)
+            by_path[asset.fingerprinted] = (asset, True)
+        with self._lock:
+            self._assets = assets
+            self._by_path = by_path
+        return len(assets)
+
+    def url(self, name):
+        """Public URL for an asset, fingerprinted when it is known"""
+        with self._lock:
+            asset = self._assets.get(name)
+        return f"/static/{asset.fingerprinted if asset else name}"
+
+    def lookup(self, path):
+        """(Asset, fingerprinted?) for a request path, or (None, False)"""
+        with self._lock:
+            return self._by_path.get(path, (None, False))
+
+    def write(self, output_dir=BUILD_DIR):
+        """Write every fingerprinted file and its .gz/.br siblings; returns the paths"""
+        written = []
+        with self._lock:
+            assets = list(self._assets.values())
+        for asset in assets:
+            for encoding, data in asset.variants.items():
+                suffix = {'identity': '', 'gzip': '.gz', 'br': '.br'}[encoding]
+                path = os.path.join(output_dir, asset.fingerprinted + suffix)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                written.append(path)
+        return written
+
+static_assets = AssetManifest()
@@ -0,0 +1,162 @@
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from eventlog import event_log
+
+try:
+    import zstandard
+except ImportError:  # optional dependency - fall back to gzip
+    zstandard = None
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKUP_DIR = os.path.join(ROOT_DIR, "backups")
+BACKUP_PAGES = 256  # pages copied per step of the online backup
+BACKUP_PAUSE = 0.005  # seconds yielded to writers between steps
+BACKUP_KEEP = 10  # newest backups always kept
+BACKUP_MAX_AGE_DAYS = 30  # older backups beyond BACKUP_KEEP are removed
+MAX_TRACKED_JOBS = 50
+
+COMPRESSION_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz', 'none': ''}
+
+def default_compression():
+    return 'zstd' if zstandard else 'gzip'
+
+def check_compression(compression):
+    """Validate a compression name, returning the default when none is given"""
+    compression = compression or default_compression()
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression == 'zstd' and zstandard is None:
+        raise ValueError("zstd compression needs the zstandard package")
+    return compression
+
+def compress_file(source, destination, compression):
+    """Stream-compress one file into another"""
+    with open(source, 'rb') as src:
+        if compression == 'zstd':
+            with open(destination, 'wb') as dst:
+                zstandard.ZstdCompressor(level=3).copy_stream(src, dst)
+        elif compression == 'gzip':
+            with gzip.open(destination, 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+        else:
+            with open(destination, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+def write_backup(db_path, backup_dir=BACKUP_DIR, compression=None, progress=None):
+    """Copy a live database with the SQLite online backup API.
+
+    Pages are copied BACKUP_PAGES at a time with a short pause between steps,
+    so writers only ever wait for one step. The consistent snapshot is then
+    compressed next to the other backups. Returns the backup file path.
+    """
+    compression = check_compression(compression)
+
+    os.makedirs(backup_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    snapshot_path = os.path.join(backup_dir, f".quiz_backup_{timestamp}_{uuid.uuid4().hex[:8]}.tmp")
+    backup_path = os.path.join(backup_dir, f"quiz_backup_{timestamp}.db{COMPRESSION_SUFFIXES[compression]}")
+
+    def step(status, remaining, total):
+        if progress:
+            progress(total - remaining, total)
+        time.sleep(BACKUP_PAUSE)
+
+    try:
+        src = sqlite3.connect(db_path)
+        dst = sqlite3.connect(snapshot_path)
+        try:
+            src.backup(dst, pages=BACKUP_PAGES, progress=step)
+        finally:
+            dst.close()
+            src.close()
+        compress_file(snapshot_path, backup_path, compression)
+    finally:
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+    return backup_path
+
+def apply_retention(backup_dir=BACKUP_DIR, keep=BACKUP_KEEP, max_age_days=BACKUP_MAX_AGE_DAYS):
+    """Delete backups beyond the newest `keep` that are older than `max_age_days`"""
+    if not os.path.isdir(backup_dir):
+        return []
+    backups = sorted(
+        (entry for entry in os.scandir(backup_dir) if entry.name.startswith("quiz_backup_")),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True
+    )
+    cutoff = time.time() - max_age_days * 86400
+    removed = []
+    for entry in backups[keep:]:
+        if entry.stat().st_mtime < cutoff:
+            os.remove(entry.path)
+            removed.append(entry.name)
+    return removed
+
+class BackupManager:
+    """Runs backups one at a time on a background worker and tracks their status"""
+
+    def __init__(self, db_path, backup_dir=BACKUP_DIR):
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="backup")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()  # job id -> status dict
+
+    def submit(self, compression=None):
+        """Queue a backup and return its job status"""
+        compression = check_compression(compression)
+
+        job = {
+            'id': uuid.uuid4().hex,
+            'status': 'queued',
+            'compression': compression,
+            'pages_copied': 0,
+            'pages_total': None,
+            'filename': None,
+            'size': None,
+            'removed': [],
+            'error': None,
+            'queued_at': datetime.now().isoformat(),
+            'finished_at': None
+        }
+        with self._lock:
+            self._jobs[job['id']] = job
+            while len(self._jobs) > MAX_TRACKED_JOBS:
+                self._jobs.popitem(last=False)
+        self._executor.submit(self._run, job)
+        return dict(job)
+
+    def job(self, job_id):
+        """Status of one job, or None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _run(self, job):
+        def progress(copied, total):
+            job['pages_copied'] = copied
+            job['pages_total'] = total
+
+        job['status'] = 'running'
+        try:
+            path = write_backup(self.db_path, self.backup_dir, job['compression'], progress)
+            job['filename'] = os.path.basename(path)
+            job['size'] = os.path.getsize(path)
+            job['removed'] = apply_retention(self.backup_dir)
+            job['status'] = 'completed'
+            event_log.record('backup', f"Backup written to {job['filename']}", job=job['id'], size=job['size'],
+                             removed=len(job['removed']))
+        except Exception as e:
+            job['status'] = 'failed'
+            job['error'] = str(e)
+            event_log.record('backup', f"Backup failed: {e}", level='error', job=job['id'])
+        job['finished_at'] = datetime.now().isoformat()
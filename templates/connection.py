@@ -0,0 +1,113 @@
+"""Tuned sqlite3 connections and the request connection pool.
+
+Request handlers only need this module, so serving never has to import
+SQLAlchemy; the ORM models in database.py are for setup and admin scripts.
+"""
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from metrics import InstrumentedConnection
+
+# Paths are anchored at the project root (the parent of templates/), so the
+# app finds the same files whatever directory it is started from
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB = os.environ.get('QUIZ_DB', os.path.join(ROOT_DIR, "quiz.db"))
+
+# Connection pool settings
+POOL_SIZE = 8
+POOL_TIMEOUT = 5  # seconds to wait for a free connection
+STATEMENT_CACHE_SIZE = 256  # prepared statements kept per connection
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("cache_size", -16000),  # negative means KiB, so ~16 MB of page cache
+    ("mmap_size", 268435456),  # 256 MB
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", 5000),
+)
+
+def configure_connection(conn):
+    """Apply the tuning pragmas to a freshly opened connection"""
+    for name, value in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+def open_connection(path=None):
+    """Open a tuned, instrumented sqlite3 connection that may be shared across threads"""
+    conn = sqlite3.connect(
+        path or DB,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        factory=InstrumentedConnection
+    )
+    return configure_connection(conn)
+
+class ConnectionPool:
+    """Checkout/return pool of pre-tuned sqlite3 connections"""
+
+    def __init__(self, path=None, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self.path = path or DB
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+
+    def acquire(self):
+        """Borrow a connection, opening a new one while under the size limit"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return open_connection(self.path)
+                except Exception:
+                    self._opened -= 1
+                    raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise RuntimeError("Timed out waiting for a database connection")
+
+    def release(self, conn):
+        """Return a borrowed connection, discarding any open transaction"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            # Broken connection - drop it so a fresh one can be opened
+            with self._lock:
+                self._opened -= 1
+            conn.close()
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Context manager that borrows and returns a connection"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """Close every idle connection"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._opened -= 1
+            conn.close()
+
+pool = ConnectionPool()
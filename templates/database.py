@@ -1,18 +1,36 @@
 import sqlite3
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, validates
 from sqlalchemy.sql import func
-from datetime import datetime
-import json
 import os
+import time
+from connection import DB, open_connection
+from migrations import migrate, schema_version
+from stats import read_counters
+from validation import validate_difficulty, validate_correct
+from achievements import meets_condition
+from backup import write_backup, apply_retention
+from metrics import metrics
 
 # Database Configuration
-DB = "quiz.db"
-DATABASE_URL = "sqlite:///quiz.db"
+DATABASE_URL = f"sqlite:///{DB}"
 engine = create_engine(DATABASE_URL, echo=False, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# ORM statements are counted and timed into the same per-fingerprint SQL metrics as the pool
+@event.listens_for(engine, "connect")
+def trace_statements(dbapi_connection, connection_record):
+    dbapi_connection.set_trace_callback(metrics.trace)
+
+@event.listens_for(engine, "before_cursor_execute")
+def start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('statement_started', []).append(time.perf_counter())
+
+@event.listens_for(engine, "after_cursor_execute")
+def record_statement_time(conn, cursor, statement, parameters, context, executemany):
+    metrics.observe_sql(statement, time.perf_counter() - conn.info['statement_started'].pop())
+
 Base = declarative_base()
 
 # Legacy compatibility function
@@ -20,11 +38,6 @@ def get_legacy_db():
     """Legacy compatibility - returns sqlite3 connection"""
     return sqlite3.connect(DB)
 
-# For backward compatibility
-def db():
-    """Legacy compatibility - returns sqlite3 connection"""
-    return get_legacy_db()
-
 class Question(Base):
     __tablename__ = "advanced_questions"
     
@@ -46,16 +59,11 @@ class Question(Base):
     
     @validates('difficulty')
     def validate_difficulty(self, key, difficulty):
-        valid_difficulties = ['easy', 'medium', 'hard']
-        if difficulty not in valid_difficulties:
-            raise ValueError(f"Difficulty must be one of: {valid_difficulties}")
-        return difficulty
+        return validate_difficulty(difficulty)
     
     @validates('correct')
     def validate_correct(self, key, correct):
-        if not isinstance(correct, int) or correct < 0:
-            raise ValueError("Correct answer must be a non-negative integer")
-        return correct
+        return validate_correct(correct, self.options)
     
     def to_dict(self):
         return {
@@ -91,6 +99,7 @@ class User(Base):
     experience_points = Column(Integer, default=0)
     created_at = Column(DateTime, default=func.now())
     last_login = Column(DateTime, nullable=True)
+    last_activity = Column(DateTime, nullable=True)
     
     # Relationships
     quiz_sessions = relationship("QuizSession", back_populates="user")
@@ -134,7 +143,8 @@ class User(Base):
             'longest_streak': self.longest_streak,
             'level': self.level,
             'experience_points': self.experience_points,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'last_activity': self.last_activity.isoformat() if self.last_activity else None
         }
 
 class QuizSession(Base):
@@ -234,15 +244,7 @@ class Achievement(Base):
     
     def check_condition(self, user_stats):
         """Check if user meets the achievement condition"""
-        if self.condition_type == 'score':
-            return user_stats.get('score', 0) >= self.condition_value
-        elif self.condition_type == 'accuracy':
-            return user_stats.get('accuracy', 0) >= self.condition_value
-        elif self.condition_type == 'streak':
-            return user_stats.get('streak', 0) >= self.condition_value
-        elif self.condition_type == 'quizzes':
-            return user_stats.get('total_quizzes', 0) >= self.condition_value
-        return False
+        return meets_condition(self.condition_type, self.condition_value, user_stats)
     
     def to_dict(self):
         return {
@@ -310,44 +312,29 @@ def get_db():
     finally:
         db.close()
 
-def init_db():
-    """Initialize database with all tables"""
-    # Create legacy tables for simple Flask app first
-    conn = get_legacy_db()
-    try:
-        cur = conn.cursor()
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS questions(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            question TEXT,
-            options TEXT,
-            correct INTEGER,
-            difficulty TEXT
-        )""")
-        cur.execute("""
-        CREATE TABLE IF NOT EXISTS scores(
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT,
-            score INTEGER,
-            total INTEGER,
-            time INTEGER,
-            created TEXT
-        )""")
-        conn.commit()
-        print("Legacy tables created")
-    except Exception as e:
-        print(f"Error creating legacy tables: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
-    
-    # Create SQLAlchemy tables (these will be separate from legacy tables)
+def create_schema():
+    """Create the ORM tables and apply pending migrations"""
+    # Create SQLAlchemy tables first; migrations then evolve them in place
     try:
         Base.metadata.create_all(bind=engine)
         print("SQLAlchemy tables created")
     except Exception as e:
         print(f"Error creating SQLAlchemy tables: {e}")
     
+    # Apply pending schema migrations
+    conn = open_connection()
+    try:
+        migrate(conn)
+        print(f"Database at schema version {schema_version(conn)}")
+    except Exception as e:
+        print(f"Error migrating database: {e}")
+    finally:
+        conn.close()
+
+def init_db():
+    """Initialize database with all tables"""
+    create_schema()
+    
     # Create default achievements if they don't exist
     try:
         session = SessionLocal()
@@ -378,7 +365,6 @@ def init_db():
 
 def create_sample_questions():
     """Create sample questions for testing"""
-    # Create for SQLAlchemy system
     session = SessionLocal()
     try:
         if session.query(Question).count() == 0:
@@ -432,72 +418,100 @@ def create_sample_questions():
                     explanation="2 + 2 = 4 is basic addition.",
                     points=10,
                     time_limit=15
+                ),
+                Question(
+                    question="What is the largest ocean on Earth?",
+                    options=["Atlantic", "Indian", "Arctic", "Pacific"],
+                    correct=3,
+                    difficulty="easy",
+                    category="Geography",
+                    explanation="The Pacific covers about a third of the Earth's surface.",
+                    points=10,
+                    time_limit=30
+                ),
+                Question(
+                    question="Who wrote Romeo and Juliet?",
+                    options=["Charles Dickens", "William Shakespeare", "Jane Austen", "Mark Twain"],
+                    correct=1,
+                    difficulty="medium",
+                    category="Literature",
+                    explanation="Shakespeare wrote Romeo and Juliet in the 1590s.",
+                    points=20,
+                    time_limit=25
+                ),
+                Question(
+                    question="What is the chemical symbol for gold?",
+                    options=["Go", "Gd", "Au", "Ag"],
+                    correct=2,
+                    difficulty="medium",
+                    category="Science",
+                    explanation="Au comes from the Latin word for gold, aurum.",
+                    points=20,
+                    time_limit=25
+                ),
+                Question(
+                    question="How many continents are there?",
+                    options=["5", "6", "7", "8"],
+                    correct=2,
+                    difficulty="easy",
+                    category="Geography",
+                    explanation="Africa, Antarctica, Asia, Australia, Europe, North America and South America.",
+                    points=10,
+                    time_limit=30
+                ),
+                Question(
+                    question="What year did World War II end?",
+                    options=["1943", "1944", "1945", "1946"],
+                    correct=2,
+                    difficulty="medium",
+                    category="History",
+                    explanation="World War II ended in 1945.",
+                    points=20,
+                    time_limit=25
                 )
             ]
             
             for question in sample_questions:
                 session.add(question)
             
+            # Keep the questions counter in step within the same transaction
+            session.execute(
+                text("UPDATE stats_counters SET value = value + :count WHERE name = 'questions'"),
+                {'count': len(sample_questions)}
+            )
             session.commit()
-            print("Sample questions created for SQLAlchemy")
+            print("Sample questions created")
     except Exception as e:
         session.rollback()
-        print(f"Error creating SQLAlchemy sample questions: {e}")
+        print(f"Error creating sample questions: {e}")
     finally:
         session.close()
-    
-    # Create for legacy system
-    conn = get_legacy_db()
-    try:
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM questions")
-        if cur.fetchone()[0] == 0:
-            sample_questions_legacy = [
-                ("What is the capital of France?", '["Berlin", "Madrid", "Paris", "Rome"]', 2, "easy"),
-                ("What is the largest planet in our solar system?", '["Earth", "Mars", "Jupiter", "Saturn"]', 2, "medium"),
-                ("What is the speed of light in vacuum?", '["299,792 km/s", "199,792 km/s", "399,792 km/s", "99,792 km/s"]', 0, "hard"),
-                ("Who painted the Mona Lisa?", '["Van Gogh", "Da Vinci", "Picasso", "Rembrandt"]', 1, "medium"),
-                ("What is 2 + 2?", '["3", "4", "5", "6"]', 1, "easy"),
-                ("What is the largest ocean on Earth?", '["Atlantic", "Indian", "Arctic", "Pacific"]', 3, "easy"),
-                ("Who wrote Romeo and Juliet?", '["Charles Dickens", "William Shakespeare", "Jane Austen", "Mark Twain"]', 1, "medium"),
-                ("What is the chemical symbol for gold?", '["Go", "Gd", "Au", "Ag"]', 2, "medium"),
-                ("How many continents are there?", '["5", "6", "7", "8"]', 2, "easy"),
-                ("What year did World War II end?", '["1943", "1944", "1945", "1946"]', 2, "medium")
-            ]
-            
-            cur.executemany(
-                "INSERT INTO questions(question, options, correct, difficulty) VALUES(?, ?, ?, ?)",
-                sample_questions_legacy
-            )
-            conn.commit()
-            print("Sample questions created for legacy system")
-    finally:
-        conn.close()
 
 # Utility Functions
-def backup_database():
-    """Create a backup of the database"""
-    import shutil
-    from datetime import datetime
-    
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_path = f"quiz_backup_{timestamp}.db"
-    
-    if os.path.exists("quiz.db"):
-        shutil.copy2("quiz.db", backup_path)
-        print(f"Database backed up to: {backup_path}")
-        return backup_path
-    return None
+def backup_database(compression=None):
+    """Create a compressed online backup of the database"""
+    if not os.path.exists(DB):
+        return None
+    backup_path = write_backup(DB, compression=compression)
+    apply_retention()
+    print(f"Database backed up to: {backup_path}")
+    return backup_path
 
 def get_database_stats():
     """Get database statistics"""
+    conn = open_connection()
+    try:
+        counters = read_counters(conn.cursor())
+    finally:
+        conn.close()
+
     session = SessionLocal()
     try:
         stats = {
-            'total_questions': session.query(Question).count(),
-            'total_users': session.query(User).count(),
-            'total_sessions': session.query(QuizSession).count(),
-            'total_attempts': session.query(QuizAttempt).count(),
+            'total_questions': counters['questions'],
+            'total_users': counters['players'],
+            'total_sessions': counters['quizzes'],
+            'total_attempts': counters['answers'],
             'total_achievements': session.query(Achievement).count(),
             'active_users': session.query(User).filter(User.is_active == True).count()
         }
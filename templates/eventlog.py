@@ -0,0 +1,174 @@
+"""Structured application event log.
+
+Events (quiz starts and completions, admin changes, backups, errors, slow
+SQL) are appended to a bounded in-memory ring buffer, which is what
+/api/admin/logs pages through. Once started, a background thread also
+appends them to a JSONL file, rotated by size, so recording an event never
+waits on disk. Events from before start() are only kept in the ring.
+Pending events leave the queue only once they are on disk; if the file
+cannot be written they are retried on the next flush.
+
+Under a pre-fork server each worker has its own ring, so /api/admin/logs
+shows the events of the worker that served it; every event carries its
+pid. All workers append to the same file. Each flush is one O_APPEND write
+made while holding an exclusive lock on `<file>.lock`, and size checks and
+rotation happen under that same lock. Without fcntl (Windows) the lock is
+skipped and a single process is assumed.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # not on Windows - single process only
+    fcntl = None
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOG_PATH = os.path.join(ROOT_DIR, "logs", "events.jsonl")
+RING_SIZE = 5000  # events kept in memory
+MAX_PENDING = 10000  # events waiting for the writer; the oldest are dropped beyond this
+MAX_FILE_BYTES = 10 * 1024 * 1024
+BACKUP_COUNT = 5  # rotated files kept: events.jsonl.1 .. events.jsonl.5
+FLUSH_INTERVAL = 1.0  # seconds between writes to disk
+SLOW_QUERY_SECONDS = 0.1
+
+LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+
+logger = logging.getLogger(__name__)
+
+class EventLog:
+    """Ring buffer of recent events plus an asynchronous rotating JSONL writer"""
+
+    def __init__(self, size=RING_SIZE):
+        self._lock = threading.Lock()
+        self._ring = deque(maxlen=size)
+        self._pending = deque(maxlen=MAX_PENDING)
+        self._next_id = 1
+        self._write_lock = threading.Lock()
+        self._writer = None
+        self._failing = False  # the last write to the file failed
+        self.path = None
+        self.slow_query_seconds = SLOW_QUERY_SECONDS
+
+    def record(self, type, message, level='info', **fields):
+        """Append an event; returns it"""
+        event = {
+            'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+            'level': level,
+            'type': type,
+            'message': message,
+            'pid': os.getpid(),
+            **fields
+        }
+        with self._lock:
+            event['id'] = self._next_id
+            self._next_id += 1
+            self._ring.append(event)
+            if self._writer is not None:
+                self._pending.append(event)
+        return event
+
+    def slow_query(self, sql, seconds):
+        """Record a statement that ran longer than slow_query_seconds"""
+        if seconds >= self.slow_query_seconds:
+            self.record('slow_query', f"Statement took {seconds * 1000:.1f} ms", level='warning',
+                        duration_ms=round(seconds * 1000, 3), sql=' '.join(sql.split())[:1000])
+
+    def events(self, level=None, types=None, before=None, limit=50):
+        """Newest-first events at or above `level`, of one of `types`, with id below `before`"""
+        minimum = LEVELS[level] if level else 0
+        with self._lock:
+            ring = list(self._ring)
+        found = []
+        for event in reversed(ring):
+            if before is not None and event['id'] >= before:
+                continue
+            if LEVELS.get(event['level'], 0) < minimum or (types and event['type'] not in types):
+                continue
+            found.append(event)
+            if len(found) == limit:
+                break
+        return found
+
+    # ---- file output ----
+
+    def start(self, path=LOG_PATH, slow_query_seconds=None):
+        """Start the background writer (once) and flush at interpreter exit"""
+        if slow_query_seconds is not None:
+            self.slow_query_seconds = slow_query_seconds
+        with self._lock:
+            if self._writer is not None:
+                return
+            self.path = path
+            self._writer = threading.Thread(target=self._run, name="event-log", daemon=True)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._writer.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            try:
+                self.flush()
+            except OSError as e:
+                self._write_failed(e)
+            else:
+                self._write_succeeded()
+
+    def _write_failed(self, error):
+        # Reported once per outage, not on every retry
+        if self._failing:
+            return
+        self._failing = True
+        logger.error("Event log write to %s failed: %s", self.path, error)
+        self.record('event_log', f"Writing {self.path} failed, events kept in memory: {error}",
+                    level='error', error=str(error))
+
+    def _write_succeeded(self):
+        if self._failing:
+            self._failing = False
+            logger.warning("Event log writes to %s resumed", self.path)
+            self.record('event_log', f"Writing {self.path} resumed", level='warning')
+
+    def flush(self):
+        """Write every pending event to the log file; they stay pending if the write fails"""
+        with self._write_lock:
+            # Serializes this process's writers: the background thread and an exit-time flush
+            with self._lock:
+                events = list(self._pending)
+            if not events or self.path is None:
+                return
+            data = ''.join(json.dumps(event, default=str) + '\n' for event in events).encode('utf-8')
+            with open(self.path + '.lock', 'a') as lock:
+                # Other workers append to and rotate the same file
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                if os.path.exists(self.path) and os.path.getsize(self.path) + len(data) > MAX_FILE_BYTES:
+                    self._rotate()
+                fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            # Events appended meanwhile stay; ones already dropped by the bounded queue are gone
+            written = events[-1]['id']
+            with self._lock:
+                while self._pending and self._pending[0]['id'] <= written:
+                    self._pending.popleft()
+
+    def _rotate(self):
+        for index in range(BACKUP_COUNT - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+event_log = EventLog()
@@ -0,0 +1,79 @@
+import csv
+import io
+import zlib
+
+EXPORT_BATCH_SIZE = 1000  # rows fetched and written per chunk
+
+# export type -> (CSV headers, SELECT ... FROM, ORDER BY, date column, difficulty column)
+EXPORTS = {
+    'scores': (
+        ['Username', 'Score', 'Total', 'Date', 'Difficulty'],
+        """u.username, s.score, s.total_questions, substr(s.completed_at, 1, 19), s.difficulty
+        FROM advanced_quiz_sessions s JOIN advanced_users u ON u.id = s.user_id""",
+        "s.completed_at DESC",
+        "s.completed_at",
+        "s.difficulty"
+    ),
+    'questions': (
+        ['ID', 'Question', 'Options', 'Correct', 'Difficulty', 'Category'],
+        "id, question, options, correct, difficulty, category FROM advanced_questions",
+        "id",
+        None,
+        "difficulty"
+    ),
+}
+
+def build_export_query(export_type, date_from=None, date_to=None, difficulty=None):
+    """SQL, parameters and CSV headers for one filtered export"""
+    headers, columns, order_by, date_column, difficulty_column = EXPORTS[export_type]
+    conditions = []
+    params = []
+    if difficulty:
+        conditions.append(f"{difficulty_column} = ?")
+        params.append(difficulty)
+    if date_column and date_from:
+        conditions.append(f"{date_column} >= ?")
+        params.append(date_from)
+    if date_column and date_to:
+        # Inclusive end date: everything before the start of the next day
+        conditions.append(f"{date_column} < date(?, '+1 day')")
+        params.append(date_to)
+
+    sql = f"SELECT {columns}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    return f"{sql} ORDER BY {order_by}", params, headers
+
+def stream_csv(pool, sql, params, headers, compress=False, batch_size=EXPORT_BATCH_SIZE):
+    """Yield the CSV export in chunks, optionally gzip-compressed.
+
+    Borrows its own pooled connection so memory stays at one batch no matter
+    how many rows match.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None  # wbits=31 -> gzip
+
+    def drain():
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    writer.writerow(headers)
+    yield drain()
+
+    with pool.connection() as conn:
+        cur = conn.cursor()
+        cur.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            writer.writerows(rows)
+            chunk = drain()
+            if chunk:
+                yield chunk
+
+    if compressor:
+        yield compressor.flush()
@@ -0,0 +1,95 @@
+"""Keeps each worker's in-memory indexes in step with the database.
+
+Under a pre-fork server every worker holds its own question index,
+leaderboards and rankings, but a question edit or completed quiz lands in
+only one of them. Every SYNC_INTERVAL seconds a worker reads the
+`data_versions` counters. When advanced_questions changed, it reloads the
+question index. When advanced_quiz_sessions changed, it feeds the quizzes
+completed since its last check into the leaderboards and rankings. A
+worker's own completions go through the same catch-up, so each quiz is
+applied once, in id order.
+"""
+import threading
+import time
+
+from conditional import read_versions
+from leaderboard import leaderboard_cache
+from question_index import question_index
+from ranking import rank_index
+from repository import scores_since
+
+SYNC_INTERVAL = 1.0  # seconds between version checks
+TABLES = ('advanced_questions', 'advanced_quiz_sessions')
+
+class IndexSync:
+    """Version-checked reloads and catch-up of the in-memory indexes"""
+
+    def __init__(self, interval=SYNC_INTERVAL):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._versions = None
+        self._last_score_id = 0
+        self._checked = 0
+
+    def load(self, conn):
+        """Load every index from scratch and remember what it reflects"""
+        cur = conn.cursor()
+        with self._lock:
+            # Read the high-water marks first: anything committed during the
+            # loads is applied again by the next catch-up, which is harmless
+            self._versions = read_versions(cur, TABLES)
+            cur.execute("SELECT COALESCE(MAX(id), 0) FROM advanced_quiz_sessions")
+            self._last_score_id = cur.fetchone()[0]
+            question_index.load(conn)
+            leaderboard_cache.load(conn)
+            rank_index.load(conn)
+            self._checked = time.monotonic()
+
+    def due(self):
+        """Whether the interval has passed since the last sync"""
+        return time.monotonic() - self._checked >= self.interval
+
+    def check(self, conn):
+        """Sync if the interval has passed; never waits on another thread's sync"""
+        if not self.due():
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._sync(conn)
+        finally:
+            self._lock.release()
+
+    def ensure(self, conn, tables, versions):
+        """Catch up unless the indexes already reflect `versions` of `tables`.
+
+        Views that answer from the indexes call this with the versions their
+        ETag is built from, so a body is never older than its tag.
+        """
+        applied = dict(zip(TABLES, self._versions or ()))
+        if all(applied.get(table, (0, 0))[0] >= version for table, (version, _) in zip(tables, versions)):
+            return
+        self.catch_up(conn)
+
+    def catch_up(self, conn):
+        """Sync now, e.g. right after this worker completed a quiz"""
+        with self._lock:
+            self._sync(conn)
+
+    def _sync(self, conn):
+        cur = conn.cursor()
+        self._checked = time.monotonic()
+        versions = read_versions(cur, TABLES)
+        if versions == self._versions:
+            return
+        (questions, sessions), (known_questions, known_sessions) = versions, self._versions
+        if questions != known_questions:
+            question_index.load(conn)
+        if sessions != known_sessions:
+            for entry in scores_since(cur, self._last_score_id):
+                leaderboard_cache.record(entry)
+                rank_index.record(entry)
+                self._last_score_id = entry['id']
+        self._versions = versions
+
+index_sync = IndexSync()
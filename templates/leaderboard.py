@@ -0,0 +1,87 @@
+import bisect
+import threading
+from datetime import datetime
+
+from repository import top_scores, score_difficulties
+
+LEADERBOARD_SIZE = 100  # entries kept per board
+OVERALL = 'all'
+
+def leaderboard_key(entry):
+    """Sort key putting higher scores first, then the most recent attempt"""
+    completed = datetime.fromisoformat(entry['completed_at']).timestamp()
+    return (-entry['score'], -completed, -entry['id'])
+
+class TopK:
+    """Bounded list of the best `size` score entries, kept sorted best first"""
+
+    def __init__(self, size=LEADERBOARD_SIZE):
+        self.size = size
+        self._keys = []
+        self._entries = []
+
+    def offer(self, entry):
+        """Insert an entry if it makes the board; returns True when it did"""
+        key = leaderboard_key(entry)
+        if len(self._keys) >= self.size and key >= self._keys[-1]:
+            return False
+        pos = bisect.bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            # Already on the board: the key includes the entry id
+            return False
+        self._keys.insert(pos, key)
+        self._entries.insert(pos, entry)
+        if len(self._keys) > self.size:
+            self._keys.pop()
+            self._entries.pop()
+        return True
+
+    def top(self, limit):
+        return self._entries[:limit]
+
+    def __len__(self):
+        return len(self._entries)
+
+class LeaderboardCache:
+    """In-memory top-K boards for the overall leaderboard and each difficulty.
+
+    Seeded from the completed quizzes at startup and updated as quizzes complete,
+    so reading a board never touches the database.
+    """
+
+    def __init__(self, size=LEADERBOARD_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._boards = {OVERALL: TopK(size)}
+
+    def load(self, conn):
+        """Rebuild every board from the completed quizzes"""
+        cur = conn.cursor()
+        difficulties = [OVERALL] + score_difficulties(cur)
+
+        boards = {}
+        for difficulty in difficulties:
+            board = boards[difficulty] = TopK(self.size)
+            for entry in top_scores(cur, difficulty, self.size):
+                board.offer(entry)
+
+        with self._lock:
+            self._boards = boards
+
+    def record(self, entry):
+        """Offer a freshly completed quiz to the overall and difficulty boards"""
+        with self._lock:
+            self._boards[OVERALL].offer(entry)
+            if entry.get('difficulty'):
+                board = self._boards.setdefault(entry['difficulty'], TopK(self.size))
+                board.offer(entry)
+
+    def top(self, difficulty=OVERALL, limit=10):
+        """Best `limit` entries, or None when more are asked for than are kept"""
+        if limit > self.size:
+            return None
+        with self._lock:
+            board = self._boards.get(difficulty)
+            return list(board.top(limit)) if board else []
+
+leaderboard_cache = LeaderboardCache()
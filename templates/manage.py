@@ -0,0 +1,55 @@
+"""Deploy-time setup commands, run once per release rather than in every worker.
+
+    python templates/manage.py migrate   # create/upgrade the schema
+    python templates/manage.py init      # migrate, then seed achievements and sample questions
+    python templates/manage.py assets    # write fingerprinted, precompressed static files
+    python templates/manage.py analytics-backfill  # rebuild the analytics rollups from quiz history
+"""
+import argparse
+import sys
+
+from connection import open_connection
+from migrations import SCHEMA_VERSION, schema_version
+
+def check_version():
+    conn = open_connection()
+    try:
+        version = schema_version(conn)
+    finally:
+        conn.close()
+    if version != SCHEMA_VERSION:
+        sys.exit(f"Database is at schema version {version}, expected {SCHEMA_VERSION}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Quiz app setup")
+    parser.add_argument('command', choices=['migrate', 'init', 'assets', 'analytics-backfill'])
+    args = parser.parse_args()
+
+    if args.command == 'assets':
+        from assets import static_assets, BUILD_DIR
+        static_assets.build()
+        print(f"Wrote {len(static_assets.write())} files to {BUILD_DIR}")
+        return
+
+    if args.command == 'analytics-backfill':
+        from analytics import backfill_rollups
+        check_version()
+        conn = open_connection()
+        try:
+            print(f"Backfilled {backfill_rollups(conn)} daily rollup rows")
+        finally:
+            conn.close()
+        return
+
+    # The ORM is only needed here, never by the app workers
+    import database
+
+    if args.command == 'migrate':
+        database.create_schema()
+    else:
+        database.init_db()
+        database.create_sample_questions()
+    check_version()
+
+if __name__ == "__main__":
+    main()
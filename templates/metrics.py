@@ -0,0 +1,258 @@
+"""In-process request and SQL metrics, rendered in Prometheus text format.
+
+Requests are timed by the before/after hooks in app.py. SQL is measured in
+two ways. Pooled sqlite3 connections are opened as InstrumentedConnection:
+its cursors time every execute(), and its trace callback counts every
+statement SQLite runs, including the implicit BEGIN/COMMIT and trigger bodies.
+The SQLAlchemy engine in database.py reports through engine events.
+
+Statements are grouped by fingerprint: the SQL with literals replaced by `?`
+and placeholder lists collapsed, computed outside the lock. Everything is a counter or a fixed-bucket
+histogram behind one lock, so recording a sample is a dict lookup and a few
+additions. Statements slower than the event log's threshold are also
+recorded there as slow_query events.
+"""
+import bisect
+import re
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+from eventlog import event_log
+
+# Upper bounds in seconds; +Inf is implicit
+REQUEST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SQL_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+MAX_STATEMENTS = 500  # distinct fingerprints tracked; the rest are counted as "other"
+FINGERPRINT_LENGTH = 200
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDERS = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+
+def normalize(sql):
+    """Normalized statement text used as the metric label"""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    sql = _PLACEHOLDERS.sub('(?)', sql)
+    sql = _ROWS.sub('(?), ...', sql)
+    return sql[:FINGERPRINT_LENGTH]
+
+# Cursors pass the statement as written, with placeholders, so the same few
+# hundred strings repeat. The trace callback sees it with the values expanded,
+# which would only churn this cache, and calls normalize() directly.
+fingerprint = lru_cache(maxsize=4096)(normalize)
+
+class Histogram:
+    """Fixed-bucket histogram; not locked itself, the registry holds the lock"""
+
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(**labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+class Metrics:
+    """Process-wide request and SQL metrics"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.in_flight = 0
+        self.requests = {}  # (endpoint, method) -> Histogram
+        self.responses = {}  # (endpoint, method, status) -> count
+        self.sql_durations = {}  # fingerprint -> Histogram
+        self.sql_statements = {}  # fingerprint -> statements seen by the trace callback
+        self.write_batches = Histogram(BATCH_BUCKETS)  # operations per group commit
+        self.write_commits = Histogram(REQUEST_BUCKETS)  # seconds per group commit
+        self.gauges = {}  # name -> (help, callable read at render time)
+
+    def gauge(self, name, help, read):
+        """Report read() as a gauge on every render"""
+        self.gauges[name] = (help, read)
+
+    def request_started(self):
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def observe_request(self, endpoint, method, status, seconds):
+        key = (endpoint, method)
+        with self._lock:
+            histogram = self.requests.get(key)
+            if histogram is None:
+                histogram = self.requests[key] = Histogram(REQUEST_BUCKETS)
+            histogram.observe(seconds)
+            status_key = (endpoint, method, status)
+            self.responses[status_key] = self.responses.get(status_key, 0) + 1
+
+    @staticmethod
+    def _statement_key(table, statement):
+        if statement not in table and len(table) >= MAX_STATEMENTS:
+            return 'other'
+        return statement
+
+    def observe_sql(self, sql, seconds):
+        # Normalized before taking the lock, which every statement contends for
+        statement = fingerprint(sql)
+        with self._lock:
+            statement = self._statement_key(self.sql_durations, statement)
+            histogram = self.sql_durations.get(statement)
+            if histogram is None:
+                histogram = self.sql_durations[statement] = Histogram(SQL_BUCKETS)
+            histogram.observe(seconds)
+        event_log.slow_query(sql, seconds)
+
+    def observe_write_batch(self, operations, seconds):
+        with self._lock:
+            self.write_batches.observe(operations)
+            self.write_commits.observe(seconds)
+
+    def trace(self, sql):
+        """sqlite3 trace callback: count every statement the library runs"""
+        statement = normalize(sql)
+        with self._lock:
+            statement = self._statement_key(self.sql_statements, statement)
+            self.sql_statements[statement] = self.sql_statements.get(statement, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.responses.clear()
+            self.sql_durations.clear()
+            self.sql_statements.clear()
+            self.write_batches = Histogram(BATCH_BUCKETS)
+            self.write_commits = Histogram(REQUEST_BUCKETS)
+
+    def render(self):
+        """Everything in Prometheus text exposition format"""
+        with self._lock:
+            requests = {key: _copy(histogram) for key, histogram in self.requests.items()}
+            responses = dict(self.responses)
+            sql_durations = {key: _copy(histogram) for key, histogram in self.sql_durations.items()}
+            sql_statements = dict(self.sql_statements)
+            in_flight = self.in_flight
+            write_batches = _copy(self.write_batches)
+            write_commits = _copy(self.write_commits)
+
+        lines = [
+            '# HELP quiz_uptime_seconds Seconds since the process started.',
+            '# TYPE quiz_uptime_seconds gauge',
+            f'quiz_uptime_seconds {time.time() - self.started:.3f}',
+            '# HELP quiz_http_requests_in_flight Requests currently being handled.',
+            '# TYPE quiz_http_requests_in_flight gauge',
+            f'quiz_http_requests_in_flight {in_flight}',
+            '# HELP quiz_http_responses_total Responses by endpoint, method and status code.',
+            '# TYPE quiz_http_responses_total counter',
+        ]
+        for (endpoint, method, status), count in sorted(responses.items()):
+            lines.append(f'quiz_http_responses_total{_labels(endpoint=endpoint, method=method, status=status)} {count}')
+
+        lines += [
+            '# HELP quiz_http_request_duration_seconds Request latency by endpoint and method.',
+            '# TYPE quiz_http_request_duration_seconds histogram',
+        ]
+        for (endpoint, method), histogram in sorted(requests.items()):
+            _render_histogram(lines, 'quiz_http_request_duration_seconds', histogram, endpoint=endpoint, method=method)
+
+        lines += [
+            '# HELP quiz_sql_duration_seconds Time spent executing statements, by fingerprint.',
+            '# TYPE quiz_sql_duration_seconds histogram',
+        ]
+        for statement, histogram in sorted(sql_durations.items()):
+            _render_histogram(lines, 'quiz_sql_duration_seconds', histogram, statement=statement)
+
+        lines += [
+            '# HELP quiz_sql_statements_total Statements run by SQLite, including transaction control and triggers.',
+            '# TYPE quiz_sql_statements_total counter',
+        ]
+        for statement, count in sorted(sql_statements.items()):
+            lines.append(f'quiz_sql_statements_total{_labels(statement=statement)} {count}')
+
+        lines += [
+            '# HELP quiz_write_batch_operations Write operations committed per group commit.',
+            '# TYPE quiz_write_batch_operations histogram',
+        ]
+        _render_histogram(lines, 'quiz_write_batch_operations', write_batches)
+        lines += [
+            '# HELP quiz_write_commit_seconds Time to run and commit one group of writes.',
+            '# TYPE quiz_write_commit_seconds histogram',
+        ]
+        _render_histogram(lines, 'quiz_write_commit_seconds', write_commits)
+
+        for name, (help, read) in sorted(self.gauges.items()):
+            lines += [f'# HELP {name} {help}', f'# TYPE {name} gauge', f'{name} {read()}']
+        return '\n'.join(lines) + '\n'
+
+def _copy(histogram):
+    copy = Histogram(histogram.buckets)
+    copy.counts = list(histogram.counts)
+    copy.sum = histogram.sum
+    copy.count = histogram.count
+    return copy
+
+def _render_histogram(lines, name, histogram, **labels):
+    cumulative = 0
+    for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{_labels(**labels, le=bound)} {cumulative}')
+    lines.append(f'{name}_sum{_labels(**labels)} {histogram.sum:.6f}')
+    lines.append(f'{name}_count{_labels(**labels)} {histogram.count}')
+
+metrics = Metrics()
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that times each statement it executes"""
+
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            metrics.observe_sql(sql, time.perf_counter() - started)
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            metrics.observe_sql(sql, time.perf_counter() - started)
+
+class InstrumentedConnection(sqlite3.Connection):
+    """sqlite3 connection whose statements are timed and counted in `metrics`"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.set_trace_callback(metrics.trace)
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
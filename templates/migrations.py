@@ -0,0 +1,300 @@
+"""Versioned schema migrations.
+
+SQLAlchemy's create_all creates the `advanced_*` tables first; these steps
+then evolve the schema in place. The schema version is kept in SQLite's
+`PRAGMA user_version`. Each migration runs in its own transaction and bumps
+the version, so `migrate()` is safe to re-run and only does work when the
+schema is behind. It runs as an explicit deploy step (templates/manage.py);
+app workers only compare the version with `require_schema()`.
+"""
+
+def add_missing_column(cur, table, column, definition):
+    """ALTER TABLE ... ADD COLUMN unless the column already exists"""
+    cur.execute(f"PRAGMA table_info({table})")
+    if column not in [row[1] for row in cur.fetchall()]:
+        cur.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+def create_base_tables(cur):
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS questions(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        question TEXT,
+        options TEXT,
+        correct INTEGER,
+        difficulty TEXT
+    )""")
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS scores(
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT,
+        score INTEGER,
+        total INTEGER,
+        time INTEGER,
+        created TEXT
+    )""")
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS quiz_session_state(
+        id TEXT PRIMARY KEY,
+        state TEXT NOT NULL,
+        expires REAL NOT NULL
+    )""")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_quiz_session_state_expires ON quiz_session_state(expires)")
+
+def add_category_columns(cur):
+    add_missing_column(cur, "questions", "category", "TEXT NOT NULL DEFAULT 'General'")
+    add_missing_column(cur, "scores", "difficulty", "TEXT")
+    add_missing_column(cur, "scores", "category", "TEXT")
+
+def add_read_indexes(cur):
+    # Leaderboards: ORDER BY score DESC, id DESC walks these backwards
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_score ON scores(score)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_difficulty_score ON scores(difficulty, score)")
+    # Per-user aggregates: covers GROUP BY username with MAX(created)/score/total
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_username_created ON scores(username, created, score, total)")
+    # Recent activity, logs, exports and date-range analytics
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_created ON scores(created)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_questions_difficulty_category ON questions(difficulty, category)")
+
+def add_stats_counters(cur):
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS stats_counters(
+        name TEXT PRIMARY KEY,
+        value NUMERIC NOT NULL DEFAULT 0
+    )""")
+    # The old submit_answer wrote a scores row with time = 0 after every answer;
+    # only the row written at completion carries the time taken
+    cur.execute("""
+    INSERT OR REPLACE INTO stats_counters (name, value)
+    SELECT 'questions', COUNT(*) FROM questions
+    UNION ALL SELECT 'players', COUNT(DISTINCT username) FROM scores WHERE time > 0
+    UNION ALL SELECT 'quizzes', COUNT(*) FROM scores WHERE time > 0
+    UNION ALL SELECT 'answers', COALESCE(SUM(total), 0) FROM scores WHERE time > 0
+    UNION ALL SELECT 'accuracy_sum', COALESCE(SUM(score * 100.0 / total), 0) FROM scores WHERE time > 0 AND total > 0
+    UNION ALL SELECT 'accuracy_count', COUNT(*) FROM scores WHERE time > 0 AND total > 0
+    """)
+
+def add_analytics_rollups(cur):
+    for table, column in (("analytics_daily", "day"), ("analytics_hourly", "hour")):
+        cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {table}(
+            {column} TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            category TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            completions INTEGER NOT NULL DEFAULT 0,
+            accuracy_sum REAL NOT NULL DEFAULT 0,
+            time_sum INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY ({column}, difficulty, category)
+        ) WITHOUT ROWID""")
+
+def add_user_aggregates(cur):
+    # advanced_users is created by SQLAlchemy before migrations run
+    add_missing_column(cur, "advanced_users", "last_activity", "DATETIME")
+    # Rebuild every player's aggregates from the completed quizzes in the scores
+    # history; per-answer snapshot rows (time = 0) are not quizzes
+    cur.execute("""
+    INSERT INTO advanced_users
+        (username, is_active, total_quizzes, total_score, best_score, average_accuracy,
+         total_time_spent, streak_count, longest_streak, level, experience_points,
+         created_at, last_activity)
+    SELECT username, 1, COUNT(*), SUM(score), MAX(score),
+           COALESCE(AVG(CASE WHEN total > 0 THEN score * 100.0 / total END), 0),
+           COALESCE(SUM(time), 0), 0, 0, 1 + SUM(score) / 100, SUM(score),
+           MIN(created), MAX(created)
+    FROM scores
+    WHERE username IS NOT NULL AND time > 0
+    GROUP BY username
+    ON CONFLICT(username) DO UPDATE SET
+        total_quizzes = excluded.total_quizzes,
+        total_score = excluded.total_score,
+        best_score = excluded.best_score,
+        average_accuracy = excluded.average_accuracy,
+        total_time_spent = excluded.total_time_spent,
+        level = excluded.level,
+        experience_points = excluded.experience_points,
+        last_activity = excluded.last_activity
+    """)
+    # Keyset pagination orders for /api/admin/users
+    for column in ("total_quizzes", "best_score", "average_accuracy", "last_activity"):
+        cur.execute(f"CREATE INDEX IF NOT EXISTS idx_advanced_users_{column} ON advanced_users({column}, id)")
+
+def table_exists(cur, table):
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+    return cur.fetchone() is not None
+
+def unify_legacy_tables(cur):
+    """Move the legacy questions/scores rows into the advanced_* tables and drop them"""
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_sessions_user_completed ON advanced_quiz_sessions(user_id, completed_at)")
+
+    if table_exists(cur, "questions"):
+        # Move the ORM questions above every legacy id
+        cur.execute("""
+        UPDATE advanced_questions SET id = id + (
+            SELECT MAX(COALESCE((SELECT MAX(id) FROM questions), 0),
+                       COALESCE((SELECT MAX(id) FROM advanced_questions), 0))
+        )""")
+        # The two sample seeds overlap. A duplicate keeps the legacy id, which quiz
+        # attempts reference, and its answer, but takes the ORM copy's category,
+        # explanation, points and time limit; the legacy table never had those
+        cur.execute("""
+        INSERT INTO advanced_questions
+            (id, question, options, correct, difficulty, category, explanation, points, time_limit,
+             is_active, created_at, updated_at)
+        SELECT q.id, q.question, q.options, q.correct, COALESCE(q.difficulty, 'medium'),
+               COALESCE(NULLIF(q.category, 'General'), a.category, 'General'),
+               a.explanation, COALESCE(a.points, 10), COALESCE(a.time_limit, 30), COALESCE(a.is_active, 1),
+               COALESCE(a.created_at, CURRENT_TIMESTAMP), CURRENT_TIMESTAMP
+        FROM questions q
+        LEFT JOIN advanced_questions a
+            ON a.id = (SELECT MIN(d.id) FROM advanced_questions d WHERE d.question = q.question)
+        """)
+        cur.execute("""
+        DELETE FROM advanced_questions
+        WHERE id NOT IN (SELECT id FROM questions) AND question IN (SELECT question FROM questions)
+        """)
+        cur.execute("DROP TABLE questions")
+
+    if table_exists(cur, "scores"):
+        # Players that only exist in the history (normally all were added by migration 6)
+        cur.execute("""
+        INSERT INTO advanced_users
+            (username, is_active, total_quizzes, total_score, best_score, average_accuracy,
+             total_time_spent, streak_count, longest_streak, level, experience_points,
+             created_at, last_activity)
+        SELECT username, 1, COUNT(*), SUM(score), MAX(score),
+               COALESCE(AVG(CASE WHEN total > 0 THEN score * 100.0 / total END), 0),
+               COALESCE(SUM(time), 0), 0, 0, 1 + SUM(score) / 100, SUM(score),
+               MIN(created), MAX(created)
+        FROM scores
+        WHERE username IS NOT NULL AND time > 0
+        GROUP BY username
+        ON CONFLICT(username) DO NOTHING
+        """)
+        # Only completed quizzes (time > 0), not the per-answer snapshot rows.
+        # Quizzes completed since per-answer writes stopped already have a session row
+        cur.execute("""
+        INSERT INTO advanced_quiz_sessions
+            (user_id, session_token, difficulty, category, total_questions, score, total_possible,
+             accuracy, time_taken, streak_count, started_at, completed_at, is_completed)
+        SELECT u.id, 'legacy-' || s.id, COALESCE(s.difficulty, 'unknown'), s.category, s.total, s.score, s.total,
+               CASE WHEN s.total > 0 THEN MIN(100.0, s.score * 100.0 / s.total) ELSE 0 END,
+               s.time, 0, s.created, s.created, 1
+        FROM scores s
+        JOIN advanced_users u ON u.username = s.username
+        WHERE s.created IS NOT NULL AND s.time > 0 AND NOT EXISTS (
+            SELECT 1 FROM advanced_quiz_sessions q
+            WHERE q.user_id = u.id
+              AND q.completed_at BETWEEN s.created AND s.created || '.999999'
+              AND q.score = s.score
+              AND q.total_questions = s.total
+        )
+        ORDER BY s.id
+        """)
+        cur.execute("DROP TABLE scores")
+
+    # Read indexes for the leaderboards, rankings, recent activity and exports
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_sessions_score ON advanced_quiz_sessions(score, completed_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_sessions_difficulty_score ON advanced_quiz_sessions(difficulty, score, completed_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_sessions_completed ON advanced_quiz_sessions(completed_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_advanced_questions_difficulty_category ON advanced_questions(difficulty, category)")
+
+    cur.execute("""
+    UPDATE stats_counters SET value = CASE name
+        WHEN 'questions' THEN (SELECT COUNT(*) FROM advanced_questions)
+        WHEN 'players' THEN (SELECT COUNT(*) FROM advanced_users)
+        WHEN 'quizzes' THEN (SELECT COUNT(*) FROM advanced_quiz_sessions)
+        WHEN 'accuracy_sum' THEN (SELECT COALESCE(SUM(accuracy), 0) FROM advanced_quiz_sessions WHERE total_questions > 0)
+        WHEN 'accuracy_count' THEN (SELECT COUNT(*) FROM advanced_quiz_sessions WHERE total_questions > 0)
+        ELSE value
+    END
+    """)
+
+def add_question_listing_indexes(cur):
+    # Admin question listing: each filter walks (filter, rowid) backwards from the cursor
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_advanced_questions_difficulty ON advanced_questions(difficulty)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_advanced_questions_category ON advanced_questions(category)")
+    # Case-insensitive text prefix search (LIKE 'prefix%' becomes a range scan)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_advanced_questions_question ON advanced_questions(question COLLATE NOCASE)")
+
+def add_data_versions(cur):
+    # Per-table change counters behind the HTTP ETag / Last-Modified headers
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS data_versions(
+        name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        changed_at INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID""")
+    for table in ("advanced_questions", "advanced_quiz_sessions"):
+        cur.execute(
+            "INSERT OR IGNORE INTO data_versions (name, version, changed_at) "
+            "VALUES (?, 1, CAST(strftime('%s', 'now') AS INTEGER))",
+            (table,)
+        )
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cur.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE data_versions
+                SET version = version + 1, changed_at = CAST(strftime('%s', 'now') AS INTEGER)
+                WHERE name = '{table}';
+            END""")
+
+def add_user_achievement_unique(cur):
+    # One row per user and achievement, so awards can be bulk-inserted with ON CONFLICT DO NOTHING
+    cur.execute("""
+    DELETE FROM advanced_user_achievements
+    WHERE id NOT IN (SELECT MIN(id) FROM advanced_user_achievements GROUP BY user_id, achievement_id)
+    """)
+    cur.execute("""
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_user_achievements_user_achievement
+    ON advanced_user_achievements(user_id, achievement_id)
+    """)
+
+# (version, description, function) - append only, never edit a released step
+MIGRATIONS = [
+    (1, "base tables", create_base_tables),
+    (2, "category and difficulty columns", add_category_columns),
+    (3, "read indexes", add_read_indexes),
+    (4, "stats counters", add_stats_counters),
+    (5, "analytics rollups", add_analytics_rollups),
+    (6, "per-user aggregates", add_user_aggregates),
+    (7, "unify legacy tables into advanced_* tables", unify_legacy_tables),
+    (8, "question listing indexes", add_question_listing_indexes),
+    (9, "data version counters", add_data_versions),
+    (10, "unique user achievements", add_user_achievement_unique),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def schema_version(conn):
+    """Current schema version of the database"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+def require_schema(conn):
+    """Fail fast when the database has not been migrated to this code's schema"""
+    version = schema_version(conn)
+    if version != SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema is at version {version}, expected {SCHEMA_VERSION}; "
+            "run `python templates/manage.py migrate` first"
+        )
+
+def migrate(conn, target=SCHEMA_VERSION):
+    """Apply every pending migration up to `target`; returns the versions applied"""
+    applied = []
+    for version, description, step in MIGRATIONS:
+        if version > target or version <= schema_version(conn):
+            continue
+        with conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            step(cur)
+            cur.execute(f"PRAGMA user_version = {version}")
+        applied.append(version)
+        print(f"Applied migration {version}: {description}")
+
+    if applied:
+        # Refresh planner statistics so the new indexes get used
+        conn.execute("ANALYZE")
+    return applied
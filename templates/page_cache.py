@@ -0,0 +1,49 @@
+"""Render-once cache for pages whose HTML does not change per request.
+
+A page is rendered (or read) on first use, minified, and kept as an Asset
+with its gzip/brotli variants and ETag, so serving it again is a dictionary
+lookup. With `reload` on (debug mode), the template file's mtime is checked
+on each hit and the page is rebuilt after an edit.
+"""
+import os
+import threading
+
+from assets import Asset
+
+def minify_html(html):
+    """Drop indentation and blank lines.
+
+    Only safe for pages without <pre>/<textarea> content, which is true of
+    every page cached here; newlines are kept so inline scripts still parse
+    the same way.
+    """
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip()) + '\n'
+
+class PageCache:
+    """Minified, precompressed pages keyed by (template, context)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pages = {}  # key -> (source mtime, Asset)
+
+    def get(self, key, source, render, reload=False):
+        """The cached page for key, rendering it with render() when missing or stale"""
+        with self._lock:
+            entry = self._pages.get(key)
+        if entry and not reload:
+            return entry[1]
+
+        mtime = os.stat(source).st_mtime_ns
+        if entry and entry[0] == mtime:
+            return entry[1]
+
+        page = Asset(os.path.basename(source), minify_html(render()).encode())
+        with self._lock:
+            self._pages[key] = (mtime, page)
+        return page
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+
+page_cache = PageCache()
@@ -0,0 +1,40 @@
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(*values):
+    """Opaque, URL-safe cursor for the last row of a page"""
+    raw = json.dumps(values, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """Values packed by encode_cursor; raises ValueError on a malformed cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+def page_size(value, default=DEFAULT_PAGE_SIZE):
+    """Clamp a requested page size to 1..MAX_PAGE_SIZE"""
+    return max(1, min(int(value or default), MAX_PAGE_SIZE))
+
+def keyset_condition(columns, descending):
+    """WHERE fragment selecting rows strictly after the cursor in sort order.
+
+    Uses a row-value comparison so SQLite can seek straight into a composite
+    index on `columns`.
+    """
+    operator = '<' if descending else '>'
+    placeholders = ', '.join('?' for _ in columns)
+    return f"({', '.join(columns)}) {operator} ({placeholders})"
+
+def like_prefix(text):
+    """LIKE pattern (with ESCAPE '\\') matching values that start with text"""
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + '%'
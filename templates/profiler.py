@@ -0,0 +1,198 @@
+"""On-demand profiling of live requests.
+
+An admin turns profiling on for a limited time, for a fraction of requests
+and optionally only some routes, in one of two modes:
+
+- "sample": a background thread reads the stacks of the threads serving the
+  chosen requests every few milliseconds and counts them as collapsed stacks
+  (`frame;frame;frame count`), ready for flamegraph.pl or speedscope.
+- "cprofile": the chosen requests run under cProfile and their stats are
+  merged, exportable as a pstats file.
+
+When profiling is off, a request pays one attribute check.
+
+State is per process. Under a pre-fork server each worker has its own
+profiler: an admin request turns it on in whichever worker served it, and
+the results cover only that worker's traffic. Status and exports carry the
+worker's pid so a report can be matched to the session that produced it.
+"""
+import cProfile
+import marshal
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+
+MODES = ('sample', 'cprofile')
+DEFAULT_INTERVAL = 0.005  # seconds between stack samples
+MIN_INTERVAL = 0.001
+MAX_DURATION = 600  # seconds profiling may stay on
+MAX_STACK_DEPTH = 128
+MAX_STACKS = 20000  # distinct stacks kept; further new stacks are counted as truncated
+
+class Profiler:
+    """Profiling session state plus the aggregated results"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.enabled = False
+        self._session = 0
+        self._reset(mode='sample', rate=1.0, routes=None, interval=DEFAULT_INTERVAL, until=0)
+
+    def _reset(self, mode, rate, routes, interval, until):
+        self.mode = mode
+        self.rate = rate
+        self.routes = routes
+        self.interval = interval
+        self.until = until
+        self.requests = 0
+        self.samples = 0
+        self.truncated = 0
+        self._stacks = {}  # collapsed stack -> samples
+        self._active = {}  # thread id -> requests being sampled on it
+        self._stats = None  # merged pstats.Stats
+        self._labels = {}  # code object -> frame label
+
+    def enable(self, mode='sample', rate=1.0, routes=None, duration=60, interval=DEFAULT_INTERVAL):
+        """Start a profiling session, discarding the previous results"""
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {list(MODES)}")
+        if not 0 < rate <= 1:
+            raise ValueError("rate must be in (0, 1]")
+        if not 0 < duration <= MAX_DURATION:
+            raise ValueError(f"duration must be between 0 and {MAX_DURATION} seconds")
+        interval = max(interval, MIN_INTERVAL)
+        with self._lock:
+            self._reset(mode, rate, set(routes) if routes else None, interval, time.time() + duration)
+            self.enabled = True
+            self._session += 1
+            session = self._session
+        if mode == 'sample':
+            threading.Thread(target=self._sample_loop, args=(session,), name="profiler", daemon=True).start()
+
+    def disable(self):
+        with self._lock:
+            self.enabled = False
+
+    def _expired(self):
+        if self.enabled and time.time() >= self.until:
+            self.enabled = False
+        return not self.enabled
+
+    # ---- per request ----
+
+    def start_request(self, route):
+        """Begin profiling this request if it is selected; returns a token for finish_request"""
+        if not self.enabled or self._expired():
+            return None
+        if self.routes is not None and route not in self.routes:
+            return None
+        if self.rate < 1 and random.random() >= self.rate:
+            return None
+
+        if self.mode == 'cprofile':
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler is already active (Python 3.12+ allows only one)
+                return None
+            return profile
+
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._active[thread_id] = self._active.get(thread_id, 0) + 1
+        return thread_id
+
+    def finish_request(self, token):
+        if token is None:
+            return
+        if isinstance(token, cProfile.Profile):
+            token.disable()
+            with self._lock:
+                self.requests += 1
+                if self._stats is None:
+                    self._stats = pstats.Stats(token)
+                else:
+                    self._stats.add(token)
+            return
+
+        with self._lock:
+            self.requests += 1
+            remaining = self._active.get(token, 0) - 1
+            if remaining > 0:
+                self._active[token] = remaining
+            else:
+                self._active.pop(token, None)
+
+    # ---- stack sampling ----
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def _sample_loop(self, session):
+        # Ends with its session: on expiry, disable() or a newer enable()
+        while session == self._session and not self._expired():
+            time.sleep(self.interval)
+            with self._lock:
+                threads = list(self._active)
+            if not threads:
+                continue
+            frames = sys._current_frames()
+            collapsed = []
+            for thread_id in threads:
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                if stack:
+                    collapsed.append(';'.join(reversed(stack)))
+            with self._lock:
+                for stack in collapsed:
+                    self.samples += 1
+                    if stack in self._stacks:
+                        self._stacks[stack] += 1
+                    elif len(self._stacks) < MAX_STACKS:
+                        self._stacks[stack] = 1
+                    else:
+                        self.truncated += 1
+
+    # ---- results ----
+
+    def collapsed(self):
+        """Sampled stacks in collapsed format, most frequent first"""
+        with self._lock:
+            stacks = sorted(self._stacks.items(), key=lambda item: item[1], reverse=True)
+        return ''.join(f"{stack} {count}\n" for stack, count in stacks)
+
+    def pstats_dump(self):
+        """Merged cProfile stats in the binary format pstats.Stats() loads, or None"""
+        with self._lock:
+            if self._stats is None:
+                return None
+            return marshal.dumps(self._stats.stats)
+
+    def status(self):
+        with self._lock:
+            self._expired()
+            return {
+                'pid': os.getpid(),
+                'enabled': self.enabled,
+                'mode': self.mode,
+                'rate': self.rate,
+                'routes': sorted(self.routes) if self.routes else None,
+                'interval_ms': round(self.interval * 1000, 3),
+                'seconds_left': max(0, round(self.until - time.time(), 1)) if self.enabled else 0,
+                'requests_profiled': self.requests,
+                'samples': self.samples,
+                'distinct_stacks': len(self._stacks),
+                'truncated_samples': self.truncated
+            }
+
+profiler = Profiler()
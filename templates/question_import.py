@@ -0,0 +1,114 @@
+import codecs
+import csv
+import json
+
+from repository import insert_questions
+from stats import bump_counters
+from validation import validate_question
+
+IMPORT_BATCH_SIZE = 1000  # validated rows per executemany
+MAX_REPORTED_ERRORS = 100  # row errors returned to the caller; the rest are only counted
+IMPORT_FORMATS = ('jsonl', 'csv')
+
+def detect_format(filename, requested=None):
+    """Upload format from an explicit choice or the file extension"""
+    fmt = requested or (filename.rsplit('.', 1)[-1] if filename and '.' in filename else '')
+    fmt = fmt.lower()
+    if fmt == 'json':
+        fmt = 'jsonl'
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Import format must be one of: {list(IMPORT_FORMATS)}")
+    return fmt
+
+def text_lines(stream, encoding='utf-8'):
+    """Decode a binary upload stream line by line without reading it all"""
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    pending = ''
+    for chunk in iter(lambda: stream.read(64 * 1024), b''):
+        pending += decoder.decode(chunk)
+        lines = pending.splitlines(keepends=True)
+        # The last piece may be an incomplete line - keep it for the next chunk
+        pending = lines.pop() if lines and not lines[-1].endswith(('\n', '\r')) else ''
+        yield from lines
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+def parse_jsonl(lines):
+    """Yield (line number, record or ValueError) for each non-blank line"""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except ValueError as e:
+            yield number, ValueError(f"Invalid JSON: {e}")
+
+def parse_csv(lines):
+    """Yield (row number, record or ValueError) for each CSV data row.
+
+    Options are a JSON array or a `|`-separated list; numeric columns are
+    converted so the shared validators see the same types as JSONL.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        number = reader.line_num
+        try:
+            options = (row.get('options') or '').strip()
+            row['options'] = json.loads(options) if options.startswith('[') else options.split('|')
+            for column in ('correct', 'points', 'time_limit'):
+                if row.get(column):
+                    row[column] = int(row[column])
+            yield number, row
+        except ValueError as e:
+            yield number, ValueError(f"Invalid value: {e}")
+
+PARSERS = {'jsonl': parse_jsonl, 'csv': parse_csv}
+
+def read_questions(stream, fmt):
+    """Parse and validate a whole upload without touching the database.
+
+    Returns (valid records, failed row count, reported errors).
+    """
+    records = []
+    failed = 0
+    errors = []
+    for number, record in PARSERS[fmt](text_lines(stream)):
+        try:
+            if isinstance(record, Exception):
+                raise record
+            records.append(validate_question(record))
+        except (ValueError, TypeError) as e:
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append({'row': number, 'error': str(e)})
+    return records, failed, errors
+
+def insert_batch(cur, records):
+    """Writer operation: insert one batch and count it in the stats"""
+    imported = insert_questions(cur, records)
+    bump_counters(cur, questions=imported)
+    return imported
+
+def import_questions(writer, stream, fmt, batch_size=IMPORT_BATCH_SIZE):
+    """Validate every row of an upload, then insert the valid ones through the writer.
+
+    The upload is read in full before anything is written, so a slow or
+    aborted client never holds the write lock. Each batch is one writer
+    operation, committed alongside the players' writes, so a large import
+    never blocks quiz completions for longer than one batch. Invalid rows
+    are skipped and reported.
+    """
+    records, failed, errors = read_questions(stream, fmt)
+
+    imported = 0
+    for offset in range(0, len(records), batch_size):
+        try:
+            imported += writer.run(insert_batch, records[offset:offset + batch_size])
+        except Exception as e:
+            # Earlier batches are committed; report the rest as failed
+            failed += len(records) - offset
+            errors.append({'row': None, 'error': f"Import stopped after {imported} questions: {e}"})
+            break
+
+    return {'imported': imported, 'failed': failed, 'errors': errors}
@@ -0,0 +1,106 @@
+import random
+import threading
+
+from repository import load_questions
+
+# Bucket category used for "any category" lookups
+ALL_CATEGORIES = 'all'
+
+class QuestionIndex:
+    """Process-local copy of the question bank, bucketed by (difficulty, category).
+
+    Every question lives in its own (difficulty, category) bucket and in the
+    (difficulty, 'all') bucket. Buckets are plain lists with a position map so
+    questions can be added and removed in O(1), and a random sample of k
+    questions costs O(k) without touching the database.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._questions = {}  # id -> question record
+        self._buckets = {}  # (difficulty, category) -> list of ids
+        self._positions = {}  # (bucket key, id) -> index in that bucket
+
+    def load(self, conn):
+        """Rebuild the whole index from the active questions.
+
+        The new buckets are built off to the side and swapped in under the
+        lock, so quizzes keep sampling from the old bank until then.
+        """
+        fresh = QuestionIndex()
+        for question in load_questions(conn.cursor()):
+            fresh._insert(question)
+
+        with self._lock:
+            self._questions = fresh._questions
+            self._buckets = fresh._buckets
+            self._positions = fresh._positions
+        return len(fresh._questions)
+
+    def add(self, question):
+        """Add or replace a single question record"""
+        with self._lock:
+            self._delete(question['id'])
+            self._insert(question)
+
+    def remove(self, question_id):
+        """Drop a question from the index if present"""
+        with self._lock:
+            self._delete(question_id)
+
+    def sample(self, difficulty, category=ALL_CATEGORIES, k=10):
+        """Uniform random sample of up to k questions for a difficulty/category"""
+        with self._lock:
+            bucket = self._buckets.get((difficulty, category or ALL_CATEGORIES), [])
+            ids = random.sample(bucket, min(k, len(bucket)))
+            return [dict(self._questions[qid]) for qid in ids]
+
+    def get(self, question_id):
+        """Look up one question record by id"""
+        with self._lock:
+            question = self._questions.get(question_id)
+            return dict(question) if question else None
+
+    def category_counts(self):
+        """Number of questions per category, largest first"""
+        counts = {}
+        with self._lock:
+            for (difficulty, category), bucket in self._buckets.items():
+                if category != ALL_CATEGORIES:
+                    counts[category] = counts.get(category, 0) + len(bucket)
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def __len__(self):
+        return len(self._questions)
+
+    # Internal helpers - callers must hold the lock
+
+    def _bucket_keys(self, question):
+        return (
+            (question['difficulty'], question['category']),
+            (question['difficulty'], ALL_CATEGORIES)
+        )
+
+    def _insert(self, question):
+        self._questions[question['id']] = question
+        for key in self._bucket_keys(question):
+            bucket = self._buckets.setdefault(key, [])
+            self._positions[(key, question['id'])] = len(bucket)
+            bucket.append(question['id'])
+
+    def _delete(self, question_id):
+        question = self._questions.pop(question_id, None)
+        if question is None:
+            return
+        for key in self._bucket_keys(question):
+            bucket = self._buckets[key]
+            pos = self._positions.pop((key, question_id))
+            last_id = bucket.pop()
+            # Swap the last id into the freed slot to keep removal O(1)
+            if last_id != question_id:
+                bucket[pos] = last_id
+                self._positions[(key, last_id)] = pos
+            if not bucket:
+                del self._buckets[key]
+
+question_index = QuestionIndex()
@@ -0,0 +1,163 @@
+import bisect
+import threading
+
+from leaderboard import OVERALL
+from repository import best_scores
+
+INITIAL_BUCKETS = 64  # score buckets before the tree needs to grow
+NEIGHBOURS = 3
+MAX_NEIGHBOURS = 25  # per direction, for /api/leaderboard/rank
+
+class FenwickTree:
+    """Binary indexed tree of counts over integer buckets 0..size-1"""
+
+    def __init__(self, size):
+        self.size = size
+        self._tree = [0] * (size + 1)
+
+    def add(self, bucket, delta):
+        i = bucket + 1
+        while i <= self.size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, bucket):
+        """Total count in buckets 0..bucket inclusive"""
+        i = min(bucket, self.size - 1) + 1
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+class ScoreRanking:
+    """Order statistics over each player's best score on one board.
+
+    A Fenwick tree over score buckets answers "how many players beat this
+    score" in O(log n); the players in each bucket are kept for neighbour
+    lookups.
+    """
+
+    def __init__(self):
+        self.best = {}  # username -> best score
+        self._tree = FenwickTree(INITIAL_BUCKETS)
+        self._players = {}  # score -> set of usernames with that best score
+        self._scores = []  # sorted distinct scores that have players
+
+    def record(self, username, score):
+        """Account for a new score; returns True if it is a personal best"""
+        previous = self.best.get(username)
+        if previous is not None and score <= previous:
+            return False
+        if previous is not None:
+            self._remove(username, previous)
+        self._add(username, score)
+        return True
+
+    def rank(self, username, neighbours=NEIGHBOURS):
+        """Rank, percentile and nearby players for one username, or None"""
+        score = self.best.get(username)
+        if score is None:
+            return None
+
+        total = len(self.best)
+        at_or_below = self._tree.prefix(score)
+        below = self._tree.prefix(score - 1) if score > 0 else 0
+        above = total - at_or_below
+        return {
+            'best_score': score,
+            'rank': above + 1,
+            'players': total,
+            'percentile': round(below * 100.0 / (total - 1), 2) if total > 1 else 100.0,
+            'above': self._walk(score, neighbours, upwards=True),
+            'tied': [name for name in self._take(self._players[score], neighbours + 1) if name != username][:neighbours],
+            'below': self._walk(score, neighbours, upwards=False)
+        }
+
+    def _walk(self, score, count, upwards):
+        # Collect the nearest players with strictly higher (or lower) best scores
+        pos = bisect.bisect_right(self._scores, score) if upwards else bisect.bisect_left(self._scores, score) - 1
+        step = 1 if upwards else -1
+        found = []
+        while 0 <= pos < len(self._scores) and len(found) < count:
+            bucket = self._scores[pos]
+            for name in self._take(self._players[bucket], count - len(found)):
+                found.append({'username': name, 'best_score': bucket})
+            pos += step
+        return found
+
+    @staticmethod
+    def _take(players, count):
+        taken = []
+        for name in players:
+            if len(taken) >= count:
+                break
+            taken.append(name)
+        return taken
+
+    def _add(self, username, score):
+        if score >= self._tree.size:
+            self._grow(score)
+        self.best[username] = score
+        players = self._players.get(score)
+        if players is None:
+            players = self._players[score] = set()
+            bisect.insort(self._scores, score)
+        players.add(username)
+        self._tree.add(score, 1)
+
+    def _remove(self, username, score):
+        players = self._players[score]
+        players.discard(username)
+        if not players:
+            del self._players[score]
+            self._scores.pop(bisect.bisect_left(self._scores, score))
+        self._tree.add(score, -1)
+
+    def _grow(self, score):
+        size = self._tree.size
+        while size <= score:
+            size *= 2
+        self._tree = FenwickTree(size)
+        for bucket, players in self._players.items():
+            self._tree.add(bucket, len(players))
+
+class RankIndex:
+    """Best-score rankings for the overall board and each difficulty"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._boards = {OVERALL: ScoreRanking()}
+
+    def load(self, conn):
+        """Rebuild every ranking from each player's best scores"""
+        boards = {OVERALL: ScoreRanking()}
+        for username, difficulty, score in best_scores(conn.cursor()):
+            boards[OVERALL].record(username, score)
+            if difficulty:
+                boards.setdefault(difficulty, ScoreRanking()).record(username, score)
+
+        with self._lock:
+            self._boards = boards
+
+    def record(self, entry):
+        """Update rankings with a freshly completed quiz"""
+        with self._lock:
+            self._boards[OVERALL].record(entry['username'], entry['score'])
+            if entry.get('difficulty'):
+                board = self._boards.setdefault(entry['difficulty'], ScoreRanking())
+                board.record(entry['username'], entry['score'])
+
+    def lookup(self, username, neighbours=NEIGHBOURS):
+        """Overall and per-difficulty standing for a player, or None if unknown"""
+        with self._lock:
+            overall = self._boards[OVERALL].rank(username, neighbours)
+            if overall is None:
+                return None
+            difficulties = {}
+            for difficulty, board in self._boards.items():
+                if difficulty != OVERALL and username in board.best:
+                    difficulties[difficulty] = board.rank(username, neighbours)
+        return {'username': username, 'overall': overall, 'difficulties': difficulties}
+
+rank_index = RankIndex()
@@ -0,0 +1,387 @@
+"""Hot-path data access for the quiz app.
+
+Request-time SQL lives here as module-level constants. sqlite3 keeps a
+per-connection cache of compiled statements keyed by SQL text, so reusing the
+same strings means each statement is prepared once per pooled connection.
+Admin-side work that is not latency sensitive goes through the SQLAlchemy
+models in database.py; both read and write the same `advanced_*` tables.
+"""
+import json
+from datetime import datetime
+
+from stats import bump_counters
+from analytics import record_completion
+from achievements import achievement_engine
+from validation import DEFAULT_CATEGORY, DEFAULT_POINTS, DEFAULT_TIME_LIMIT
+
+# ==================== QUESTIONS ====================
+
+QUESTION_COLUMNS = ('id', 'question', 'options', 'correct', 'difficulty', 'category')
+
+SELECT_ACTIVE_QUESTIONS = """
+    SELECT id, question, options, correct, difficulty, category
+    FROM advanced_questions
+    WHERE is_active = 1
+"""
+
+SELECT_QUESTION = """
+    SELECT id, question, options, correct, difficulty, category
+    FROM advanced_questions
+    WHERE id = ? AND is_active = 1
+"""
+
+INSERT_QUESTION = """
+    INSERT INTO advanced_questions
+        (question, options, correct, difficulty, category, explanation, points, time_limit,
+         is_active, created_at, updated_at)
+    VALUES (:question, :options, :correct, :difficulty, :category, :explanation, :points, :time_limit,
+            1, :now, :now)
+"""
+
+UPDATE_QUESTION = """
+    UPDATE advanced_questions
+    SET question = :question, options = :options, correct = :correct, difficulty = :difficulty,
+        category = COALESCE(:category, category), updated_at = :now
+    WHERE id = :id
+"""
+
+DELETE_QUESTION = "DELETE FROM advanced_questions WHERE id = ?"
+
+def row_to_question(row):
+    """Question record from a QUESTION_COLUMNS row, with its options decoded"""
+    question = dict(zip(QUESTION_COLUMNS, row))
+    question['options'] = json.loads(question['options'])
+    question['category'] = question['category'] or DEFAULT_CATEGORY
+    return question
+
+def load_questions(cur):
+    """Every active question as a decoded record"""
+    cur.execute(SELECT_ACTIVE_QUESTIONS)
+    return [row_to_question(row) for row in cur.fetchall()]
+
+def get_question(cur, question_id):
+    """One active question, or None"""
+    cur.execute(SELECT_QUESTION, (question_id,))
+    row = cur.fetchone()
+    return row_to_question(row) if row else None
+
+def _question_params(data, now):
+    return {
+        'question': data['question'],
+        'options': json.dumps(data['options']),
+        'correct': data['correct'],
+        'difficulty': data['difficulty'],
+        'category': data.get('category') or DEFAULT_CATEGORY,
+        'explanation': data.get('explanation'),
+        'points': data.get('points', DEFAULT_POINTS),
+        'time_limit': data.get('time_limit', DEFAULT_TIME_LIMIT),
+        'now': now
+    }
+
+def insert_question(cur, data):
+    """Insert a question from an admin payload and return its id"""
+    cur.execute(INSERT_QUESTION, _question_params(data, datetime.now().isoformat(' ')))
+    return cur.lastrowid
+
+def insert_questions(cur, records):
+    """Insert a batch of validated question records with one executemany"""
+    now = datetime.now().isoformat(' ')
+    cur.executemany(INSERT_QUESTION, [_question_params(record, now) for record in records])
+    return len(records)
+
+def update_question(cur, data):
+    """Update a question from an admin payload; returns the rows changed"""
+    cur.execute(UPDATE_QUESTION, {
+        'id': data['id'],
+        'question': data['question'],
+        'options': json.dumps(data['options']),
+        'correct': data['correct'],
+        'difficulty': data['difficulty'],
+        'category': data.get('category'),
+        'now': datetime.now().isoformat(' ')
+    })
+    return cur.rowcount
+
+def delete_question(cur, question_id):
+    """Delete a question; returns the rows removed"""
+    cur.execute(DELETE_QUESTION, (question_id,))
+    return cur.rowcount
+
+# ==================== COMPLETED QUIZZES ====================
+
+# Score entries carry the display date (`created`) and the full completion
+# timestamp used to order ties on the leaderboard
+SCORE_COLUMNS = ('id', 'username', 'score', 'total', 'created', 'completed_at', 'difficulty')
+
+SELECT_SCORES = """
+    SELECT s.id, u.username, s.score, s.total_questions, substr(s.completed_at, 1, 19),
+           s.completed_at, s.difficulty
+    FROM advanced_quiz_sessions s
+    JOIN advanced_users u ON u.id = s.user_id
+"""
+
+SELECT_TOP_SCORES = SELECT_SCORES + """
+    ORDER BY s.score DESC, s.completed_at DESC, s.id DESC
+    LIMIT ?
+"""
+
+SELECT_TOP_SCORES_BY_DIFFICULTY = SELECT_SCORES + """
+    WHERE s.difficulty = ?
+    ORDER BY s.score DESC, s.completed_at DESC, s.id DESC
+    LIMIT ?
+"""
+
+SELECT_SCORES_SINCE = SELECT_SCORES + """
+    WHERE s.id > ?
+    ORDER BY s.id
+"""
+
+SELECT_RECENT_SCORES = SELECT_SCORES + """
+    ORDER BY s.completed_at DESC
+    LIMIT ?
+"""
+
+SELECT_DIFFICULTIES = "SELECT DISTINCT difficulty FROM advanced_quiz_sessions"
+
+SELECT_BEST_SCORES = """
+    SELECT u.username, s.difficulty, MAX(s.score)
+    FROM advanced_quiz_sessions s
+    JOIN advanced_users u ON u.id = s.user_id
+    GROUP BY s.user_id, s.difficulty
+"""
+
+SELECT_MEDAL_COUNTS = """
+    SELECT
+        CASE
+            WHEN accuracy >= 90 THEN 'Gold'
+            WHEN accuracy >= 75 THEN 'Silver'
+            WHEN accuracy >= 60 THEN 'Bronze'
+            ELSE 'None'
+        END as medal,
+        COUNT(*) as count
+    FROM advanced_quiz_sessions
+    WHERE total_questions > 0
+    GROUP BY medal
+    ORDER BY
+        CASE medal
+            WHEN 'Gold' THEN 1
+            WHEN 'Silver' THEN 2
+            WHEN 'Bronze' THEN 3
+            WHEN 'None' THEN 4
+        END
+"""
+
+UPSERT_USER_STATS = """
+    INSERT INTO advanced_users
+        (username, is_active, total_quizzes, total_score, best_score, average_accuracy,
+         total_time_spent, streak_count, longest_streak, level, experience_points,
+         created_at, last_activity)
+    VALUES (:username, 1, 1, :score, :score, :accuracy, :time, :streak, :streak,
+            1 + :score / 100, :score, :now, :created)
+    ON CONFLICT(username) DO UPDATE SET
+        total_quizzes = total_quizzes + 1,
+        total_score = total_score + excluded.total_score,
+        best_score = MAX(best_score, excluded.best_score),
+        average_accuracy = (average_accuracy * total_quizzes + excluded.average_accuracy) / (total_quizzes + 1),
+        total_time_spent = total_time_spent + excluded.total_time_spent,
+        streak_count = excluded.streak_count,
+        longest_streak = MAX(longest_streak, excluded.longest_streak),
+        experience_points = experience_points + excluded.experience_points,
+        level = 1 + (experience_points + excluded.experience_points) / 100,
+        last_activity = excluded.last_activity
+    RETURNING id, total_quizzes
+"""
+
+INSERT_QUIZ_SESSION = """
+    INSERT INTO advanced_quiz_sessions
+        (user_id, session_token, difficulty, category, total_questions, score, total_possible,
+         accuracy, time_taken, streak_count, started_at, completed_at, is_completed)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+"""
+
+SELECT_SAVED_RESULT = """
+    SELECT s.id, u.username, s.score, s.total_questions, s.time_taken, s.completed_at,
+           s.difficulty, s.category, s.user_id
+    FROM advanced_quiz_sessions s
+    JOIN advanced_users u ON u.id = s.user_id
+    WHERE s.session_token = ?
+"""
+
+SELECT_AWARDED_ACHIEVEMENTS = """
+    SELECT a.id, a.name, a.description, a.icon, a.points
+    FROM advanced_user_achievements ua
+    JOIN advanced_achievements a ON a.id = ua.achievement_id
+    WHERE ua.user_id = ? AND ua.unlocked_at = ?
+    ORDER BY a.id
+"""
+
+INSERT_QUIZ_ATTEMPT = """
+    INSERT INTO advanced_quiz_attempts
+        (session_id, question_id, user_answer, is_correct, time_taken, answered_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+def _rows_to_scores(rows):
+    return [dict(zip(SCORE_COLUMNS, row)) for row in rows]
+
+def top_scores(cur, difficulty='all', limit=10):
+    """Best completed quizzes overall or for one difficulty"""
+    if difficulty == 'all':
+        cur.execute(SELECT_TOP_SCORES, (limit,))
+    else:
+        cur.execute(SELECT_TOP_SCORES_BY_DIFFICULTY, (difficulty, limit))
+    return _rows_to_scores(cur.fetchall())
+
+def scores_since(cur, last_id):
+    """Completed quizzes with an id above last_id, oldest first"""
+    cur.execute(SELECT_SCORES_SINCE, (last_id,))
+    return _rows_to_scores(cur.fetchall())
+
+def recent_scores(cur, limit=5):
+    """Most recently completed quizzes"""
+    cur.execute(SELECT_RECENT_SCORES, (limit,))
+    return _rows_to_scores(cur.fetchall())
+
+def score_difficulties(cur):
+    """Difficulties that have completed quizzes"""
+    cur.execute(SELECT_DIFFICULTIES)
+    return [row[0] for row in cur.fetchall()]
+
+def best_scores(cur):
+    """(username, difficulty, best score) for every player and difficulty"""
+    cur.execute(SELECT_BEST_SCORES)
+    return cur.fetchall()
+
+def medal_counts(cur):
+    """(medal, count) pairs from Gold down to None"""
+    cur.execute(SELECT_MEDAL_COUNTS)
+    return cur.fetchall()
+
+def saved_quiz_result(cur, session_token):
+    """The score entry save_quiz_result returned for this quiz, or None if it was never saved"""
+    cur.execute(SELECT_SAVED_RESULT, (session_token,))
+    row = cur.fetchone()
+    if row is None:
+        return None
+    quiz_session_id, username, score, total, time_taken, completed_at, difficulty, category, user_id = row
+    # Achievements awarded by the save carry its completion time
+    cur.execute(SELECT_AWARDED_ACHIEVEMENTS, (user_id, completed_at))
+    return {
+        'id': quiz_session_id,
+        'username': username,
+        'score': score,
+        'total': total,
+        'time': time_taken,
+        'created': completed_at[:19],
+        'completed_at': completed_at,
+        'difficulty': difficulty,
+        'category': category,
+        'achievements': [
+            dict(zip(('id', 'name', 'description', 'icon', 'points'), achievement))
+            for achievement in cur.fetchall()
+        ]
+    }
+
+def longest_streak(answers):
+    """Longest run of consecutive correct answers"""
+    best = current = 0
+    for answer in answers:
+        current = current + 1 if answer['is_correct'] else 0
+        best = max(best, current)
+    return best
+
+def save_quiz_result(cur, quiz, session_token, time_taken):
+    """Persist a completed quiz within the caller's transaction.
+
+    Upserts the player's aggregates in `advanced_users`, writes one
+    `advanced_quiz_sessions` row and all of the quiz's answers into
+    `advanced_quiz_attempts` with one executemany, updates the stats
+    counters and analytics rollups, and awards any newly unlocked
+    achievements. Returns the new score entry as a dict.
+
+    Idempotent on `session_token`: a retry of a save that already committed,
+    e.g. after the caller timed out waiting for it, returns that result.
+    """
+    saved = saved_quiz_result(cur, session_token)
+    if saved is not None:
+        return saved
+
+    now = datetime.now()
+    completed_at = now.isoformat(' ')
+    created = now.strftime('%Y-%m-%d %H:%M:%S')
+    total = len(quiz['answers'])
+    accuracy = (quiz['score'] / total) * 100 if total else 0.0
+    streak = longest_streak(quiz['answers'])
+
+    # Per-user aggregates in one upsert, mirroring User.update_stats
+    cur.execute(UPSERT_USER_STATS, {
+        'username': quiz['username'],
+        'score': quiz['score'],
+        'accuracy': accuracy,
+        'time': time_taken,
+        'streak': streak,
+        'now': completed_at,
+        'created': created
+    })
+    user_id, total_quizzes = cur.fetchone()
+
+    cur.execute(INSERT_QUIZ_SESSION, (
+        user_id,
+        session_token,
+        quiz['difficulty'],
+        quiz['category'],
+        total,
+        quiz['score'],
+        total,
+        accuracy,
+        time_taken,
+        streak,
+        datetime.fromisoformat(quiz['start_time']).isoformat(' '),
+        completed_at
+    ))
+    quiz_session_id = cur.lastrowid
+
+    cur.executemany(INSERT_QUIZ_ATTEMPT, [
+        (
+            quiz_session_id,
+            answer['question_id'],
+            answer['user_answer'] if isinstance(answer['user_answer'], int) else -1,
+            answer['is_correct'],
+            answer['time_taken'],
+            datetime.fromisoformat(answer['answered_at']).isoformat(' ')
+        ) for answer in quiz['answers']
+    ])
+
+    bump_counters(
+        cur,
+        players=1 if total_quizzes == 1 else 0,
+        quizzes=1,
+        answers=total,
+        accuracy_sum=accuracy if total else 0,
+        accuracy_count=1 if total else 0
+    )
+    record_completion(cur, quiz['difficulty'], quiz['category'], accuracy, time_taken, now)
+
+    # Only the quiz count is cumulative; per-quiz stats already held are
+    # skipped by the unique index
+    achievements = achievement_engine.award(
+        cur,
+        user_id,
+        {'score': quiz['score'], 'accuracy': accuracy, 'streak': streak,
+         'time': time_taken, 'total_quizzes': total_quizzes},
+        previous={'total_quizzes': total_quizzes - 1},
+        when=completed_at
+    )
+
+    return {
+        'id': quiz_session_id,
+        'username': quiz['username'],
+        'score': quiz['score'],
+        'total': total,
+        'time': time_taken,
+        'created': created,
+        'completed_at': completed_at,
+        'difficulty': quiz['difficulty'],
+        'category': quiz['category'],
+        'achievements': achievements
+    }
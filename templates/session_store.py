@@ -0,0 +1,152 @@
+import copy
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 3600  # abandoned quizzes expire after an hour of inactivity
+MAX_MEMORY_SESSIONS = 100000
+SWEEP_INTERVAL = 60  # seconds between expiry sweeps of the SQLite store
+LOCK_STRIPES = 256  # per-session locks are striped over this many mutexes
+
+def new_session_id():
+    """Opaque, unguessable quiz session id"""
+    return secrets.token_hex(16)
+
+class SessionStore:
+    """Server-side storage for in-progress quiz state, keyed by session id"""
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._session_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def lock(self, session_id):
+        """Lock serializing read-modify-write of one session within this process.
+
+        Under several workers, the SQLite store is shared but this lock is
+        not; concurrent updates of one session from two workers are last-write-wins.
+        """
+        return self._session_locks[hash(session_id) % LOCK_STRIPES]
+
+    def create(self, state):
+        """Store a new quiz state and return its session id"""
+        session_id = new_session_id()
+        self.save(session_id, state)
+        return session_id
+
+    def get(self, session_id):
+        """Return a private copy of the quiz state, or None if unknown or expired"""
+        raise NotImplementedError
+
+    def save(self, session_id, state):
+        """Store the quiz state and push its expiry forward"""
+        raise NotImplementedError
+
+    def delete(self, session_id):
+        """Forget a quiz state"""
+        raise NotImplementedError
+
+    def evict_expired(self):
+        """Drop every expired quiz state, returning how many were removed"""
+        raise NotImplementedError
+
+class MemorySessionStore(SessionStore):
+    """Process-local store kept in least-recently-used order.
+
+    Only suitable when a single worker process serves all quiz requests.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_sessions=MAX_MEMORY_SESSIONS):
+        super().__init__(ttl)
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._states = OrderedDict()  # session id -> (expires, state)
+
+    def get(self, session_id):
+        with self._lock:
+            entry = self._states.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._states[session_id]
+                return None
+            state = entry[1]
+        # Callers change the state before deciding to save it
+        return copy.deepcopy(state)
+
+    def save(self, session_id, state):
+        now = time.time()
+        state = copy.deepcopy(state)
+        with self._lock:
+            self._states[session_id] = (now + self.ttl, state)
+            self._states.move_to_end(session_id)
+            self._evict(now)
+
+    def delete(self, session_id):
+        with self._lock:
+            self._states.pop(session_id, None)
+
+    def evict_expired(self):
+        with self._lock:
+            return self._evict(time.time())
+
+    def _evict(self, now):
+        # Entries are ordered by last save, so expired ones sit at the front
+        removed = 0
+        while self._states:
+            session_id, (expires, _) = next(iter(self._states.items()))
+            if expires >= now and len(self._states) <= self.max_sessions:
+                break
+            del self._states[session_id]
+            removed += 1
+        return removed
+
+class SQLiteSessionStore(SessionStore):
+    """Store backed by the `quiz_session_state` table, shared by all workers.
+
+    Reads use the pool; writes go through the group-committing writer.
+    """
+
+    def __init__(self, pool, writer, ttl=DEFAULT_TTL):
+        super().__init__(ttl)
+        self.pool = pool
+        self.writer = writer
+        self._last_sweep = 0
+
+    def get(self, session_id):
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT state FROM quiz_session_state WHERE id = ? AND expires >= ?",
+                (session_id, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, session_id, state):
+        now = time.time()
+        self.writer.run(
+            _execute, "INSERT OR REPLACE INTO quiz_session_state (id, state, expires) VALUES (?, ?, ?)",
+            (session_id, json.dumps(state, separators=(',', ':')), now + self.ttl)
+        )
+        if now - self._last_sweep > SWEEP_INTERVAL:
+            self.evict_expired()
+
+    def delete(self, session_id):
+        self.writer.run(_execute, "DELETE FROM quiz_session_state WHERE id = ?", (session_id,))
+
+    def evict_expired(self):
+        self._last_sweep = time.time()
+        return self.writer.run(_execute, "DELETE FROM quiz_session_state WHERE expires < ?", (self._last_sweep,))
+
+def _execute(cur, sql, params):
+    """Writer operation running one statement; returns the rows it changed"""
+    cur.execute(sql, params)
+    return cur.rowcount
+
+def make_session_store(backend, pool, writer, ttl=DEFAULT_TTL):
+    """Build the quiz session store configured for this app"""
+    if backend == 'memory':
+        return MemorySessionStore(ttl)
+    if backend == 'sqlite':
+        return SQLiteSessionStore(pool, writer, ttl)
+    raise ValueError(f"Unknown quiz session backend: {backend}")
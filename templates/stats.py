@@ -0,0 +1,54 @@
+import threading
+import time
+
+STATS_TTL = 5  # seconds an assembled stats payload is reused
+
+# Rows of the stats_counters table, seeded by migration 4
+COUNTERS = ('questions', 'players', 'quizzes', 'answers', 'accuracy_sum', 'accuracy_count')
+
+def bump_counters(cur, **deltas):
+    """Add to named counters; run inside the transaction that made the change"""
+    cur.executemany(
+        "UPDATE stats_counters SET value = value + ? WHERE name = ?",
+        [(delta, name) for name, delta in deltas.items() if delta]
+    )
+
+def read_counters(cur):
+    """All counters as a dict of name -> value"""
+    cur.execute("SELECT name, value FROM stats_counters")
+    counters = dict.fromkeys(COUNTERS, 0)
+    counters.update(cur.fetchall())
+    return counters
+
+class TTLCache:
+    """Tiny thread-safe cache of computed values that expire after `ttl` seconds"""
+
+    def __init__(self, ttl=STATS_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._values = {}  # key -> (expires, version, value)
+
+    def get(self, key, compute, version=None):
+        """Return the cached value for key, computing it when missing or stale.
+
+        A cached value computed for a different `version` of the underlying
+        data counts as stale even before its TTL runs out.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._values.get(key)
+            if entry and entry[0] > now and entry[1] == version:
+                return entry[2]
+        value = compute()
+        with self._lock:
+            self._values[key] = (now + self.ttl, version, value)
+        return value
+
+    def invalidate(self, key=None):
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+stats_cache = TTLCache()
@@ -0,0 +1,54 @@
+"""Question rules shared by the ORM model validators and the raw-SQL write paths"""
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+DEFAULT_CATEGORY = 'General'
+DEFAULT_POINTS = 10
+DEFAULT_TIME_LIMIT = 30  # seconds
+
+def validate_difficulty(difficulty):
+    if difficulty not in DIFFICULTIES:
+        raise ValueError(f"Difficulty must be one of: {list(DIFFICULTIES)}")
+    return difficulty
+
+def validate_correct(correct, options=None):
+    # bool is an int subclass, but True/False is never a meaningful answer index
+    if not isinstance(correct, int) or isinstance(correct, bool) or correct < 0:
+        raise ValueError("Correct answer must be a non-negative integer")
+    if options is not None and correct >= len(options):
+        raise ValueError(f"Correct answer {correct} is out of range for {len(options)} options")
+    return correct
+
+def validate_options(options):
+    if not isinstance(options, list) or len(options) < 2:
+        raise ValueError("Options must be a list of at least two answers")
+    if not all(isinstance(option, str) and option.strip() for option in options):
+        raise ValueError("Options must be non-empty strings")
+    return options
+
+def validate_question_id(question_id):
+    """Question id from a request argument or payload; raises ValueError unless it is an integer"""
+    if isinstance(question_id, bool):
+        raise ValueError("Question id must be an integer")
+    try:
+        return int(question_id)
+    except (TypeError, ValueError):
+        raise ValueError("Question id must be an integer")
+
+def validate_question(data):
+    """Checked and normalised question record; raises ValueError on the first problem"""
+    if not isinstance(data, dict):
+        raise ValueError("Question must be an object")
+    text = data.get('question')
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("Question text is required")
+    options = validate_options(data.get('options'))
+    return {
+        'question': text.strip(),
+        'options': options,
+        'correct': validate_correct(data.get('correct'), options),
+        'difficulty': validate_difficulty(data.get('difficulty', 'medium')),
+        'category': data.get('category') or DEFAULT_CATEGORY,
+        'explanation': data.get('explanation') or None,
+        'points': int(data.get('points') or DEFAULT_POINTS),
+        'time_limit': int(data.get('time_limit') or DEFAULT_TIME_LIMIT)
+    }
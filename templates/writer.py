@@ -0,0 +1,158 @@
+"""Single writer thread that group-commits every quiz write.
+
+SQLite allows one writer at a time, so request threads that each commit on
+their own just queue on the database lock. Here they queue in memory
+instead: handlers submit an operation, a function of a cursor, and get a
+Future back. The writer thread owns one connection. It takes whatever is
+queued, waiting up to GROUP_COMMIT_WINDOW for stragglers, and runs the batch
+in a single BEGIN IMMEDIATE ... COMMIT. Each operation runs in its own
+savepoint, so a failing operation is rolled back alone. Futures resolve only
+once the batch has committed.
+
+A full queue raises WriterBusy rather than growing without bound, and run()
+raises WriteTimeout, a WriterBusy, when it gives up waiting on a commit. stop(),
+registered at exit, commits everything already queued before returning.
+"""
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+from connection import open_connection
+from eventlog import event_log
+from metrics import metrics
+
+WRITE_QUEUE_SIZE = 1000  # operations waiting for the writer
+SUBMIT_TIMEOUT = 0.5  # seconds to wait for room in a full queue
+WRITE_TIMEOUT = 10  # seconds run() waits for its operation to commit
+GROUP_COMMIT_WINDOW = 0.002  # seconds to keep collecting after the first operation
+MAX_BATCH = 256  # operations per transaction
+
+_STOP = object()
+
+class WriterBusy(RuntimeError):
+    """The write queue stayed full; the caller should back off and retry"""
+
+class WriteTimeout(WriterBusy):
+    """run() stopped waiting, but the operation may still commit; retries must be idempotent"""
+
+class Writer:
+    """Owns the write connection and commits queued operations in batches"""
+
+    def __init__(self, path=None, max_queue=WRITE_QUEUE_SIZE, window=GROUP_COMMIT_WINDOW, max_batch=MAX_BATCH):
+        self.path = path
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+
+    def start(self):
+        """Open the write connection and start the writer thread (once)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            conn = open_connection(self.path)
+            # Transactions are issued explicitly, not by the sqlite3 module
+            conn.isolation_level = None
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, args=(conn,), name="writer", daemon=True)
+            self._thread.start()
+        atexit.register(self.stop)
+
+    def submit(self, operation, *args, **kwargs):
+        """Queue operation(cur, *args, **kwargs); returns a Future of its result"""
+        if self._stopped:
+            raise RuntimeError("Writer is stopped")
+        if self._thread is None:
+            self.start()
+        future = Future()
+        try:
+            self._queue.put((future, operation, args, kwargs), timeout=SUBMIT_TIMEOUT)
+        except queue.Full:
+            raise WriterBusy("Too many pending writes, try again shortly")
+        return future
+
+    def run(self, operation, *args, **kwargs):
+        """Submit an operation and wait until it has committed; returns its result"""
+        future = self.submit(operation, *args, **kwargs)
+        try:
+            return future.result(timeout=WRITE_TIMEOUT)
+        except FutureTimeout:
+            raise WriteTimeout("The write is taking longer than expected, try again shortly")
+
+    def depth(self):
+        return self._queue.qsize()
+
+    def stop(self):
+        """Commit everything already queued, then stop the writer thread"""
+        with self._lock:
+            thread = self._thread
+            if thread is None or self._stopped:
+                return
+            self._stopped = True
+        self._queue.put(_STOP)
+        thread.join()
+        with self._lock:
+            self._thread = None
+
+    # ---- writer thread ----
+
+    def _run(self, conn):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit(conn, batch)
+        conn.close()
+
+    def _commit(self, conn, batch):
+        started = time.perf_counter()
+        running = [item for item in batch if item[0].set_running_or_notify_cancel()]
+        if not running:
+            return
+        outcomes = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for future, operation, args, kwargs in running:
+                conn.execute("SAVEPOINT operation")
+                try:
+                    outcomes.append((future, operation(conn.cursor(), *args, **kwargs), None))
+                    conn.execute("RELEASE operation")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO operation")
+                    conn.execute("RELEASE operation")
+                    outcomes.append((future, None, e))
+            conn.execute("COMMIT")
+        except Exception as e:
+            # The whole batch is lost, e.g. the database stayed locked
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            event_log.record('write_batch_failed', f"Write batch of {len(running)} operations failed: {e}",
+                             level='error', batch_size=len(running), error=f"{type(e).__name__}: {e}")
+            for future, operation, args, kwargs in running:
+                future.set_exception(e)
+            return
+        metrics.observe_write_batch(len(running), time.perf_counter() - started)
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+writer = Writer()
+metrics.gauge('quiz_write_queue_depth', 'Write operations waiting for the writer thread.', writer.depth)
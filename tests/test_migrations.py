@@ -0,0 +1,62 @@
+"""Upgrading a database created by the original app, before migrations existed"""
+import json
+import os
+import sqlite3
+import sys
+
+from sqlalchemy import create_engine
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates"))
+
+from connection import open_connection  # noqa: E402
+from database import Base  # noqa: E402
+from migrations import SCHEMA_VERSION, migrate, schema_version  # noqa: E402
+
+# The original app seeded the same questions into both tables: the legacy
+# table without any metadata, the ORM table with category and explanation
+SHARED = [
+    ("What is the capital of France?", ["Berlin", "Madrid", "Paris", "Rome"], 2, "easy", "Geography", "Since 987 AD.", 10),
+    ("What is the largest planet in our solar system?", ["Earth", "Mars", "Jupiter", "Saturn"], 2, "medium", "Science", None, 20),
+]
+ORM_ONLY = ("Who painted the Mona Lisa?", ["Van Gogh", "Da Vinci", "Picasso", "Rembrandt"], 1, "easy", "Art", None, 10)
+LEGACY_ONLY = ("What is 2 + 2?", ["3", "4"], 1, "easy")
+
+def baseline_database(path):
+    """Tables and rows as the original app's init_db and sample seeds left them"""
+    Base.metadata.create_all(bind=create_engine(f"sqlite:///{path}"))
+    db = sqlite3.connect(path)
+    db.execute("CREATE TABLE questions(id INTEGER PRIMARY KEY AUTOINCREMENT, question TEXT, options TEXT, correct INTEGER, difficulty TEXT)")
+    db.execute("CREATE TABLE scores(id INTEGER PRIMARY KEY AUTOINCREMENT, username TEXT, score INTEGER, total INTEGER, time INTEGER, created TEXT)")
+    for question, options, correct, difficulty, category, explanation, points in SHARED + [ORM_ONLY]:
+        db.execute(
+            "INSERT INTO advanced_questions (question, options, correct, difficulty, category, explanation, points, "
+            "time_limit, is_active, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, 30, 1, '2024-01-01', '2024-01-01')",
+            (question, json.dumps(options), correct, difficulty, category, explanation, points)
+        )
+    for question, options, correct, difficulty, *_ in SHARED + [LEGACY_ONLY]:
+        db.execute("INSERT INTO questions (question, options, correct, difficulty) VALUES (?, ?, ?, ?)",
+                   (question, json.dumps(options), correct, difficulty))
+    db.commit()
+    db.close()
+
+def test_duplicate_questions_keep_legacy_id_and_orm_metadata(tmp_path):
+    path = str(tmp_path / "quiz.db")
+    baseline_database(path)
+    conn = open_connection(path)
+    try:
+        migrate(conn)
+        assert schema_version(conn) == SCHEMA_VERSION
+        rows = conn.execute(
+            "SELECT id, question, category, explanation, points FROM advanced_questions ORDER BY id"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    by_question = {row[1]: row for row in rows}
+    assert len(rows) == len(by_question) == 4
+
+    for legacy_id, (question, _, _, _, category, explanation, points) in enumerate(SHARED, 1):
+        assert by_question[question] == (legacy_id, question, category, explanation, points)
+    assert by_question[LEGACY_ONLY[0]][:3] == (3, LEGACY_ONLY[0], "General")
+    assert by_question[ORM_ONLY[0]][2] == "Art"
+    assert by_question[ORM_ONLY[0]][0] > 3